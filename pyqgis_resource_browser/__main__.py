@@ -0,0 +1,111 @@
+#! python3  # noqa: E265
+
+"""
+Command line entry point, to use the plugin features without the QGIS GUI.
+
+Usage from the folder containing the plugin:
+
+.. code-block:: bash
+
+    python -m pyqgis_resource_browser export icons.jsonl --suffix svg --metadata
+    python -m pyqgis_resource_browser export icons.sqlite --prefix :/images/
+    python -m pyqgis_resource_browser export - --format csv
+"""
+
+# standard library
+import argparse
+import os
+import sys
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pyqgis_resource_browser",
+        description="Browse the resources embedded in QGIS without its GUI.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser(
+        "export",
+        help="export a catalog of the resources as JSON Lines, CSV or SQLite",
+    )
+    export.add_argument(
+        "output", help="output file, or - for the standard output (JSON Lines, CSV)"
+    )
+    export.add_argument(
+        "--format",
+        choices=["jsonl", "csv", "sqlite"],
+        help="catalog format, guessed from the output file suffix by default",
+    )
+    export.add_argument("--path", default=":", help="root of the scanned resource tree")
+    export.add_argument(
+        "--prefix",
+        action="append",
+        default=[],
+        help="export resources starting with this prefix only (repeatable)",
+    )
+    export.add_argument(
+        "--suffix",
+        action="append",
+        default=[],
+        help="export resources ending with this suffix only (repeatable)",
+    )
+    export.add_argument(
+        "--metadata",
+        action="store_true",
+        help="export the byte size, pixel dimensions and image format too",
+    )
+    export.add_argument(
+        "--digest",
+        action="store_true",
+        help="export the content digest too, which reads each resource",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+    """Runs the command line and returns its exit code."""
+    args = parse_args(argv)
+
+    # no display is needed, and no QGIS interface is available
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from qgis.core import QgsApplication
+
+    app = None
+    if QgsApplication.instance() is None:
+        app = QgsApplication([], False)
+        app.initQgis()
+
+    from pyqgis_resource_browser.core.catalog_export import exportCatalog
+
+    try:
+        n = exportCatalog(
+            args.output,
+            catalog_format=args.format,
+            path=args.path,
+            prefixes=args.prefix,
+            suffixes=args.suffix,
+            metadata=args.metadata,
+            digests=args.digest,
+        )
+    except (OSError, ValueError) as err:
+        print(f"Export failed: {err}", file=sys.stderr)
+        return 1
+    finally:
+        if app is not None:
+            app.exitQgis()
+
+    print(f"{n} resources exported", file=sys.stderr)
+    return 0
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,48 @@
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 
 from qgis.PyQt.QtCore import QDirIterator
 
 
-def scanResources(path: str = ":") -> Generator[str, None, None]:
+def acceptsResource(
+    uri: str, prefixes: Sequence[str] = (), suffixes: Sequence[str] = ()
+) -> bool:
+    """Returns True if the path starts with one of the prefixes and ends with
+    one of the suffixes. Empty prefixes or suffixes accept any path."""
+    if len(prefixes) > 0 and not uri.startswith(tuple(prefixes)):
+        return False
+    if len(suffixes) > 0 and not uri.endswith(tuple(suffixes)):
+        return False
+    return True
+
+
+def acceptsResourceDirectory(path: str, prefixes: Sequence[str] = ()) -> bool:
+    """Returns True if the directory may contain paths starting with one of the
+    prefixes, i.e. if the directory is within a prefix or a prefix is within
+    the directory."""
+    if len(prefixes) == 0:
+        return True
+    path = path.rstrip("/") + "/"
+    return any(path.startswith(p) or p.startswith(path) for p in prefixes)
+
+
+def scanResources(
+    path: str = ":", prefixes: Sequence[str] = (), suffixes: Sequence[str] = ()
+) -> Generator[str, None, None]:
     """Recursively returns Qt resource paths.
-    Can be used to scan directories for file paths as well"""
+    Can be used to scan directories for file paths as well.
+    Sub-directories that cannot contain paths starting with one of the prefixes
+    are not walked, so a filtered scan costs about the size of its result."""
+    prefixes = tuple(prefixes or ())
+    suffixes = tuple(suffixes or ())
     D = QDirIterator(path)
     while D.hasNext():
         entry = D.next()
         if D.fileInfo().isDir():
-            yield from scanResources(path=entry)
+            if acceptsResourceDirectory(entry, prefixes):
+                yield from scanResources(
+                    path=entry, prefixes=prefixes, suffixes=suffixes
+                )
         elif D.fileInfo().isFile():
-            yield D.filePath()
+            uri = D.filePath()
+            if acceptsResource(uri, prefixes, suffixes):
+                yield uri
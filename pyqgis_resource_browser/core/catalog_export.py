@@ -0,0 +1,170 @@
+import csv
+import json
+import sqlite3
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+
+from . import scanResources
+from .resource_hasher import resourceDigest
+from .resource_properties import PROPERTY_KEYS, resourceProperties
+
+# columns of an exported catalog, without metadata
+CATALOG_FIELDS = ("path", "name", "directory", "extension")
+
+# catalog formats by file suffix
+CATALOG_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".sqlite": "sqlite",
+    ".db": "sqlite",
+}
+
+
+def catalogEntries(
+    paths: Iterable[str], metadata: bool = False, digests: bool = False
+) -> Iterator[dict]:
+    """
+    Returns a catalog entry per resource path, computed one at a time.
+    :param paths: resource paths, e.g. from scanResources()
+    :param metadata: set True to read the byte size, pixel dimensions and format
+            of resources from their headers.
+    :param digests: set True to compute the content digest of resources, which
+            reads them entirely.
+    :return: iterator over dicts keyed by CATALOG_FIELDS, and PROPERTY_KEYS and
+            "digest" if requested
+    """
+    for path in paths:
+        i = path.rfind("/") + 1
+        name = path[i:]
+        j = name.rfind(".")
+        entry = {
+            "path": path,
+            "name": name,
+            "directory": path[: max(i - 1, 0)],
+            "extension": name[j + 1 :] if j >= 0 else "",
+        }
+        if metadata:
+            entry.update(resourceProperties(path))
+        if digests:
+            entry["digest"] = resourceDigest(path)
+        yield entry
+
+
+def writeJsonLines(entries: Iterable[dict], file) -> int:
+    """
+    Writes entries as JSON Lines, one object per line.
+    :param file: text file object
+    :return: number of written entries
+    """
+    n = 0
+    for entry in entries:
+        file.write(json.dumps(entry, separators=(",", ":")))
+        file.write("\n")
+        n += 1
+    return n
+
+
+def writeCsv(entries: Iterable[dict], file, fields: Sequence[str]) -> int:
+    """
+    Writes entries as CSV with a header row. Missing values are left empty.
+    :param file: text file object, opened with newline=""
+    :param fields: columns to write
+    :return: number of written entries
+    """
+    writer = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    n = 0
+    for entry in entries:
+        writer.writerow(entry)
+        n += 1
+    return n
+
+
+def writeSqlite(entries: Iterable[dict], file_path: Path, fields: Sequence[str]) -> int:
+    """
+    Writes entries into the "resources" table of an SQLite database, replacing
+    the table if it exists. Rows are inserted as entries are computed, in a
+    single transaction.
+    :param file_path: path of the database file
+    :param fields: columns to write
+    :return: number of written entries
+    """
+    types = {"size": "INTEGER", "width": "INTEGER", "height": "INTEGER"}
+    columns = ", ".join(f"{f} {types.get(f, 'TEXT')}" for f in fields)
+    counter = [0]
+
+    def rows():
+        for entry in entries:
+            counter[0] += 1
+            yield tuple(entry.get(f) for f in fields)
+
+    connection = sqlite3.connect(str(file_path))
+    try:
+        with connection:
+            connection.execute("DROP TABLE IF EXISTS resources")
+            connection.execute(
+                f"CREATE TABLE resources ({columns}, PRIMARY KEY (path))"
+            )
+            connection.executemany(
+                "INSERT INTO resources VALUES ({})".format(
+                    ", ".join("?" * len(fields))
+                ),
+                rows(),
+            )
+    finally:
+        connection.close()
+    return counter[0]
+
+
+def exportCatalog(
+    output: str,
+    catalog_format: str = None,
+    path: str = ":",
+    prefixes: Sequence[str] = (),
+    suffixes: Sequence[str] = (),
+    metadata: bool = False,
+    digests: bool = False,
+) -> int:
+    """
+    Scans resources and writes their catalog, streaming each resource from the
+    scan to the output, so memory use does not grow with the number of resources.
+    :param output: output file path, or "-" to write to the standard output
+    :param catalog_format: "jsonl", "csv" or "sqlite". Defaults to the format
+            matching the output suffix.
+    :param path: root of the scanned resource tree
+    :param prefixes: prefixes of the exported resources, see scanResources()
+    :param suffixes: suffixes of the exported resources, see scanResources()
+    :param metadata: set True to export the size, dimensions and format too
+    :param digests: set True to export content digests too
+    :return: number of exported resources
+    """
+    if catalog_format is None:
+        catalog_format = CATALOG_FORMATS.get(Path(output).suffix.lower(), "jsonl")
+    if catalog_format not in ("jsonl", "csv", "sqlite"):
+        raise ValueError(f"Unknown catalog format: {catalog_format}")
+    if catalog_format == "sqlite" and output == "-":
+        raise ValueError("SQLite catalogs cannot be written to the standard output")
+
+    fields = list(CATALOG_FIELDS)
+    if metadata:
+        fields.extend(PROPERTY_KEYS)
+    if digests:
+        fields.append("digest")
+    entries = catalogEntries(
+        scanResources(path, prefixes=prefixes, suffixes=suffixes),
+        metadata=metadata,
+        digests=digests,
+    )
+
+    if catalog_format == "sqlite":
+        return writeSqlite(entries, Path(output), fields)
+    if output == "-":
+        if catalog_format == "csv":
+            return writeCsv(entries, sys.stdout, fields)
+        return writeJsonLines(entries, sys.stdout)
+    with open(output, "w", encoding="utf-8", newline="") as f:
+        if catalog_format == "csv":
+            return writeCsv(entries, f, fields)
+        return writeJsonLines(entries, f)
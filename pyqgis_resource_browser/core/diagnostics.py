@@ -0,0 +1,170 @@
+import contextlib
+import math
+import threading
+import time
+from collections import Counter
+
+# number of histogram buckets, the last one collecting durations of 2^30 µs or more
+HISTOGRAM_BUCKETS = 32
+
+
+class DurationHistogram:
+    """
+    Aggregates durations into buckets of powers of two microseconds: bucket b
+    counts the durations d with 2^(b-1) <= d < 2^b µs, bucket 0 the durations
+    under a microsecond. Memory use does not depend on the number of durations.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, seconds: float):
+        microseconds = int(seconds * 1e6)
+        self.buckets[min(microseconds.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Returns an upper bound of a percentile of the durations, i.e. the upper
+        bound of the bucket containing it, in seconds.
+        :param q: percentile between 0 and 100
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for bucket, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return min(2**bucket * 1e-6, self.max)
+        return self.max
+
+
+class Diagnostics:
+    """
+    Records durations and counts of operations as histograms, to report where
+    time is spent. Recording is disabled by default: instrumented code checks
+    .enabled before measuring, so that disabled diagnostics cost one attribute
+    lookup. Durations can be recorded from any thread.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms: dict[str, DurationHistogram] = {}
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    def setEnabled(self, enabled: bool):
+        self.enabled = enabled
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def record(self, name: str, seconds: float):
+        """
+        Records the duration of an operation.
+        """
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = DurationHistogram()
+            histogram.add(seconds)
+
+    def count(self, name: str, n: int = 1):
+        """
+        Adds to a counter, e.g. the number of items processed by an operation.
+        """
+        with self._lock:
+            self.counters[name] += n
+
+    def timer(self, name: str):
+        """
+        Returns a context manager recording the duration of its block, or a
+        no-op one if diagnostics are disabled.
+        """
+        if not self.enabled:
+            return _NO_TIMER
+        return _Timer(self, name)
+
+    def summaries(self) -> list[str]:
+        """
+        Returns a line per operation, with its count and duration statistics.
+        """
+        lines = []
+        with self._lock:
+            for name, h in sorted(self.histograms.items()):
+                lines.append(
+                    "{}: {} calls, total {:.1f} ms, mean {:.2f} ms, p50 < {:.2f} ms, "
+                    "p90 < {:.2f} ms, max {:.2f} ms".format(
+                        name,
+                        h.count,
+                        h.total * 1e3,
+                        h.mean() * 1e3,
+                        h.percentile(50) * 1e3,
+                        h.percentile(90) * 1e3,
+                        h.max * 1e3,
+                    )
+                )
+            for name, n in sorted(self.counters.items()):
+                lines.append(f"{name}: {n}")
+        return lines
+
+    def report(self) -> str:
+        """
+        Returns the summaries and the histograms of all operations as text.
+        """
+        lines = self.summaries()
+        with self._lock:
+            for name, h in sorted(self.histograms.items()):
+                lines.append("")
+                lines.append(f"{name} durations:")
+                largest = max(h.buckets)
+                for bucket, n in enumerate(h.buckets):
+                    if n == 0:
+                        continue
+                    bar = "#" * max(1, round(40 * n / largest))
+                    lines.append(f"  < {_formatBucket(bucket):>8s} {n:8d} {bar}")
+        return "\n".join(lines)
+
+
+def _formatBucket(bucket: int) -> str:
+    # upper bound of a histogram bucket
+    microseconds = 2**bucket
+    if microseconds < 1000:
+        return f"{microseconds} µs"
+    if microseconds < 1000000:
+        return f"{microseconds / 1e3:.1f} ms"
+    return f"{microseconds / 1e6:.1f} s"
+
+
+class _Timer:
+    __slots__ = ("diagnostics", "name", "start")
+
+    def __init__(self, diagnostics: Diagnostics, name: str):
+        self.diagnostics = diagnostics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.diagnostics.record(self.name, time.perf_counter() - self.start)
+
+
+_NO_TIMER = contextlib.nullcontext()
+
+# diagnostics of the plugin, enabled in debug mode
+DIAGNOSTICS = Diagnostics()
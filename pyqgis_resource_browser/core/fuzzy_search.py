@@ -0,0 +1,123 @@
+import heapq
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+
+# characters after which a match starts a new word
+_WORD_SEPARATORS = frozenset("/_-. ")
+
+_MATCH_SCORE = 1
+_CONSECUTIVE_BONUS = 5
+_WORD_START_BONUS = 8
+
+
+def _alignmentScore(query: str, name: str, start: int) -> int:
+    # score of the leftmost alignment of query in name, starting at start
+    score = 0
+    previous = start - 2
+    position = start
+    for c in query:
+        position = name.find(c, position)
+        if position < 0:
+            return None
+        score += _MATCH_SCORE
+        if position == previous + 1:
+            score += _CONSECUTIVE_BONUS
+        if position == 0 or name[position - 1] in _WORD_SEPARATORS:
+            score += _WORD_START_BONUS
+        previous = position
+        position += 1
+    # prefer matches close to the start and covering most of the name
+    return score - min(start, 3) - (len(name) - len(query)) // 4
+
+
+def fuzzyScore(query: str, name: str) -> int:
+    """
+    Returns the score of the best match of query as a subsequence of name.
+    Matched characters get a bonus when they follow the previous match or start a
+    word, and unmatched characters cost a small penalty. Higher is better.
+    :param query: lowercase query
+    :param name: lowercase name
+    :return: the score, or None if query is not a subsequence of name
+    """
+    if query == "":
+        return 0
+    best = None
+    start = name.find(query[0])
+    while start >= 0:
+        score = _alignmentScore(query, name, start)
+        if score is None:
+            # no later start can match either
+            break
+        if best is None or score > best:
+            best = score
+        start = name.find(query[0], start + 1)
+    return best
+
+
+class FuzzyIndex:
+    """
+    A column of lowercase resource basenames to rank fuzzy search results.
+    Names are kept in a single newline-separated string, so that rows containing
+    the query as a subsequence are found by one regular expression scan, and only
+    these rows are scored.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._blob = ""
+        # start of each name in the blob, followed by the end of the blob
+        self._offsets = array("I", [0])
+        self.extend(names)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def name(self, row: int) -> str:
+        """
+        Returns the lowercase name of a row.
+        """
+        return self._blob[self._offsets[row] : self._offsets[row + 1] - 1]
+
+    def extend(self, names: Iterable[str]):
+        """
+        Appends names as rows following the already indexed ones.
+        """
+        names = [name.lower().replace("\n", " ") + "\n" for name in names]
+        offset = self._offsets[-1]
+        for name in names:
+            offset += len(name)
+            self._offsets.append(offset)
+        self._blob = "".join([self._blob, *names])
+
+    def search(
+        self, query: str, limit: int = 100, accept: Callable[[int], bool] = None
+    ) -> list[tuple[int, int]]:
+        """
+        Returns the rows whose name contains the query as a subsequence, ignoring
+        case, ordered by decreasing score. Only the best rows are kept in a heap,
+        so the cost of large result sets stays bounded by the limit.
+        :param query: search text
+        :param limit: maximum number of rows returned
+        :param accept: optional function returning False for rows to skip
+        :return: list of (row, score) tuples
+        """
+        query = query.lower()
+        if query == "" or limit <= 0:
+            return []
+        pattern = re.compile("[^\n]*?".join(re.escape(c) for c in query))
+        offsets = self._offsets
+
+        def scoredRows():
+            last_row = -1
+            for match in pattern.finditer(self._blob):
+                row = bisect_right(offsets, match.start()) - 1
+                if row == last_row:
+                    continue
+                last_row = row
+                if accept is not None and not accept(row):
+                    continue
+                yield fuzzyScore(query, self.name(row)), -row
+
+        best = heapq.nlargest(limit, scoredRows())
+        return [(-negative_row, score) for score, negative_row in best]
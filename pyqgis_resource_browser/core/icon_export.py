@@ -0,0 +1,343 @@
+import json
+import math
+from collections.abc import Sequence
+from pathlib import Path, PurePosixPath
+
+from qgis.PyQt.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, pyqtSignal
+from qgis.PyQt.QtGui import QImage, QPainter
+from qgis.PyQt.QtSvg import QSvgRenderer
+
+# default icon sizes of an export, in pixels
+EXPORT_SIZES = (16, 24, 32, 64)
+
+# name of the JSON file mapping resources to their place in the sprite sheets
+SPRITE_MAP_NAME = "sprites.json"
+
+
+def iconFileNames(uris: Sequence[str]) -> list[str]:
+    """
+    Returns the relative paths of the PNG files exported for resources: their
+    resource path with a .png extension. Resources that would share a file keep
+    their original extension before it, e.g. "a.svg.png" next to "a.png".
+    """
+    names = []
+    used = set()
+    for uri in uris:
+        path = PurePosixPath(uri.lstrip(":/"))
+        name = str(path.with_suffix(".png"))
+        if name in used:
+            name = f"{path}.png"
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def rasterizeIcon(uri: str, sizes: Sequence[int]) -> list[QImage]:
+    """
+    Renders an image resource at several sizes, each fitting into a square and
+    keeping its aspect ratio. SVGs are parsed once and rendered at each size,
+    raster images are decoded once and scaled. Can be called outside the GUI
+    thread.
+    :param uri: resource path
+    :param sizes: sizes of the squares, in pixels
+    :return: an image per size, or an empty list if the resource is not an image.
+    """
+    if uri.lower().endswith(".svg"):
+        renderer = QSvgRenderer(uri)
+        if not renderer.isValid():
+            return []
+        default_size = renderer.defaultSize()
+        if default_size.isEmpty():
+            default_size = QSize(1, 1)
+        images = []
+        for size in sizes:
+            image_size = default_size.scaled(
+                size, size, Qt.AspectRatioMode.KeepAspectRatio
+            ).expandedTo(QSize(1, 1))
+            image = QImage(image_size, QImage.Format.Format_ARGB32_Premultiplied)
+            image.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(image)
+            renderer.render(painter)
+            painter.end()
+            images.append(image)
+        return images
+
+    source = QImage(uri)
+    if source.isNull():
+        return []
+    return [
+        source.scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        for size in sizes
+    ]
+
+
+class _IconExportJobSignals(QObject):
+    # job, exported icons and error messages
+    exported = pyqtSignal(object, dict, list)
+
+
+class IconExportJob(QRunnable):
+    """
+    Exports a chunk of resources outside the GUI thread: rasterizes them at each
+    size, writes their PNG files and packs them into one sprite sheet per size.
+    Cells of the sheets are squares of the icon size, filled row by row.
+    Icons whose files cannot be written are left out of the sheets, and sheets
+    that cannot be written are left out of the exported icons. The job always
+    reports back, with the errors it met.
+    """
+
+    def __init__(
+        self,
+        sheet: int,
+        uris: list[str],
+        file_names: list[str],
+        output_dir: Path,
+        sizes: Sequence[int],
+        columns: int,
+        write_icons: bool,
+        signals: _IconExportJobSignals,
+    ):
+        super().__init__()
+        # the job is owned by the IconExporter, so it can be taken back from the
+        # thread pool while it is waiting
+        self.setAutoDelete(False)
+        self.sheet = sheet
+        self.uris = uris
+        self.file_names = file_names
+        self.output_dir = output_dir
+        self.sizes = sizes
+        self.columns = columns
+        self.write_icons = write_icons
+        self.signals = signals
+
+    def spriteName(self, size: int) -> str:
+        """
+        Returns the path of the sprite sheet of an icon size, relative to the
+        output directory.
+        """
+        return f"sprites/sprite-{size}-{self.sheet:04d}.png"
+
+    def run(self):
+        icons = {}
+        errors = []
+        try:
+            self._export(icons, errors)
+        except Exception as err:
+            # the exported icons may refer to sheets that were not written
+            icons.clear()
+            errors.append(f"Unable to export sprite sheet {self.sheet}: {err}")
+        finally:
+            self.signals.exported.emit(self, icons, errors)
+
+    def _export(self, icons: dict, errors: list[str]):
+        rows = math.ceil(len(self.uris) / self.columns)
+        sheets = {}
+        painters = {}
+        for size in self.sizes:
+            sheet = QImage(
+                self.columns * size, rows * size, QImage.Format.Format_ARGB32
+            )
+            sheet.fill(Qt.GlobalColor.transparent)
+            sheets[size] = sheet
+            painters[size] = QPainter(sheet)
+
+        cell = 0
+        try:
+            for uri, name in zip(self.uris, self.file_names):
+                images = rasterizeIcon(uri, self.sizes)
+                if len(images) == 0:
+                    continue
+                icon = {}
+                if self.write_icons:
+                    icon["file"] = name
+                    failed = False
+                    for size, image in zip(self.sizes, images):
+                        file_path = self.output_dir / str(size) / name
+                        file_path.parent.mkdir(parents=True, exist_ok=True)
+                        if not image.save(str(file_path), "PNG"):
+                            errors.append(f"Unable to write {file_path}")
+                            failed = True
+                    if failed:
+                        continue
+                row, column = divmod(cell, self.columns)
+                for size, image in zip(self.sizes, images):
+                    # center icons that are not square in their cell
+                    x = column * size + (size - image.width()) // 2
+                    y = row * size + (size - image.height()) // 2
+                    painters[size].drawImage(x, y, image)
+                    icon[str(size)] = [
+                        self.spriteName(size), x, y, image.width(), image.height()
+                    ]
+                icons[uri] = icon
+                cell += 1
+        finally:
+            for painter in painters.values():
+                painter.end()
+
+        if cell == 0:
+            return
+        for size in self.sizes:
+            # crop the cells left empty by resources that are not images
+            sheet = sheets[size].copy(
+                0,
+                0,
+                min(cell, self.columns) * size,
+                math.ceil(cell / self.columns) * size,
+            )
+            file_path = self.output_dir / self.spriteName(size)
+            if not sheet.save(str(file_path), "PNG"):
+                errors.append(f"Unable to write {file_path}")
+                for icon in icons.values():
+                    del icon[str(size)]
+        # icons without any file written are not exported
+        for uri in [uri for uri, icon in icons.items() if len(icon) == 0]:
+            del icons[uri]
+
+
+class IconExporter(QObject):
+    """
+    Exports image resources as PNG files at several sizes and packs them into
+    sprite sheets, with a JSON map of the place of each icon in the sheets.
+    Resources are exported in chunks of one sprite sheet on a thread pool using
+    all processors. Each chunk is written as soon as it is rasterized, so memory
+    use is bounded by the number of threads times the size of a sheet, whatever
+    the number of resources. Files that cannot be written are left out of the
+    sprite map and reported by .errors().
+    """
+
+    progressChanged = pyqtSignal(int, int)
+    finished = pyqtSignal(bool)
+
+    def __init__(
+        self,
+        output_dir: str,
+        *args,
+        sizes: Sequence[int] = EXPORT_SIZES,
+        icons_per_sheet: int = 256,
+        write_icons: bool = True,
+        **kwds,
+    ):
+        """
+        :param output_dir: directory to write the files into
+        :param sizes: icon sizes, in pixels
+        :param icons_per_sheet: maximum number of icons per sprite sheet
+        :param write_icons: set False to write the sprite sheets only, without a
+                PNG file per icon and size.
+        """
+        super().__init__(*args, **kwds)
+        self.outputDir = Path(output_dir)
+        self.sizes = tuple(sizes)
+        self.iconsPerSheet = icons_per_sheet
+        self.columns = math.ceil(math.sqrt(icons_per_sheet))
+        self.writeIcons = write_icons
+        self.pool = QThreadPool(self)
+        self._signals = _IconExportJobSignals(self)
+        self._signals.exported.connect(self._onExported)
+        self._pending: dict[int, IconExportJob] = {}
+        # exported icons by sheet, to write the sprite map in resource order
+        self._sheets: dict[int, dict] = {}
+        self._errors: list[str] = []
+        self._done = 0
+        self._total = 0
+        self._cancelled = False
+
+    def start(self, uris: Sequence[str]):
+        """
+        Starts exporting resources. Resources that are not images are skipped.
+        :param uris: resource paths, in the order of the sprite sheets
+        :raises OSError: if the output directory cannot be created
+        """
+        self.cancel(wait=True)
+        (self.outputDir / "sprites").mkdir(parents=True, exist_ok=True)
+        uris = list(uris)
+        names = iconFileNames(uris)
+        self._sheets = {}
+        self._errors = []
+        self._done = 0
+        self._total = len(uris)
+        self._cancelled = False
+        self.progressChanged.emit(0, self._total)
+
+        for sheet, start in enumerate(range(0, len(uris), self.iconsPerSheet)):
+            end = start + self.iconsPerSheet
+            job = IconExportJob(
+                sheet,
+                uris[start:end],
+                names[start:end],
+                self.outputDir,
+                self.sizes,
+                self.columns,
+                self.writeIcons,
+                self._signals,
+            )
+            self._pending[sheet] = job
+            self.pool.start(job)
+        if len(self._pending) == 0:
+            self._finish()
+
+    def isRunning(self) -> bool:
+        """
+        Returns True while chunks are waiting or being exported.
+        """
+        return len(self._pending) > 0
+
+    def exportedCount(self) -> int:
+        """
+        Returns the number of icons exported so far.
+        """
+        return sum(len(icons) for icons in self._sheets.values())
+
+    def errors(self) -> list[str]:
+        """
+        Returns the messages of the errors met so far, e.g. files that could not
+        be written.
+        """
+        return list(self._errors)
+
+    def cancel(self, wait: bool = False):
+        """
+        Cancels the waiting chunks. Chunks being exported are completed, and the
+        sprite map is written for the exported ones.
+        :param wait: set True to wait for the running chunks to finish. Their
+                files are written, but they are left out of the sprite map.
+        """
+        if not self.isRunning():
+            return
+        self._cancelled = True
+        for sheet, job in list(self._pending.items()):
+            if self.pool.tryTake(job):
+                del self._pending[sheet]
+        if wait:
+            self.pool.waitForDone()
+            self._pending.clear()
+        if len(self._pending) == 0:
+            self._finish()
+
+    def _onExported(self, job: IconExportJob, icons: dict, errors: list[str]):
+        if self._pending.get(job.sheet) is not job:
+            return
+        del self._pending[job.sheet]
+        self._sheets[job.sheet] = icons
+        self._errors.extend(errors)
+        self._done += len(job.uris)
+        self.progressChanged.emit(self._done, self._total)
+        if len(self._pending) == 0:
+            self._finish()
+
+    def _finish(self):
+        icons = {}
+        for sheet in sorted(self._sheets):
+            icons.update(self._sheets[sheet])
+        sprite_map = {"sizes": list(self.sizes), "icons": icons}
+        file_path = self.outputDir / SPRITE_MAP_NAME
+        try:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(sprite_map, f, indent=1)
+        except OSError as err:
+            self._errors.append(f"Unable to write {file_path}: {err}")
+        self.finished.emit(not self._cancelled)
@@ -0,0 +1,96 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class LRUCache:
+    """
+    A least-recently-used cache bounded by the total cost of its values.
+    When inserting a value exceeds the maximum cost, the least recently used
+    values are evicted. Hits, misses and evictions are counted to help tuning
+    the maximum cost.
+    """
+
+    def __init__(self, max_cost: int, cost: Callable[[Any], int] = None):
+        """
+        :param max_cost: maximum total cost of the cached values
+        :param cost: function returning the cost of a value, defaults to 1 per value
+        """
+        self._items: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._cost = cost
+        self.maxCost = max_cost
+        self.totalCost = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the value cached for key and marks it as most recently used.
+        """
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def insert(self, key: Hashable, value: Any):
+        """
+        Caches a value. A value costing more than the maximum cost is not cached.
+        """
+        cost = self._cost(value) if self._cost else 1
+        self.remove(key)
+        if cost > self.maxCost:
+            return
+        self._items[key] = (value, cost)
+        self.totalCost += cost
+        self._evict()
+
+    def remove(self, key: Hashable):
+        """
+        Removes the value cached for key, if any.
+        """
+        item = self._items.pop(key, None)
+        if item is not None:
+            self.totalCost -= item[1]
+
+    def clear(self):
+        """
+        Removes all values. Counters are kept.
+        """
+        self._items.clear()
+        self.totalCost = 0
+
+    def setMaxCost(self, max_cost: int):
+        """
+        Changes the maximum total cost, evicting values if needed.
+        """
+        self.maxCost = max_cost
+        self._evict()
+
+    def _evict(self):
+        while self.totalCost > self.maxCost and len(self._items) > 0:
+            _, (_, cost) = self._items.popitem(last=False)
+            self.totalCost -= cost
+            self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the cache counters.
+        """
+        return {
+            "entries": len(self._items),
+            "cost": self.totalCost,
+            "max_cost": self.maxCost,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
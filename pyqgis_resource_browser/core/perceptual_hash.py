@@ -0,0 +1,105 @@
+from collections.abc import Hashable
+
+from qgis.PyQt.QtCore import QSize, Qt
+from qgis.PyQt.QtGui import QImage, QImageReader, QPainter, qGray
+
+# a dHash compares 8 horizontally adjacent pixel pairs in 8 rows
+DHASH_SIZE = QSize(9, 8)
+
+
+def hammingDistance(a: int, b: int) -> int:
+    """
+    Returns the number of differing bits of two hashes.
+    """
+    return bin(a ^ b).count("1")
+
+
+def imageDHash(uri: str) -> int:
+    """
+    Returns the difference hash (dHash) of an image resource: the image is
+    rasterized to 9x8 grayscale pixels over a white background, and each bit of
+    the 64-bit hash tells whether a pixel is brighter than its right neighbor.
+    Similar looking images have hashes with a small Hamming distance.
+    Can be called outside the GUI thread.
+    :return: the hash, or None if the resource is not an image.
+    """
+    reader = QImageReader(uri)
+    if not reader.canRead():
+        return None
+    # only the 9x8 pixels are rasterized, also for SVGs
+    reader.setScaledSize(DHASH_SIZE)
+    image = reader.read()
+    if image.isNull():
+        return None
+
+    canvas = QImage(DHASH_SIZE, QImage.Format.Format_RGB32)
+    canvas.fill(Qt.GlobalColor.white)
+    painter = QPainter(canvas)
+    painter.drawImage(0, 0, image)
+    painter.end()
+
+    h = 0
+    for y in range(DHASH_SIZE.height()):
+        previous = qGray(canvas.pixel(0, y))
+        for x in range(1, DHASH_SIZE.width()):
+            gray = qGray(canvas.pixel(x, y))
+            h = (h << 1) | (previous > gray)
+            previous = gray
+    return h
+
+
+class BKTree:
+    """
+    A Burkhard-Keller tree of hashes, to find the hashes within a Hamming
+    distance of a query without comparing it to all of them. Each child edge is
+    labelled by the distance to its parent, so by the triangle inequality only
+    the edges within the search radius around the query distance are followed.
+    """
+
+    def __init__(self):
+        # a node is [hash, items, {distance: child node}]
+        self._root: list = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, h: int, item: Hashable):
+        """
+        Adds an item with its hash.
+        """
+        self._size += 1
+        if self._root is None:
+            self._root = [h, [item], {}]
+            return
+        node = self._root
+        while True:
+            d = hammingDistance(h, node[0])
+            if d == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [h, [item], {}]
+                return
+            node = child
+
+    def search(self, h: int, max_distance: int) -> list[tuple[int, Hashable]]:
+        """
+        Returns the items whose hash is within max_distance of h.
+        :return: list of (distance, item) tuples, ordered by distance
+        """
+        results = []
+        if self._root is None:
+            return results
+        stack = [self._root]
+        while len(stack) > 0:
+            node_hash, items, children = stack.pop()
+            d = hammingDistance(h, node_hash)
+            if d <= max_distance:
+                results.extend((d, item) for item in items)
+            for edge, child in children.items():
+                if d - max_distance <= edge <= d + max_distance:
+                    stack.append(child)
+        results.sort(key=lambda result: result[0])
+        return results
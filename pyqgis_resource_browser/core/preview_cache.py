@@ -0,0 +1,125 @@
+from typing import Any
+
+from qgis.PyQt.QtCore import QFileInfo
+from qgis.PyQt.QtGui import QPixmap
+from qgis.PyQt.QtSvg import QSvgRenderer
+
+from .diagnostics import DIAGNOSTICS
+from .lru_cache import LRUCache
+from .text_loader import TextReader
+from .thumbnail_cache import pixmapCost
+
+# parsed SVG documents use a few times the memory of their source
+SVG_COST_FACTOR = 4
+
+
+def createSvgRenderer(uri: str) -> QSvgRenderer:
+    """
+    Returns a new renderer of an SVG resource, with its estimated memory use as
+    "cost" property. Can be called outside the GUI thread.
+    """
+    with DIAGNOSTICS.timer("preview_decode"):
+        renderer = QSvgRenderer(uri)
+    renderer.setProperty("cost", QFileInfo(uri).size() * SVG_COST_FACTOR)
+    return renderer
+
+
+def previewCost(value: Any) -> int:
+    """
+    Returns the memory used by a cached preview, in bytes. The cost of a
+    QSvgRenderer is estimated from the size of its source when it is created,
+    the cost of a text head from its length.
+    """
+    if isinstance(value, QPixmap):
+        return pixmapCost(value)
+    if isinstance(value, tuple):
+        text, reader = value
+        return max(64, 2 * len(text))
+    return max(64, value.property("cost") or 0)
+
+
+class PreviewCache(LRUCache):
+    """
+    A size-bounded LRU cache of the parsed SVG renderers and decoded pixmaps
+    shown in the preview, keyed by resource path, so that flipping between a few
+    resources does not parse them again. Renderers can be shared by several
+    QGraphicsSvgItems with setSharedRenderer(). They are not owned by the items,
+    so views need to keep a reference on the renderer they show, in case it is
+    evicted meanwhile.
+    The first chunk of text resources can be cached too, with the TextReader to
+    continue reading them.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        :param max_bytes: memory budget of the cached previews, in bytes
+        """
+        super().__init__(max_cost=max_bytes, cost=previewCost)
+
+    def svgRenderer(self, uri: str) -> QSvgRenderer:
+        """
+        Returns the renderer of an SVG resource, parsing and caching it if needed.
+        :return: the renderer, or None if the resource is not a valid SVG.
+        """
+        key = ("svg", uri)
+        renderer = self.get(key)
+        if renderer is None:
+            renderer = createSvgRenderer(uri)
+            self.insert(key, renderer)
+        return renderer if renderer.isValid() else None
+
+    def insertSvgRenderer(self, uri: str, renderer: QSvgRenderer):
+        """
+        Caches the renderer of an SVG resource, e.g. created in advance.
+        """
+        self.insert(("svg", uri), renderer)
+
+    def pixmap(self, uri: str) -> QPixmap:
+        """
+        Returns the pixmap of an image resource, decoding and caching it if needed.
+        :return: the pixmap, or a null QPixmap if the resource is not an image.
+        """
+        key = ("pixmap", uri)
+        pixmap = self.get(key)
+        if pixmap is None:
+            with DIAGNOSTICS.timer("preview_decode"):
+                pixmap = QPixmap(uri)
+            self.insert(key, pixmap)
+        return pixmap
+
+    def insertPixmap(self, uri: str, pixmap: QPixmap):
+        """
+        Caches the pixmap of an image resource, e.g. decoded in advance.
+        """
+        self.insert(("pixmap", uri), pixmap)
+
+    def textHead(self, uri: str) -> tuple[str, TextReader]:
+        """
+        Returns the cached first chunk of a text resource.
+        :return: the text and a reader continuing after it, or None if not cached.
+        """
+        head = self.get(("text", uri))
+        if head is None:
+            return None
+        text, reader = head
+        # the cached reader stays at the end of the head
+        return text, reader.copy()
+
+    def insertTextHead(self, uri: str, text: str, reader: TextReader):
+        """
+        Caches the first chunk of a text resource.
+        :param text: text read so far
+        :param reader: reader positioned after text
+        """
+        self.insert(("text", uri), (text, reader.copy()))
+
+    def hasPreview(self, uri: str, text: bool = False) -> bool:
+        """
+        Returns True if the image preview of a resource is cached, and its text
+        head too if text is True. Does not count as a cache hit.
+        """
+        if uri.endswith(".svg"):
+            cached = ("svg", uri) in self
+        else:
+            cached = ("pixmap", uri) in self
+        return cached and (not text or ("text", uri) in self)
@@ -0,0 +1,120 @@
+from qgis.PyQt.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+from qgis.PyQt.QtGui import QImage, QPixmap
+
+from .diagnostics import DIAGNOSTICS
+from .preview_cache import PreviewCache, createSvgRenderer
+from .text_loader import TextReader, isTextResource
+
+
+class _PrefetchJobSignals(QObject):
+    prefetched = pyqtSignal(str, object, object)
+
+
+class PrefetchJob(QRunnable):
+    """
+    Prepares the preview of a resource outside the GUI thread: an SVG renderer
+    or a decoded image, and the first chunk of its text.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        text_head_size: int,
+        target_thread: QThread,
+        signals: _PrefetchJobSignals,
+    ):
+        super().__init__()
+        # the job is owned by the PreviewPrefetcher, so it can be taken back from
+        # the thread pool while it is waiting
+        self.setAutoDelete(False)
+        self.uri = uri
+        self.text_head_size = text_head_size
+        self.target_thread = target_thread
+        self.signals = signals
+
+    def run(self):
+        if self.uri.endswith(".svg"):
+            image = createSvgRenderer(self.uri)
+            # the renderer is used by the GUI thread from now on
+            image.moveToThread(self.target_thread)
+        else:
+            # pixmaps can only be created in the GUI thread
+            with DIAGNOSTICS.timer("preview_decode"):
+                image = QImage(self.uri)
+
+        text_head = None
+        if isTextResource(self.uri):
+            reader = TextReader(self.uri)
+            text = "".join(reader.read(self.text_head_size, self.text_head_size))
+            text_head = (text, reader)
+        self.signals.prefetched.emit(self.uri, image, text_head)
+
+
+class PreviewPrefetcher(QObject):
+    """
+    Prepares previews of resources likely to be shown next on a thread pool and
+    stores them into a PreviewCache. Prefetches of resources that are not
+    requested anymore are cancelled while they wait.
+    """
+
+    def __init__(
+        self, cache: PreviewCache, *args, text_head_size: int = 64 * 1024, **kwds
+    ):
+        """
+        :param cache: cache to store the prefetched previews into
+        :param text_head_size: number of bytes of text resources prefetched
+        """
+        super().__init__(*args, **kwds)
+        self.cache = cache
+        self.textHeadSize = text_head_size
+        self.pool = QThreadPool(self)
+        # leave processors to thumbnail rendering and hashing
+        self.pool.setMaxThreadCount(2)
+        self._signals = _PrefetchJobSignals(self)
+        self._signals.prefetched.connect(self._onPrefetched)
+        self._pending: dict[str, PrefetchJob] = {}
+
+    def prefetch(self, uris: list[str]):
+        """
+        Prefetches the previews of resources that are not cached yet, the first
+        ones first. Waiting prefetches of other resources are cancelled.
+        :param uris: resource paths, most likely shown next first
+        """
+        keep = set(uris)
+        for uri, job in list(self._pending.items()):
+            if uri not in keep and self.pool.tryTake(job):
+                del self._pending[uri]
+
+        for priority, uri in enumerate(reversed(uris)):
+            if uri in self._pending:
+                continue
+            if self.cache.hasPreview(uri, text=isTextResource(uri)):
+                continue
+            job = PrefetchJob(uri, self.textHeadSize, self.thread(), self._signals)
+            self._pending[uri] = job
+            self.pool.start(job, priority)
+
+    def isPending(self, uri: str) -> bool:
+        """
+        Returns True if the preview of a resource is waiting or being prefetched.
+        """
+        return uri in self._pending
+
+    def stop(self):
+        """
+        Cancels all waiting prefetches and waits for the running ones to finish.
+        """
+        for uri, job in list(self._pending.items()):
+            if self.pool.tryTake(job):
+                del self._pending[uri]
+        self.pool.waitForDone()
+
+    def _onPrefetched(self, uri: str, image, text_head: tuple):
+        if self._pending.pop(uri, None) is None:
+            return
+        if isinstance(image, QImage):
+            self.cache.insertPixmap(uri, QPixmap.fromImage(image))
+        else:
+            self.cache.insertSvgRenderer(uri, image)
+        if text_head is not None:
+            self.cache.insertTextHead(uri, *text_head)
@@ -0,0 +1,317 @@
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import NamedTuple
+
+from .trigram_index import wildcardFragments
+
+# sort orders of catalog pages, by sort key
+_ORDER_COLUMNS = {"path": ("path",), "name": ("name", "path")}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    extension TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resources_name ON resources (name, path);
+CREATE INDEX IF NOT EXISTS resources_extension ON resources (extension);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS resources_fts USING fts5(
+    path, name, content='resources', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS resources_ai AFTER INSERT ON resources BEGIN
+    INSERT INTO resources_fts (rowid, path, name)
+    VALUES (new.id, new.path, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS resources_ad AFTER DELETE ON resources BEGIN
+    INSERT INTO resources_fts (resources_fts, rowid, path, name)
+    VALUES ('delete', old.id, old.path, old.name);
+END;
+"""
+
+
+def wildcardToGlob(pattern: str) -> str:
+    """
+    Converts a wildcard pattern to an unanchored SQLite GLOB pattern: escaped
+    characters become single character sets and [!...] sets become [^...].
+    """
+    glob = ["*"]
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\" and i + 1 < len(pattern):
+            glob.append(f"[{pattern[i + 1]}]")
+            i += 2
+            continue
+        if c == "[" and pattern.startswith("[!", i):
+            glob.append("[^")
+            i += 2
+            continue
+        glob.append(c)
+        i += 1
+    glob.append("*")
+    return "".join(glob)
+
+
+def _prefixUpperBound(prefix: str) -> str:
+    # the smallest string greater than all strings starting with prefix
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class CatalogQuery(NamedTuple):
+    """
+    A filter of catalog resources. Empty fields accept any resource.
+    """
+
+    # prefixes of the resource paths
+    prefixes: tuple[str, ...] = ()
+    # file extensions, with or without leading dot
+    extensions: tuple[str, ...] = ()
+    # wildcard pattern the paths contain
+    text: str = ""
+    case_sensitive: bool = False
+    # set True to match the text against resource names only
+    names_only: bool = False
+
+
+class ResourceCatalog:
+    """
+    Resource paths kept in an SQLite database instead of Python lists, for very
+    large catalogs. Paths, names and extensions are indexed, and an FTS5 trigram
+    table over paths and names serves substring searches, so that prefix,
+    filetype and text filters run as indexed queries. Results are read by pages,
+    so memory use does not depend on the size of the catalog.
+    A catalog is used from the thread that created it only. Other threads use
+    their own connection to the same database, opened with .connect(). The
+    database is in WAL mode, so reads see the last committed state and neither
+    wait for writes nor make them wait.
+    """
+
+    def __init__(self, file_path: str = ":memory:"):
+        """
+        :param file_path: database file, created if needed. Use ":memory:" for a
+                temporary database, removed when the catalog is closed.
+        """
+        self._tempDir: TemporaryDirectory = None
+        if str(file_path) == ":memory:":
+            # in-memory databases cannot be shared by connections in WAL mode
+            self._tempDir = TemporaryDirectory(
+                prefix="resource-catalog-", ignore_cleanup_errors=True
+            )
+            file_path = Path(self._tempDir.name) / "catalog.sqlite"
+        self._open(file_path)
+
+    def _open(self, file_path: str):
+        self.filePath = file_path
+        self.connection = sqlite3.connect(str(file_path))
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(_SCHEMA)
+        try:
+            self.connection.executescript(_FTS_SCHEMA)
+            self._fullText = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5, or older than 3.34 without trigrams
+            self._fullText = False
+        self._updating = False
+
+    def connect(self) -> "ResourceCatalog":
+        """
+        Opens another connection to the database of the catalog, e.g. to update it
+        from another thread. It is closed before the catalog itself.
+        """
+        catalog = ResourceCatalog.__new__(ResourceCatalog)
+        catalog._tempDir = None
+        catalog._open(self.filePath)
+        return catalog
+
+    def close(self):
+        self.connection.close()
+        if self._tempDir is not None:
+            self._tempDir.cleanup()
+            self._tempDir = None
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT count(*) FROM resources").fetchone()[0]
+
+    def hasFullTextIndex(self) -> bool:
+        """
+        Returns True if text filters use the FTS5 trigram index. Without it, they
+        scan all paths.
+        """
+        return self._fullText
+
+    def addResources(self, paths: Iterable[str]) -> int:
+        """
+        Adds resource paths, ignoring the known ones.
+        :return: number of added resources
+        """
+        rows = []
+        for path in paths:
+            name = path[path.rfind("/") + 1 :]
+            i = name.rfind(".")
+            rows.append((path, name, name[i + 1 :].lower() if i >= 0 else ""))
+        with self.connection:
+            cursor = self.connection.executemany(
+                "INSERT OR IGNORE INTO resources (path, name, extension) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            if self._updating:
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO temp.updated (path) VALUES (?)",
+                    ((row[0],) for row in rows),
+                )
+            return cursor.rowcount
+
+    def removeResources(self, paths: Iterable[str]) -> int:
+        """
+        Removes resource paths.
+        :return: number of removed resources
+        """
+        with self.connection:
+            cursor = self.connection.executemany(
+                "DELETE FROM resources WHERE path = ?", ((p,) for p in paths)
+            )
+            return cursor.rowcount
+
+    def clear(self):
+        with self.connection:
+            self.connection.execute("DELETE FROM resources")
+
+    def startUpdate(self):
+        """
+        Starts recording the resources added from now on, e.g. by a rescan, so
+        that .finishUpdate() can remove the resources that were not added again.
+        """
+        self.connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS updated (path TEXT PRIMARY KEY)"
+        )
+        self.connection.execute("DELETE FROM temp.updated")
+        self._updating = True
+
+    def finishUpdate(self, remove_missing: bool = True) -> int:
+        """
+        Stops recording added resources.
+        :param remove_missing: set True to remove the resources that were not
+                added since .startUpdate(), e.g. if the rescan completed.
+        :return: number of removed resources
+        """
+        if not self._updating:
+            return 0
+        self._updating = False
+        removed = 0
+        with self.connection:
+            if remove_missing:
+                removed = self.connection.execute(
+                    "DELETE FROM resources "
+                    "WHERE path NOT IN (SELECT path FROM temp.updated)"
+                ).rowcount
+            self.connection.execute("DELETE FROM temp.updated")
+        return removed
+
+    def _where(self, query: CatalogQuery) -> tuple[str, list]:
+        """
+        Returns the WHERE clause selecting the resources matched by a query, and
+        its parameters.
+        """
+        clauses = []
+        params = []
+
+        prefixes = [p for p in query.prefixes if p != ""]
+        if len(prefixes) > 0:
+            # ranges of the path index
+            clauses.append(
+                "({})".format(" OR ".join(["(path >= ? AND path < ?)"] * len(prefixes)))
+            )
+            for prefix in prefixes:
+                params.extend((prefix, _prefixUpperBound(prefix)))
+
+        extensions = [e.lstrip(".").lower() for e in query.extensions]
+        if len(extensions) > 0:
+            clauses.append("extension IN ({})".format(", ".join("?" * len(extensions))))
+            params.extend(extensions)
+
+        if query.text != "":
+            column = "name" if query.names_only else "path"
+            # trigrams only match fragments of 3 characters or more
+            fragments = [f for f in wildcardFragments(query.text) if len(f) >= 3]
+            if self._fullText and len(fragments) > 0:
+                phrases = " ".join(
+                    '"{}"'.format(f.replace('"', '""')) for f in fragments
+                )
+                clauses.append(
+                    "id IN (SELECT rowid FROM resources_fts "
+                    "WHERE resources_fts MATCH ?)"
+                )
+                params.append(f"{column} : ({phrases})")
+            # the candidates of the index are checked against the whole pattern
+            if query.case_sensitive:
+                clauses.append(f"{column} GLOB ?")
+                params.append(wildcardToGlob(query.text))
+            else:
+                clauses.append(f"lower({column}) GLOB ?")
+                params.append(wildcardToGlob(query.text).lower())
+
+        if len(clauses) == 0:
+            return "", params
+        return "WHERE " + " AND ".join(clauses), params
+
+    def count(self, query: CatalogQuery = CatalogQuery()) -> int:
+        """
+        Returns the number of resources matched by a query.
+        """
+        where, params = self._where(query)
+        return self.connection.execute(
+            f"SELECT count(*) FROM resources {where}", params
+        ).fetchone()[0]
+
+    def page(
+        self,
+        query: CatalogQuery = CatalogQuery(),
+        sort_key: str = "path",
+        descending: bool = False,
+        after: tuple = None,
+        limit: int = 1000,
+    ) -> list[tuple[str, str]]:
+        """
+        Returns a page of the resources matched by a query, in sort order. Pages
+        continue after the sort key of the last row of the previous page instead of
+        skipping rows with an offset, so that reading a page costs the same
+        wherever it is.
+        :param sort_key: "path" or "name"
+        :param descending: set True to sort in descending order
+        :param after: sort key of the last row of the previous page, as returned by
+                .sortKey(), or None for the first page.
+        :param limit: maximum number of rows
+        :return: list of (path, name) tuples
+        """
+        columns = _ORDER_COLUMNS[sort_key]
+        where, params = self._where(query)
+        if after is not None:
+            keyset = "({}) {} ({})".format(
+                ", ".join(columns),
+                "<" if descending else ">",
+                ", ".join("?" * len(columns)),
+            )
+            where = f"{where} AND {keyset}" if where else f"WHERE {keyset}"
+            params.extend(after)
+        direction = "DESC" if descending else "ASC"
+        order = ", ".join(f"{c} {direction}" for c in columns)
+        return self.connection.execute(
+            f"SELECT path, name FROM resources {where} ORDER BY {order} LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+
+    @staticmethod
+    def sortKey(row: tuple[str, str], sort_key: str = "path") -> tuple:
+        """
+        Returns the sort key of a row returned by .page(), to read the next page.
+        """
+        path, name = row
+        return (path,) if sort_key == "path" else (name, path)
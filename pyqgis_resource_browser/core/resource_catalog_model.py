@@ -0,0 +1,340 @@
+from functools import partial
+from typing import Any
+
+from qgis.PyQt.QtCore import QAbstractTableModel, QModelIndex, QSize, Qt, pyqtSignal
+
+from .resource_catalog import CatalogQuery, ResourceCatalog
+from .resource_scanner import ResourceScanner
+from .thumbnail_cache import ThumbnailCache
+from .thumbnail_renderer import ThumbnailRenderer
+
+
+class ResourceCatalogScanner(ResourceScanner):
+    """
+    A ResourceScanner that adds the found resources to a ResourceCatalog itself,
+    with its own connection, so that the thread of the catalog only reads it.
+    Resources that are not found anymore are removed once the scan completes.
+    """
+
+    # number of resources added by a chunk, once it is written
+    chunkAdded = pyqtSignal(int)
+
+    def __init__(self, catalog: ResourceCatalog, *args, **kwds):
+        """
+        :param catalog: catalog to update
+        :param args:
+        :param kwds: see ResourceScanner
+        """
+        super().__init__(*args, **kwds)
+        self.catalog = catalog
+        self.added = 0
+        self.removed = 0
+        self.completed = False
+        self._writer: ResourceCatalog = None
+        # chunks are written from the scanner thread, which emits them
+        self.chunkReady.connect(self._addChunk, Qt.ConnectionType.DirectConnection)
+
+    def run(self):
+        writer = self.catalog.connect()
+        self._writer = writer
+        try:
+            writer.startUpdate()
+            super().run()
+            self.completed = not self.isInterruptionRequested()
+            self.removed = writer.finishUpdate(remove_missing=self.completed)
+        finally:
+            self._writer = None
+            writer.close()
+
+    def _addChunk(self, resources: list[str]):
+        added = self._writer.addResources(resources)
+        self.added += added
+        self.chunkAdded.emit(added)
+
+
+class ResourceCatalogModel(QAbstractTableModel):
+    """
+    A table model showing the resources of a ResourceCatalog, as an alternative
+    to the ResourceTableModel for very large catalogs. Filters and sorting run as
+    SQL queries, and rows are read by pages with fetchMore() as views scroll down,
+    so only the rows shown so far are held in memory.
+    """
+
+    scanStarted = pyqtSignal()
+    scanProgress = pyqtSignal(int, int)
+    scanFinished = pyqtSignal(bool)
+    resourcesUpdated = pyqtSignal(int, int)
+
+    def __init__(
+        self,
+        *args,
+        catalog: ResourceCatalog = None,
+        page_size: int = 1000,
+        **kwds,
+    ):
+        """
+        :param args:
+        :param catalog: catalog to show. Defaults to a new temporary catalog,
+                which .close() removes.
+        :param page_size: number of rows read per fetchMore() call.
+        :param kwds:
+        """
+        super().__init__(*args, **kwds)
+        self.cnUri = "Path"
+        self.cnIcon = "Resource"
+        self.ciUri = 0
+        self.ciIcon = 1
+        self._columnNames = [self.cnUri, self.cnIcon]
+
+        self.catalog = catalog if catalog is not None else ResourceCatalog()
+        self.pageSize = page_size
+        self.prefix_filters = []
+        self.filetype_filters = []
+        self._query = CatalogQuery()
+        self._sortKey = "path"
+        self._descending = False
+        # (path, name) of the rows fetched so far
+        self._rows: list[tuple[str, str]] = []
+        self._atEnd = False
+        self._count: int = None
+
+        self.thumbnailSize = QSize(16, 16)
+        self.devicePixelRatio = 1.0
+        self.thumbnailCache = ThumbnailCache(32 * 1024**2)
+        self.thumbnailRenderer = ThumbnailRenderer(self.thumbnailCache, self)
+        self.thumbnailRenderer.thumbnailReady.connect(self._onThumbnailReady)
+
+        self._scanner: ResourceCatalogScanner = None
+
+    def __len__(self):
+        return self.rowCount()
+
+    def setResourceFilters(self, prefixes: list[str], filetypes: list[str]) -> bool:
+        """
+        Shows only the resources with one of the path prefixes and one of the
+        file extensions, and scans only those. Use empty lists to show all
+        resources.
+        :return: True if the filters changed, i.e. if resources need to be scanned
+        """
+        if prefixes == self.prefix_filters and filetypes == self.filetype_filters:
+            return False
+        self.prefix_filters = list(prefixes)
+        self.filetype_filters = list(filetypes)
+        self._setQuery(
+            self._query._replace(prefixes=tuple(prefixes), extensions=tuple(filetypes))
+        )
+        return True
+
+    def setTextFilter(
+        self, text: str, case_sensitive: bool = False, names_only: bool = False
+    ):
+        """
+        Shows only the resources whose path contains a wildcard pattern.
+        Use an empty text to disable text filtering.
+        :param names_only: set True to match resource names only
+        """
+        self._setQuery(
+            self._query._replace(
+                text=text, case_sensitive=case_sensitive, names_only=names_only
+            )
+        )
+
+    def query(self) -> CatalogQuery:
+        return self._query
+
+    def setCatalog(self, catalog: ResourceCatalog):
+        """
+        Shows another catalog, e.g. after .close(). The running scan is cancelled.
+        """
+        self.cancelResourceScan(wait=True)
+        self.catalog = catalog
+        self.refresh()
+
+    def close(self):
+        """
+        Cancels the running scan and closes the catalog, which removes its
+        database if it is a temporary one. No rows are shown until .setCatalog().
+        """
+        if self.catalog is None:
+            return
+        self.cancelResourceScan(wait=True)
+        self.catalog.close()
+        self.catalog = None
+        self.refresh()
+
+    def isClosed(self) -> bool:
+        return self.catalog is None
+
+    def _setQuery(self, query: CatalogQuery):
+        if query != self._query:
+            self._query = query
+            self.refresh()
+
+    def refresh(self):
+        """
+        Drops the fetched rows, to read them again from the catalog.
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._atEnd = False
+        self._count = None
+        self.endResetModel()
+
+    def totalCount(self) -> int:
+        """
+        Returns the number of resources matching the filters, fetched or not.
+        """
+        if self.catalog is None:
+            return 0
+        if self._count is None:
+            self._count = self.catalog.count(self._query)
+        return self._count
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._atEnd and self.catalog is not None
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        after = None
+        if len(self._rows) > 0:
+            after = self.catalog.sortKey(self._rows[-1], self._sortKey)
+        rows = self.catalog.page(
+            self._query, self._sortKey, self._descending, after, self.pageSize
+        )
+        self._atEnd = len(rows) < self.pageSize
+        if len(rows) == 0:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self._sortKey = "name" if column == self.ciIcon else "path"
+        self._descending = order == Qt.SortOrder.DescendingOrder
+        self.refresh()
+
+    def startResourceScan(self, chunk_size: int = 500):
+        """
+        Scans the resource tree in a background thread, which adds the found
+        resources to the catalog. Resources that are not found anymore are
+        removed once the scan completes.
+        """
+        self.cancelResourceScan(wait=True)
+        if self.catalog is None:
+            return
+        scanner = ResourceCatalogScanner(
+            self.catalog,
+            prefixes=self.prefix_filters,
+            suffixes=self.filetype_filters,
+            chunk_size=chunk_size,
+        )
+        scanner.chunkAdded.connect(partial(self._onScanChunk, scanner))
+        scanner.progressChanged.connect(partial(self._onScanProgress, scanner))
+        scanner.finished.connect(partial(self._onScanFinished, scanner))
+        scanner.finished.connect(scanner.deleteLater)
+        self._scanner = scanner
+        self.scanStarted.emit()
+        scanner.start()
+
+    def cancelResourceScan(self, wait: bool = False):
+        """
+        Cancels the running resource scan, keeping the resources found so far.
+        """
+        scanner = self._scanner
+        if scanner is None:
+            return
+        self._scanner = None
+        scanner.requestInterruption()
+        if wait:
+            scanner.wait()
+        self.refresh()
+        self.scanFinished.emit(False)
+
+    def isScanning(self) -> bool:
+        return self._scanner is not None
+
+    def _onScanChunk(self, scanner: ResourceCatalogScanner, added: int):
+        if scanner is not self._scanner:
+            return
+        self._count = None
+        # added rows sorted after the fetched ones can be fetched now, the others
+        # are shown when the scan finished
+        self._atEnd = False
+
+    def _onScanProgress(self, scanner: ResourceCatalogScanner, done: int, total: int):
+        if scanner is self._scanner:
+            self.scanProgress.emit(done, total)
+
+    def _onScanFinished(self, scanner: ResourceCatalogScanner):
+        if scanner is not self._scanner:
+            return
+        self._scanner = None
+        self.refresh()
+        self.scanFinished.emit(True)
+        self.resourcesUpdated.emit(scanner.added, scanner.removed)
+
+    def setThumbnailSize(self, size: QSize, device_pixel_ratio: float = 1.0):
+        self.thumbnailSize = QSize(size)
+        self.devicePixelRatio = device_pixel_ratio
+        if self.rowCount() > 0:
+            self.dataChanged.emit(
+                self.index(0, self.ciIcon),
+                self.index(self.rowCount() - 1, self.ciIcon),
+                [Qt.ItemDataRole.DecorationRole],
+            )
+
+    def cancelThumbnails(self, visible_rows: list[int]):
+        """
+        Cancels the waiting thumbnail renderings, except for the visible rows.
+        :param visible_rows: rows currently shown in a view
+        """
+        n = len(self._rows)
+        self.thumbnailRenderer.cancel(
+            self._rows[row][0] for row in visible_rows if 0 <= row < n
+        )
+
+    def _onThumbnailReady(self, uri: str, row: int):
+        if 0 <= row < len(self._rows) and self._rows[row][0] == uri:
+            idx = self.index(row, self.ciIcon)
+            self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DecorationRole])
+
+    def columnCount(self, parent: QModelIndex = ...) -> int:
+        return len(self._columnNames)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnNames(self) -> list[str]:
+        return list(self._columnNames)
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = ...
+    ) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self._columnNames[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = ...) -> Any:
+        if not index.isValid():
+            return None
+
+        path, name = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return path if column == self.ciUri else name
+        if role == Qt.ItemDataRole.DecorationRole and column == self.ciIcon:
+            pixmap = self.thumbnailRenderer.thumbnail(
+                path, self.thumbnailSize, self.devicePixelRatio, index.row()
+            )
+            if pixmap is not None and not pixmap.isNull():
+                return pixmap
+        if role == Qt.ItemDataRole.ToolTipRole and column == self.ciUri:
+            return path
+        if role == Qt.ItemDataRole.UserRole:
+            return path
+        return None
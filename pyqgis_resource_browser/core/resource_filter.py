@@ -0,0 +1,145 @@
+from collections.abc import Sequence
+
+from .resource_store import ResourceStore
+
+# value of an accept mask entry that has not been computed yet
+ACCEPT_UNKNOWN = 2
+
+
+class PrefixTrie:
+    """
+    A character trie of prefixes, to test whether a string starts with any of them
+    in a single pass over the string.
+    """
+
+    _END = ""
+
+    def __init__(self, prefixes: Sequence[str] = ()):
+        self._root: dict = {}
+        for prefix in prefixes:
+            node = self._root
+            for c in prefix:
+                node = node.setdefault(c, {})
+            node[self._END] = True
+
+    def match(self, s: str) -> bool:
+        """
+        Returns True if s starts with one of the prefixes, False if neither s nor
+        any string starting with s can match, and None if s is itself the
+        beginning of a prefix, i.e. if the answer depends on what follows s.
+        """
+        node = self._root
+        for c in s:
+            if self._END in node:
+                return True
+            node = node.get(c)
+            if node is None:
+                return False
+        if self._END in node:
+            return True
+        return None
+
+
+class SuffixSet:
+    """
+    A set of suffixes grouped by length, to test whether a string ends with any of
+    them with one hash lookup per distinct suffix length.
+    """
+
+    def __init__(self, suffixes: Sequence[str] = ()):
+        groups: dict[int, set[str]] = {}
+        for suffix in suffixes:
+            groups.setdefault(len(suffix), set()).add(suffix)
+        # an empty suffix matches any string
+        self._matchAll = 0 in groups
+        self._groups = sorted(groups.items())
+        self.maxLength = max(groups) if len(groups) > 0 else 0
+
+    def match(self, s: str) -> bool:
+        """
+        Returns True if s ends with one of the suffixes.
+        """
+        if self._matchAll:
+            return True
+        for length, group in self._groups:
+            if s[-length:] in group:
+                return True
+        return False
+
+
+class ResourceFilter:
+    """
+    Accepts resource paths that start with one of the prefixes and end with one of
+    the suffixes. Empty prefixes or suffixes accept any path.
+
+    For a ResourceStore, results are computed once per interned directory and
+    extension whenever they do not depend on the basename, so building the accept
+    mask of all rows costs a few array lookups per row.
+    """
+
+    def __init__(self, prefixes: Sequence[str] = (), suffixes: Sequence[str] = ()):
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+        self._trie = PrefixTrie(self.prefixes)
+        self._suffixSet = SuffixSet(self.suffixes)
+
+    def isEmpty(self) -> bool:
+        """
+        Returns True if the filter accepts any path.
+        """
+        return len(self.prefixes) == 0 and len(self.suffixes) == 0
+
+    def accepts(self, path: str) -> bool:
+        """
+        Returns True if the path is accepted.
+        """
+        if len(self.prefixes) > 0 and self._trie.match(path) is not True:
+            return False
+        if len(self.suffixes) > 0 and not self._suffixSet.match(path):
+            return False
+        return True
+
+    def _directoryResult(self, directory: str) -> bool:
+        # None if the result depends on the basename
+        if len(self.prefixes) == 0:
+            return True
+        return self._trie.match(directory + "/" if directory else "")
+
+    def _extensionResult(self, extension: str) -> bool:
+        # None if the result depends on the basename
+        if len(self.suffixes) == 0:
+            return True
+        if extension and len(extension) + 1 >= self._suffixSet.maxLength:
+            return self._suffixSet.match("." + extension)
+        return None
+
+    def acceptMask(
+        self, store: ResourceStore, first: int = 0, last: int = None
+    ) -> bytearray:
+        """
+        Returns a mask with 1 for each accepted row and 0 for each rejected row.
+        :param store: resource store to compute the mask of
+        :param first: first row of the mask
+        :param last: last row of the mask (included), defaults to the last row
+        """
+        if last is None:
+            last = len(store) - 1
+        if self.isEmpty():
+            return bytearray(b"\x01") * (last - first + 1)
+
+        directory_results = [self._directoryResult(d) for d in store.directories]
+        extension_results = [self._extensionResult(e) for e in store.extensions]
+        directory_ids = store.directoryIds
+        extension_ids = store.extensionIds
+
+        mask = bytearray(last - first + 1)
+        for i, row in enumerate(range(first, last + 1)):
+            accepted = directory_results[directory_ids[row]]
+            if accepted is None:
+                accepted = self._trie.match(store.path(row)) is True
+            if accepted:
+                accepted = extension_results[extension_ids[row]]
+                if accepted is None:
+                    accepted = self._suffixSet.match(store.path(row))
+            mask[i] = accepted
+        return mask
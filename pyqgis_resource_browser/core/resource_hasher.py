@@ -0,0 +1,76 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from qgis.PyQt.QtCore import QFile, QThread, pyqtSignal
+
+from .perceptual_hash import imageDHash
+
+
+def resourceDigest(uri: str) -> str:
+    """
+    Returns the BLAKE2b digest of the content of a resource, as hexadecimal string.
+    Can be called outside the GUI thread.
+    :return: the digest, or None if the resource cannot be read.
+    """
+    file = QFile(uri)
+    if not file.open(QFile.OpenModeFlag.ReadOnly):
+        return None
+    try:
+        data = bytes(file.readAll())
+    finally:
+        file.close()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def resourceHashes(uri: str) -> dict:
+    """
+    Returns the content digest and the perceptual hash of a resource, keyed like
+    in the resource index metadata. The perceptual hash is None for resources
+    that are not images.
+    """
+    return {"digest": resourceDigest(uri), "dhash": imageDHash(uri)}
+
+
+class ResourceHasher(QThread):
+    """
+    A thread that hashes the content of resources and reports their content
+    digests and perceptual hashes in chunks. Resources are read and hashed by a
+    pool of worker threads, as QFile reads, image decoding and hashlib release
+    the GIL.
+    """
+
+    hashesReady = pyqtSignal(dict)
+    progressChanged = pyqtSignal(int, int)
+
+    def __init__(
+        self,
+        *args,
+        paths: list[str] = None,
+        max_workers: int = None,
+        chunk_size: int = 500,
+        **kwds,
+    ):
+        """
+        :param args:
+        :param paths: resource paths to hash.
+        :param max_workers: number of worker threads, defaults to the number of
+                processors, as chosen by ThreadPoolExecutor.
+        :param chunk_size: number of resources sent per hashesReady signal.
+        :param kwds:
+        """
+        super().__init__(*args, **kwds)
+        self.paths = list(paths or ())
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def run(self):
+        n = len(self.paths)
+        self.progressChanged.emit(0, n)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for start in range(0, n, self.chunk_size):
+                if self.isInterruptionRequested():
+                    return
+                chunk = self.paths[start : start + self.chunk_size]
+                hashes = dict(zip(chunk, executor.map(resourceHashes, chunk)))
+                self.hashesReady.emit(hashes)
+                self.progressChanged.emit(start + len(chunk), n)
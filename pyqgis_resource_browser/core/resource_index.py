@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from qgis.core import Qgis, QgsApplication
+from qgis.PyQt.QtCore import QDirIterator, QThread, pyqtSignal
+
+from pyqgis_resource_browser.__about__ import __title_clean__
+
+# bump this when the structure of the serialized index changes
+INDEX_FORMAT_VERSION = 1
+
+
+def defaultIndexPath() -> Path:
+    """
+    Returns the path of the resource index file within the QGIS user profile.
+    """
+    return (
+        Path(QgsApplication.qgisSettingsDirPath())
+        / "cache"
+        / __title_clean__
+        / "resource_index.json"
+    )
+
+
+def resourceFingerprint(
+    path: str = ":", prefixes: Sequence[str] = (), suffixes: Sequence[str] = ()
+) -> str:
+    """
+    Returns a cheap fingerprint of the Qt resource tree, made of the QGIS version,
+    the loaded plugins and the number of entries in each top-level directory.
+    The whole tree is not walked, so the fingerprint can be computed at each start.
+    Prefixes and suffixes used to filter a scan are part of the fingerprint too.
+    """
+    from qgis.utils import active_plugins
+
+    counts = {}
+    D = QDirIterator(path)
+    while D.hasNext():
+        entry = D.next()
+        if D.fileInfo().isDir():
+            n = 0
+            C = QDirIterator(entry)
+            while C.hasNext():
+                C.next()
+                n += 1
+            counts[entry] = n
+        else:
+            counts[entry] = -1
+
+    state = {
+        "format": INDEX_FORMAT_VERSION,
+        "qgis": Qgis.version(),
+        "plugins": sorted(active_plugins),
+        "counts": sorted(counts.items()),
+        "prefixes": sorted(prefixes),
+        "suffixes": sorted(suffixes),
+    }
+    return hashlib.sha1(json.dumps(state).encode("utf-8")).hexdigest()
+
+
+class ResourceIndex:
+    """
+    A catalog of scanned Qt resource paths and their computed metadata,
+    which can be saved to disk and is identified by a resource fingerprint.
+    Paths can be any sequence, e.g. the ResourceStore of a model, so that the
+    index does not hold a copy of them. They are only listed when saved.
+    """
+
+    def __init__(
+        self,
+        fingerprint: str = "",
+        paths: Sequence[str] = None,
+        metadata: dict[str, dict[str, Any]] = None,
+    ):
+        self.fingerprint = fingerprint
+        self.paths: Sequence[str] = paths if paths is not None else []
+        self.metadata: dict[str, dict[str, Any]] = (
+            metadata if metadata is not None else {}
+        )
+
+    def __len__(self):
+        return len(self.paths)
+
+    @classmethod
+    def load(cls, file_path: Path) -> "ResourceIndex":
+        """
+        Loads an index file.
+        :param file_path: path of the index file
+        :return: the loaded ResourceIndex or None if the file does not exist,
+                 is unreadable or has been written in another index format.
+        """
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("format") != INDEX_FORMAT_VERSION:
+            return None
+
+        return cls(
+            fingerprint=data.get("fingerprint", ""),
+            paths=data.get("paths", []),
+            metadata=data.get("metadata", {}),
+        )
+
+    def save(self, file_path: Path):
+        """
+        Writes the index to disk. The file is replaced atomically, so a concurrent
+        reader never sees a partially written index.
+        :param file_path: path of the index file
+        """
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_suffix(".tmp")
+        data = {
+            "format": INDEX_FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "paths": list(self.paths),
+            "metadata": {p: v for p, v in self.metadata.items() if len(v) > 0},
+        }
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, file_path)
+
+
+class ResourceFingerprintChecker(QThread):
+    """
+    A thread that computes the resource fingerprint off the GUI thread.
+    """
+
+    fingerprintReady = pyqtSignal(str)
+
+    def __init__(
+        self,
+        *args,
+        path: str = ":",
+        prefixes: list[str] = None,
+        suffixes: list[str] = None,
+        **kwds,
+    ):
+        super().__init__(*args, **kwds)
+        self.path = path
+        self.prefixes = tuple(prefixes or ())
+        self.suffixes = tuple(suffixes or ())
+
+    def run(self):
+        self.fingerprintReady.emit(
+            resourceFingerprint(
+                self.path, prefixes=self.prefixes, suffixes=self.suffixes
+            )
+        )
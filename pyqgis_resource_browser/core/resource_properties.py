@@ -0,0 +1,188 @@
+import operator
+import re
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from qgis.PyQt.QtCore import QFile, QFileInfo, QThread, pyqtSignal
+from qgis.PyQt.QtGui import QImageReader
+
+# keys of the resource properties in the resource index metadata
+PROPERTY_KEYS = ("size", "width", "height", "format")
+
+# the root element of an SVG is expected within the first bytes of the file
+SVG_HEAD_SIZE = 8 * 1024
+
+_SVG_ROOT = re.compile(rb"<svg\b[^>]*>", re.S)
+_SVG_LENGTH = re.compile(rb"^\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$")
+_SVG_VIEW_BOX = re.compile(
+    rb"^\s*(-?[0-9.]+)[\s,]+(-?[0-9.]+)[\s,]+([0-9.]+)[\s,]+([0-9.]+)\s*$"
+)
+
+
+def _svgAttribute(root: bytes, name: bytes) -> bytes:
+    match = re.search(rb"\s" + name + rb"\s*=\s*(['\"])(.*?)\1", root, re.S)
+    return match.group(2) if match else None
+
+
+def svgSize(head: bytes) -> tuple[int, int]:
+    """
+    Returns the intrinsic size of an SVG from the attributes of its root element:
+    its width and height if given in pixels, else the size of its viewBox.
+    :param head: first bytes of the SVG document, containing the root element
+    :return: (width, height) tuple, or None if the size is not known
+    """
+    root = _SVG_ROOT.search(head)
+    if root is None:
+        return None
+    root = root.group(0)
+
+    lengths = []
+    for name in (b"width", b"height"):
+        value = _svgAttribute(root, name)
+        match = _SVG_LENGTH.match(value) if value is not None else None
+        lengths.append(round(float(match.group(1))) if match else None)
+    if None not in lengths:
+        return lengths[0], lengths[1]
+
+    value = _svgAttribute(root, b"viewBox")
+    match = _SVG_VIEW_BOX.match(value) if value is not None else None
+    if match is None:
+        return None
+    return round(float(match.group(3))), round(float(match.group(4)))
+
+
+def resourceProperties(uri: str) -> dict:
+    """
+    Returns the byte size, the intrinsic width and height and the image format of
+    a resource, keyed like in the resource index metadata. Only file headers are
+    read, images are not decoded. Width, height and format are None for
+    resources that are not images. Can be called outside the GUI thread.
+    """
+    properties = dict.fromkeys(PROPERTY_KEYS)
+    properties["size"] = QFileInfo(uri).size()
+
+    if uri.lower().endswith(".svg"):
+        file = QFile(uri)
+        if file.open(QFile.OpenModeFlag.ReadOnly):
+            try:
+                size = svgSize(bytes(file.read(SVG_HEAD_SIZE)))
+            finally:
+                file.close()
+            properties["format"] = "svg"
+            if size is not None:
+                properties["width"], properties["height"] = size
+        return properties
+
+    reader = QImageReader(uri)
+    if reader.canRead():
+        properties["format"] = bytes(reader.format()).decode("ascii").lower()
+        size = reader.size()
+        if size.isValid():
+            properties["width"] = size.width()
+            properties["height"] = size.height()
+    return properties
+
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "<": operator.lt,
+    ">": operator.gt,
+    "=": operator.eq,
+    ":": operator.eq,
+}
+
+_PROPERTY_FILTER = re.compile(
+    r"^({})(<=|>=|<|>|=|:)(\S+)$".format("|".join(PROPERTY_KEYS)), re.I
+)
+
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2}
+
+
+class PropertyFilter(NamedTuple):
+    """
+    A condition on a resource property, e.g. width <= 32.
+    """
+
+    key: str
+    op: str
+    value: Any
+
+    def accepts(self, value: Any) -> bool:
+        """
+        Returns True if a property value fulfils the condition. Unknown values
+        are not accepted.
+        """
+        if value is None:
+            return False
+        return _OPERATORS[self.op](value, self.value)
+
+
+def parsePropertyFilters(text: str) -> tuple[str, list[PropertyFilter]]:
+    """
+    Extracts property filters from a search text, i.e. words like "width>=48",
+    "height<32", "size<2k" (in KiB, or "m" for MiB) or "format:png".
+    :return: the search text without the property filters, and the filters
+    """
+    words = []
+    filters = []
+    for word in text.split(" "):
+        match = _PROPERTY_FILTER.match(word)
+        if match is None:
+            words.append(word)
+            continue
+        key, op, value = match.group(1).lower(), match.group(2), match.group(3)
+        if key == "format":
+            filters.append(PropertyFilter(key, op, value.lower()))
+            continue
+        number = re.match(r"^([0-9]+)([km]?)i?b?$", value, re.I)
+        if number is None:
+            words.append(word)
+            continue
+        amount = int(number.group(1))
+        if key == "size":
+            amount *= _SIZE_UNITS[number.group(2).lower()]
+        elif number.group(2) != "":
+            words.append(word)
+            continue
+        filters.append(PropertyFilter(key, op, amount))
+    if len(filters) == 0:
+        return text, filters
+    return " ".join(words).strip(), filters
+
+
+class ResourceInspector(QThread):
+    """
+    A thread that reads the properties of resources from their headers and
+    reports them in chunks.
+    """
+
+    propertiesReady = pyqtSignal(dict)
+    progressChanged = pyqtSignal(int, int)
+
+    def __init__(
+        self,
+        *args,
+        paths: list[str] = None,
+        chunk_size: int = 500,
+        **kwds,
+    ):
+        """
+        :param args:
+        :param paths: resource paths to inspect.
+        :param chunk_size: number of resources sent per propertiesReady signal.
+        :param kwds:
+        """
+        super().__init__(*args, **kwds)
+        self.paths = list(paths or ())
+        self.chunk_size = chunk_size
+
+    def run(self):
+        n = len(self.paths)
+        self.progressChanged.emit(0, n)
+        for start in range(0, n, self.chunk_size):
+            if self.isInterruptionRequested():
+                return
+            chunk = self.paths[start : start + self.chunk_size]
+            self.propertiesReady.emit({p: resourceProperties(p) for p in chunk})
+            self.progressChanged.emit(start + len(chunk), n)
@@ -0,0 +1,78 @@
+from qgis.PyQt.QtCore import QDirIterator, QThread, pyqtSignal
+
+from . import acceptsResource, acceptsResourceDirectory, scanResources
+from .resource_index import resourceFingerprint
+
+
+class ResourceScanner(QThread):
+    """
+    A thread that walks the Qt resource tree off the GUI thread and reports
+    the found resource paths in chunks. The resource fingerprint is computed
+    before walking, so the result can be stored into a ResourceIndex.
+    """
+
+    chunkReady = pyqtSignal(list)
+    progressChanged = pyqtSignal(int, int)
+
+    def __init__(
+        self,
+        *args,
+        path: str = ":",
+        prefixes: list[str] = None,
+        suffixes: list[str] = None,
+        chunk_size: int = 500,
+        **kwds,
+    ):
+        """
+        :param args:
+        :param path: root path to scan, defaults to the whole resource tree.
+        :param prefixes: only report paths starting with one of these prefixes.
+        :param suffixes: only report paths ending with one of these suffixes.
+        :param chunk_size: number of resource paths sent per chunkReady signal.
+        :param kwds:
+        """
+        super().__init__(*args, **kwds)
+        self.path = path
+        self.prefixes = tuple(prefixes or ())
+        self.suffixes = tuple(suffixes or ())
+        self.chunk_size = chunk_size
+        self.fingerprint: str = ""
+
+    def run(self):
+        self.fingerprint = resourceFingerprint(
+            self.path, prefixes=self.prefixes, suffixes=self.suffixes
+        )
+
+        # top-level entries are listed first, so that progress can be reported
+        # per top-level directory
+        files = []
+        directories = []
+        D = QDirIterator(self.path)
+        while D.hasNext():
+            entry = D.next()
+            if D.fileInfo().isDir():
+                if acceptsResourceDirectory(entry, self.prefixes):
+                    directories.append(entry)
+            elif D.fileInfo().isFile():
+                if acceptsResource(D.filePath(), self.prefixes, self.suffixes):
+                    files.append(D.filePath())
+
+        n_steps = len(directories) + 1
+        self.progressChanged.emit(0, n_steps)
+
+        chunk = files
+        for step, directory in enumerate(directories, start=1):
+            for uri in scanResources(
+                path=directory, prefixes=self.prefixes, suffixes=self.suffixes
+            ):
+                if self.isInterruptionRequested():
+                    return
+                chunk.append(uri)
+                if len(chunk) >= self.chunk_size:
+                    self.chunkReady.emit(chunk)
+                    chunk = []
+            self.progressChanged.emit(step, n_steps)
+
+        if len(chunk) > 0:
+            self.chunkReady.emit(chunk)
+        self.progressChanged.emit(n_steps, n_steps)
@@ -0,0 +1,219 @@
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+# segments of concatenated paths hold 2^SEGMENT_SHIFT rows each
+SEGMENT_SHIFT = 10
+SEGMENT_ROWS = 1 << SEGMENT_SHIFT
+
+
+class ResourceStore:
+    """
+    A compact, column-oriented store of resource paths.
+
+    Paths are concatenated into strings of SEGMENT_ROWS paths each, and addressed
+    by offsets. Appending paths only joins the last segment again, so that filling
+    the store by chunks costs the same as filling it at once.
+    Per-row columns are kept in typed arrays, computed once when paths are added:
+    the offset of the basename within the path, the id of the interned directory
+    and the code of the interned file extension. Compared to a list of strings,
+    this avoids one Python object per path.
+
+    The .directoryIds and .extensionIds arrays can be read directly for fast
+    per-row lookups, but must not be modified.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self.clear()
+        self.extend(paths)
+
+    def clear(self):
+        """
+        Removes all rows.
+        """
+        self._segments: list[str] = []
+        self._offsets = array("I", [0])
+        self._nameOffsets = array("H")
+        self.directoryIds = array("I")
+        self.extensionIds = array("H")
+
+        self.directories: list[str] = []
+        self._directoryIndex: dict[str, int] = {}
+        self.extensions: list[str] = [""]
+        self._extensionIndex: dict[str, int] = {"": 0}
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __iter__(self) -> Iterator[str]:
+        offsets = self._offsets
+        n = len(offsets) - 1
+        for s, segment in enumerate(self._segments):
+            first = s << SEGMENT_SHIFT
+            base = offsets[first]
+            for row in range(first, min(first + SEGMENT_ROWS, n)):
+                yield segment[offsets[row] - base : offsets[row + 1] - base]
+
+    def __getitem__(self, row: int) -> str:
+        return self.path(row)
+
+    def path(self, row: int) -> str:
+        """
+        Returns the full path of a row.
+        """
+        offsets = self._offsets
+        base = offsets[row >> SEGMENT_SHIFT << SEGMENT_SHIFT]
+        return self._segments[row >> SEGMENT_SHIFT][
+            offsets[row] - base : offsets[row + 1] - base
+        ]
+
+    def name(self, row: int) -> str:
+        """
+        Returns the basename of a row.
+        """
+        offsets = self._offsets
+        base = offsets[row >> SEGMENT_SHIFT << SEGMENT_SHIFT]
+        return self._segments[row >> SEGMENT_SHIFT][
+            offsets[row] - base + self._nameOffsets[row] : offsets[row + 1] - base
+        ]
+
+    def directory(self, row: int) -> str:
+        """
+        Returns the directory of a row.
+        """
+        return self.directories[self.directoryIds[row]]
+
+    def directoryId(self, row: int) -> int:
+        """
+        Returns the id of the directory of a row, i.e. its position in .directories.
+        """
+        return self.directoryIds[row]
+
+    def extension(self, row: int) -> str:
+        """
+        Returns the file extension of a row, without the leading dot.
+        """
+        return self.extensions[self.extensionIds[row]]
+
+    def extensionId(self, row: int) -> int:
+        """
+        Returns the code of the extension of a row, i.e. its position in .extensions.
+        """
+        return self.extensionIds[row]
+
+    def extend(self, paths: Iterable[str]):
+        """
+        Appends paths to the end of the store.
+        """
+        paths = list(paths)
+        if len(paths) == 0:
+            return
+
+        for path in paths:
+            i = path.rfind("/") + 1
+            directory = path[: max(i - 1, 0)]
+            dir_id = self._directoryIndex.get(directory)
+            if dir_id is None:
+                dir_id = len(self.directories)
+                self.directories.append(directory)
+                self._directoryIndex[directory] = dir_id
+
+            j = path.rfind(".")
+            extension = path[j + 1 :] if j >= i else ""
+            ext_id = self._extensionIndex.get(extension)
+            if ext_id is None:
+                ext_id = len(self.extensions)
+                self.extensions.append(extension)
+                self._extensionIndex[extension] = ext_id
+
+            self._nameOffsets.append(i)
+            self.directoryIds.append(dir_id)
+            self.extensionIds.append(ext_id)
+
+        self._appendPaths(paths)
+
+    def _appendPaths(self, paths: list[str]):
+        # appends paths to the segments and offsets, other columns are left as is
+        offset = self._offsets[-1]
+        for path in paths:
+            offset += len(path)
+            self._offsets.append(offset)
+        row = len(self._offsets) - 1 - len(paths)
+        i = 0
+        while i < len(paths):
+            # fill the last segment first, then start new ones
+            n = SEGMENT_ROWS - (row & (SEGMENT_ROWS - 1))
+            segment = row >> SEGMENT_SHIFT
+            if segment < len(self._segments):
+                self._segments[segment] = "".join(
+                    [self._segments[segment], *paths[i : i + n]]
+                )
+            else:
+                self._segments.append("".join(paths[i : i + n]))
+            i += n
+            row += n
+
+    def removeRows(self, first: int, last: int):
+        """
+        Removes the rows first to last (included).
+        """
+        # segments before the one of the first row are kept as they are
+        start = first >> SEGMENT_SHIFT << SEGMENT_SHIFT
+        paths = [self.path(row) for row in range(start, first)]
+        paths.extend(self.path(row) for row in range(last + 1, len(self)))
+        del self._segments[start >> SEGMENT_SHIFT :]
+        del self._offsets[start + 1 :]
+        self._appendPaths(paths)
+        del self._nameOffsets[first : last + 1]
+        del self.directoryIds[first : last + 1]
+        del self.extensionIds[first : last + 1]
+
+    def removeRowSet(self, rows: Iterable[int]):
+        """
+        Removes rows given in any order, e.g. scattered ones. The rows after the
+        first removed one are rebuilt once, whatever the number of row ranges.
+        """
+        removed = set(rows)
+        if len(removed) == 0:
+            return
+        # segments before the one of the first removed row are kept as they are
+        start = min(removed) >> SEGMENT_SHIFT << SEGMENT_SHIFT
+        kept = [row for row in range(start, len(self)) if row not in removed]
+        paths = [self.path(row) for row in kept]
+        del self._segments[start >> SEGMENT_SHIFT :]
+        del self._offsets[start + 1 :]
+        self._appendPaths(paths)
+        for name in ("_nameOffsets", "directoryIds", "extensionIds"):
+            column = getattr(self, name)
+            tail = array(column.typecode, [column[row] for row in kept])
+            del column[start:]
+            column.extend(tail)
+
+    def permute(self, rows: Sequence[int]):
+        """
+        Reorders the rows, e.g. to sort them: row i becomes the former row rows[i].
+        :param rows: a permutation of all rows
+        """
+        paths = [self.path(r) for r in rows]
+        self._segments = []
+        self._offsets = array("I", [0])
+        self._appendPaths(paths)
+        for name in ("_nameOffsets", "directoryIds", "extensionIds"):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[r] for r in rows]))
+
+    def nbytes(self) -> int:
+        """
+        Returns the approximate memory used by the store, in bytes.
+        """
+        n = sum(sys.getsizeof(segment) for segment in self._segments)
+        for column in (
+            self._offsets,
+            self._nameOffsets,
+            self.directoryIds,
+            self.extensionIds,
+        ):
+            n += column.itemsize * len(column)
+        n += sum(sys.getsizeof(d) for d in self.directories)
+        n += sum(sys.getsizeof(e) for e in self.extensions)
+        return n
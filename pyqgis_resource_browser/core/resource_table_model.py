@@ -1,17 +1,91 @@
-import os
+import re
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable, Sequence
+from functools import partial
+from pathlib import Path
 from typing import Any
 
-from qgis.PyQt.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
-from qgis.PyQt.QtGui import QIcon
+from qgis.PyQt.QtCore import (
+    QAbstractItemModel,
+    QAbstractTableModel,
+    QLocale,
+    QModelIndex,
+    QRegularExpression,
+    QSize,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    pyqtSignal,
+)
+from qgis.PyQt.QtGui import QPixmap
 
-from . import scanResources
+from pyqgis_resource_browser.toolbelt import PlgLogger
+
+from . import acceptsResource, scanResources
+from .diagnostics import DIAGNOSTICS
+from .fuzzy_search import FuzzyIndex
+from .lru_cache import LRUCache
+from .perceptual_hash import BKTree
+from .resource_filter import ACCEPT_UNKNOWN, ResourceFilter
+from .resource_hasher import ResourceHasher
+from .resource_index import (
+    ResourceFingerprintChecker,
+    ResourceIndex,
+    resourceFingerprint,
+)
+from .resource_properties import PropertyFilter, ResourceInspector
+from .resource_scanner import ResourceScanner
+from .resource_store import ResourceStore
+from .thumbnail_cache import ThumbnailCache
+from .thumbnail_renderer import ThumbnailRenderer
+from .trigram_index import TrigramIndex
+
+# turns accepted rows of a mask into rows to test again
+_RETEST_ACCEPTED = bytes.maketrans(b"\x01", bytes([ACCEPT_UNKNOWN]))
+
+# row of the index rows of removed resources
+_REMOVED_ROW = 0xFFFFFFFF
+
+_DIGITS = re.compile(r"([0-9]+)")
+
+
+def naturalSortKey(s: str) -> tuple:
+    """
+    Returns a key to sort strings in natural order, ignoring case: runs of digits
+    are compared by their number, so that "icon2" sorts before "icon10".
+    """
+    parts = _DIGITS.split(s.casefold())
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
 
 
 class ResourceTableFilterModel(QSortFilterProxyModel):
     """
-    A QSortFilterProxyModel to filter resource strings
+    A QSortFilterProxyModel to filter resource strings.
+    Prefix and filetype filters are computed once into a per-row accept mask, which
+    is only rebuilt when the filters change, so other filter passes (e.g. text
+    filters) cost a mask lookup for rows rejected by these filters.
+    Text filter results are kept in a second mask, so that narrowing the text filter
+    only tests the rows accepted so far. Literal fragments of the text filter are
+    looked up in the trigram index of a ResourceTableModel, so only candidate rows
+    are matched against the regular expression.
+    A ranking, e.g. from a fuzzy search, restricts the rows to the ranked ones and
+    orders them by rank.
+    Property filters restrict the rows to resources with known properties, e.g. a
+    maximum width. Rows are filtered again as their properties become known.
+    Text masks of recent text filters are cached until source rows change, so going
+    back to a previous text filter, e.g. by deleting characters, only looks up the
+    cached mask.
+    Unless rows are ranked, sorting a ResourceTableModel is left to the model, which
+    reorders its rows with precomputed sort keys, and the proxy keeps their order.
+    Masks and ranks follow the reordered rows.
     """
 
+    # number of text masks kept for recent text filters
+    TEXT_MASK_CACHE_SIZE = 16
+
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
         # self.setRecursiveFilteringEnabled(True)
@@ -20,6 +94,41 @@ class ResourceTableFilterModel(QSortFilterProxyModel):
         self.prefix_filters = []
         self.filetype_filters = []
 
+        self._resourceFilter = ResourceFilter()
+        self._acceptMask = bytearray()
+        self._textFilter = QRegularExpression()
+        self._textMask = bytearray()
+        # text masks by text filter pattern and case sensitivity
+        self.textMaskCache = LRUCache(self.TEXT_MASK_CACHE_SIZE)
+        self._ranks: dict[int, int] = None
+        self._propertyFilters: list[PropertyFilter] = []
+        # sort column and order requested by views
+        self._sortColumn = -1
+        self._sortOrder = Qt.SortOrder.AscendingOrder
+        # set while the source model reorders its rows
+        self._permuted = False
+
+    def setSourceModel(self, model: QAbstractItemModel):
+        old_model = self.sourceModel()
+        if old_model is not None:
+            old_model.rowsAboutToBeInserted.disconnect(self._onRowsAboutToBeInserted)
+            old_model.rowsRemoved.disconnect(self._onRowsRemoved)
+            old_model.modelReset.disconnect(self._invalidateMasks)
+            old_model.layoutChanged.disconnect(self._onLayoutChanged)
+            if isinstance(old_model, ResourceTableModel):
+                old_model.rowsPermuted.disconnect(self._onRowsPermuted)
+
+        self._invalidateMasks()
+        super().setSourceModel(model)
+
+        if model is not None:
+            model.rowsAboutToBeInserted.connect(self._onRowsAboutToBeInserted)
+            model.rowsRemoved.connect(self._onRowsRemoved)
+            model.modelReset.connect(self._invalidateMasks)
+            model.layoutChanged.connect(self._onLayoutChanged)
+            if isinstance(model, ResourceTableModel):
+                model.rowsPermuted.connect(self._onRowsPermuted)
+
     def setPrefixFilters(self, prefixes: list[str]):
         """
         Sets a list of prefixes. Each shown resource URI needs to have one of these.
@@ -29,7 +138,7 @@ class ResourceTableFilterModel(QSortFilterProxyModel):
         assert isinstance(prefixes, list)
         self.prefix_filters.clear()
         self.prefix_filters.extend(prefixes)
-        self.invalidateFilter()
+        self._updateResourceFilter()
 
     def setFileTypeFilters(self, filetypes: list[str]):
         """
@@ -40,45 +149,393 @@ class ResourceTableFilterModel(QSortFilterProxyModel):
         assert isinstance(filetypes, list)
         self.filetype_filters.clear()
         self.filetype_filters.extend(filetypes)
+        self._updateResourceFilter()
+
+    def setTextFilter(
+        self,
+        expr: QRegularExpression,
+        narrowing: bool = False,
+        fragments: Sequence[str] = (),
+    ):
+        """
+        Sets a regular expression each shown resource URI needs to match.
+        Use an empty QRegularExpression() to disable text filtering.
+        :param expr: QRegularExpression
+        :param narrowing: set True if expr can only match URIs matched by the current
+                text filter, e.g. a longer wildcard pattern. Only the rows accepted
+                so far are tested then.
+        :param fragments: substrings each URI matched by expr contains, ignoring
+                case. Only URIs containing them are tested then.
+        """
+        self._textFilter = QRegularExpression(expr)
+        model = self.sourceModel()
+        mask = bytearray()
+        if model is None or not self._hasTextFilter():
+            self._textMask = mask
+            self.invalidateFilter()
+            return
+
+        key = self._textFilterKey()
+        cached = self.textMaskCache.get(key)
+        if cached is not None and len(cached) == model.rowCount():
+            # rows tested for this filter before keep their result
+            self._textMask = cached
+            self.invalidateFilter()
+            return
+
+        if narrowing and len(self._textMask) == model.rowCount():
+            # rejected rows stay rejected
+            mask = self._textMask.translate(_RETEST_ACCEPTED)
+
+        if len(fragments) > 0 and isinstance(model, ResourceTableModel):
+            candidates = model.candidateRows(fragments)
+            if candidates is not None:
+                # rows that are no candidates cannot match
+                n = model.rowCount()
+                candidate_mask = bytearray(n)
+                if len(mask) == n:
+                    for row in candidates:
+                        candidate_mask[row] = mask[row]
+                else:
+                    for row in candidates:
+                        candidate_mask[row] = ACCEPT_UNKNOWN
+                mask = candidate_mask
+        self._textMask = mask
+        # the cached mask is completed as rows are tested
+        self.textMaskCache.insert(key, mask)
         self.invalidateFilter()
 
+    def setRanking(self, rows: Sequence[int] = None):
+        """
+        Shows only the given source rows, ordered by rank whatever the sort column.
+        Use None to disable ranking.
+        :param rows: source rows, best ranked first
+        """
+        if rows is None:
+            if self._ranks is None:
+                return
+            self._ranks = None
+        else:
+            self._ranks = {row: rank for rank, row in enumerate(rows)}
+        self.invalidate()
+        self.sort(self._sortColumn, self._sortOrder)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self._sortColumn = column
+        self._sortOrder = order
+        model = self.sourceModel()
+        if self._ranks is not None:
+            # ranked rows are ordered by lessThan(), whatever the column
+            super().sort(max(column, 0), order)
+        elif isinstance(model, ResourceTableModel):
+            # keep the order of the model, sorted with precomputed keys
+            super().sort(-1, order)
+            model.sort(column, order)
+        else:
+            super().sort(column, order)
+
+    def invalidateFilter(self):
+        # filters all rows again, which is where filtering time is spent
+        with DIAGNOSTICS.timer("filter"):
+            super().invalidateFilter()
+
+    def ranking(self) -> list[int]:
+        """
+        Returns the ranked source rows, or None if ranking is disabled.
+        """
+        if self._ranks is None:
+            return None
+        return sorted(self._ranks, key=self._ranks.__getitem__)
+
+    def setPropertyFilters(self, filters: Sequence[PropertyFilter]):
+        """
+        Sets conditions on resource properties each shown resource needs to
+        fulfil. Use an empty list [] to disable property filtering.
+        :param filters: list of PropertyFilter
+        """
+        filters = list(filters)
+        if filters == self._propertyFilters:
+            return
+        self._propertyFilters = filters
+        self.invalidateFilter()
+
+    def propertyFilters(self) -> list[PropertyFilter]:
+        return list(self._propertyFilters)
+
+    def acceptsPropertyRow(self, row: int) -> bool:
+        """
+        Returns True if the source row passes the property filters.
+        :param row: source model row
+        """
+        model = self.sourceModel()
+        if len(self._propertyFilters) == 0 or not isinstance(
+            model, ResourceTableModel
+        ):
+            return True
+        return all(
+            f.accepts(model.resourceProperty(row, f.key))
+            for f in self._propertyFilters
+        )
+
+    def _textFilterKey(self) -> tuple[str, bool]:
+        expr = self._textFilter
+        options = expr.patternOptions()
+        return (
+            expr.pattern(),
+            bool(options & QRegularExpression.PatternOption.CaseInsensitiveOption),
+        )
+
+    def _hasTextFilter(self) -> bool:
+        return len(self._textFilter.pattern()) > 0 and self._textFilter.isValid()
+
+    def textFilter(self) -> QRegularExpression:
+        return QRegularExpression(self._textFilter)
+
+    def _updateResourceFilter(self):
+        self._resourceFilter = ResourceFilter(
+            self.prefix_filters, self.filetype_filters
+        )
+        self._acceptMask = self._buildAcceptMask()
+        self.invalidateFilter()
+
+    def _buildAcceptMask(self) -> bytearray:
+        model = self.sourceModel()
+        if model is None:
+            return bytearray()
+        if isinstance(model, ResourceTableModel):
+            return self._resourceFilter.acceptMask(model.RESOURCES)
+        return bytearray([ACCEPT_UNKNOWN]) * model.rowCount()
+
+    def _invalidateMasks(self):
+        self._acceptMask = bytearray()
+        self._textMask = bytearray()
+        self.textMaskCache.clear()
+        # ranked rows do not refer to the same resources anymore
+        self._ranks = None
+
+    def _resetTextMaskCache(self):
+        # cached masks of other text filters do not follow changed source rows
+        self.textMaskCache.clear()
+        if self._hasTextFilter():
+            self.textMaskCache.insert(self._textFilterKey(), self._textMask)
+
+    def _onRowsPermuted(self, rows: list[int], n: int):
+        # row i is the former row rows[i] of n rows, the others were removed
+        if len(self._acceptMask) == n:
+            self._acceptMask = bytearray(map(self._acceptMask.__getitem__, rows))
+        if len(self._textMask) == n:
+            self._textMask = bytearray(map(self._textMask.__getitem__, rows))
+        self._resetTextMaskCache()
+        if self._ranks is not None:
+            ranks = self._ranks
+            self._ranks = {
+                row: ranks[old_row]
+                for row, old_row in enumerate(rows)
+                if old_row in ranks
+            }
+        self._permuted = True
+
+    def _onLayoutChanged(self):
+        if self._permuted:
+            # masks and ranks follow the reordered rows already
+            self._permuted = False
+        else:
+            self._invalidateMasks()
+
+    def _onRowsAboutToBeInserted(self, parent: QModelIndex, first: int, last: int):
+        # new rows are computed lazily, once they exist in the source model
+        unknown = bytearray([ACCEPT_UNKNOWN]) * (last - first + 1)
+        self._acceptMask[first:first] = unknown
+        self._textMask[first:first] = unknown
+        self._resetTextMaskCache()
+
+    def _onRowsRemoved(self, parent: QModelIndex, first: int, last: int):
+        # masks may have been rebuilt in between
+        n = self.sourceModel().rowCount()
+        for mask in (self._acceptMask, self._textMask):
+            if len(mask) != n:
+                del mask[first : last + 1]
+        self._resetTextMaskCache()
+        if self._ranks is not None:
+            count = last - first + 1
+            self._ranks = {
+                row if row < first else row - count: rank
+                for row, rank in self._ranks.items()
+                if not first <= row <= last
+            }
+
+    def _resourcePath(self, row: int) -> str:
+        model = self.sourceModel()
+        if isinstance(model, ResourceTableModel):
+            return model.RESOURCES.path(row)
+        return model.index(row, 0).data(Qt.ItemDataRole.UserRole)
+
+    def acceptsResourceRow(self, row: int) -> bool:
+        """
+        Returns True if the source row passes the prefix and filetype filters.
+        :param row: source model row
+        """
+        mask = self._acceptMask
+        if len(mask) != self.sourceModel().rowCount():
+            mask = self._acceptMask = self._buildAcceptMask()
+        accepted = mask[row]
+        if accepted == ACCEPT_UNKNOWN:
+            uri = self._resourcePath(row)
+            accepted = not uri or self._resourceFilter.accepts(uri)
+            mask[row] = accepted
+        return bool(accepted)
+
+    def acceptsTextRow(self, row: int) -> bool:
+        """
+        Returns True if the source row passes the text filter.
+        :param row: source model row
+        """
+        if not self._hasTextFilter():
+            return True
+        mask = self._textMask
+        n = self.sourceModel().rowCount()
+        if len(mask) != n:
+            mask = self._textMask = bytearray([ACCEPT_UNKNOWN]) * n
+        accepted = mask[row]
+        if accepted == ACCEPT_UNKNOWN:
+            uri = self._resourcePath(row) or ""
+            accepted = self._textFilter.match(uri).hasMatch()
+            mask[row] = accepted
+        return bool(accepted)
+
     def filterAcceptsRow(self, row: int, parent: QModelIndex) -> bool:
-        b = super().filterAcceptsRow(row, parent)
-        if b:
-            uri: str = (
-                self.sourceModel().index(row, 0, parent).data(Qt.ItemDataRole.UserRole)
-            )
-            if uri:
-                if len(self.prefix_filters) > 0:
-                    if not any(uri.startswith(f) for f in self.prefix_filters):
-                        return False
-                if len(self.filetype_filters) > 0:
-                    if not any(uri.endswith(f) for f in self.filetype_filters):
-                        return False
-        return b
+        # rows known to fail the text filter, e.g. no trigram candidates, are
+        # rejected with a single lookup, as they usually are most rows
+        mask = self._textMask
+        if row < len(mask) and mask[row] == 0:
+            return False
+        if not self.acceptsResourceRow(row):
+            return False
+        if self._ranks is not None and row not in self._ranks:
+            return False
+        if not self.acceptsPropertyRow(row):
+            return False
+        if not self.acceptsTextRow(row):
+            return False
+        return super().filterAcceptsRow(row, parent)
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        if self._ranks is not None:
+            # best ranked rows first, whatever the sort order
+            less = self._ranks.get(left.row(), -1) < self._ranks.get(right.row(), -1)
+            if self.sortOrder() == Qt.SortOrder.DescendingOrder:
+                return not less
+            return less
+        return super().lessThan(left, right)
 
 
 class ResourceTableModel(QAbstractTableModel):
     """
-    A table model to show Qt resources
+    A table model to show Qt resources.
+    The search indexes (trigram, fuzzy and similarity indexes) number resources by
+    index row, i.e. in the order they were indexed. Sorting reorders the model rows
+    only, the model maps index rows to its rows and back.
+    Removed rows keep their index row, marked as removed, so that the search indexes
+    stay valid. Index rows are numbered again once most of them are removed.
+    The trigram index is filled a chunk of rows at a time from the event loop, from
+    the first appended rows on, e.g. while a scan is running.
     """
 
-    def __init__(self, *args, load_resources: bool = True, **kwds):
+    # number of rows added to the trigram index per event loop iteration
+    TRIGRAM_CHUNK_SIZE = 500
+
+    scanStarted = pyqtSignal()
+    scanProgress = pyqtSignal(int, int)
+    scanFinished = pyqtSignal(bool)
+    resourcesUpdated = pyqtSignal(int, int)
+    hashingFinished = pyqtSignal(bool)
+    # emitted while the rows are reordered, with the former row of each row and
+    # the former number of rows. Former rows left out were removed.
+    rowsPermuted = pyqtSignal(list, int)
+
+    def __init__(
+        self,
+        *args,
+        load_resources: bool = True,
+        index_path: Path = None,
+        **kwds,
+    ):
         """
         :param args:
         :param load_resources: set False to postpone resource loading until
                 .reloadResources() is called explicitly.
+        :param index_path: file to persist the resource index in. Use None to
+                keep the resource index in memory only.
         :param kwds:
         """
         super().__init__(*args, **kwds)
 
         self.cnUri = "Path"
         self.cnIcon = "Resource"
-        self.RESOURCES = []
+        self.cnDuplicates = "Duplicates"
+        self.ciUri = 0
+        self.ciIcon = 1
+        self.ciDuplicates = 2
+        self.ciSize = 3
+        self.ciWidth = 4
+        self.ciHeight = 5
+        self.ciFormat = 6
+        self._columnNames = [
+            self.cnUri,
+            self.cnIcon,
+            self.cnDuplicates,
+            "Size",
+            "Width",
+            "Height",
+            "Format",
+        ]
+        # metadata keys of the columns showing resource properties
+        self._propertyKeys = {
+            self.ciSize: "size",
+            self.ciWidth: "width",
+            self.ciHeight: "height",
+            self.ciFormat: "format",
+        }
+        self.RESOURCES = ResourceStore()
+
+        self.thumbnailSize = QSize(16, 16)
+        self.devicePixelRatio = 1.0
+        self.thumbnailCache = ThumbnailCache(32 * 1024**2)
+        self.thumbnailRenderer = ThumbnailRenderer(self.thumbnailCache, self)
+        self.thumbnailRenderer.thumbnailReady.connect(self._onThumbnailReady)
+        self.thumbnailPlaceholder = self._createThumbnailPlaceholder()
 
         self.prefix_filters = []
         self.filetype_filters = []
 
+        self.indexPath: Path = index_path
+        self.resourceIndex = ResourceIndex()
+
+        self._scanner: ResourceScanner = None
+        self._checker: ResourceFingerprintChecker = None
+        self._scanKnown: set[str] = set()
+        self._scanSeen: set[str] = set()
+        self._scanAdded = 0
+        self._trigramIndex = TrigramIndex()
+        self._trigramTimer = QTimer(self)
+        self._trigramTimer.setInterval(0)
+        self._trigramTimer.timeout.connect(self._indexTrigramChunk)
+        self._fuzzyIndex: FuzzyIndex = None
+        self._hasher: ResourceHasher = None
+        self._digestCounts: Counter = Counter()
+        self._similarityIndex: BKTree = None
+        self._inspector: ResourceInspector = None
+        self._rowIndex: dict[str, int] = None
+        # index row of each row, and row of each index row
+        self._rowIds = array("I")
+        self._idRows = array("I")
+        # natural sort keys of path and name columns, by index row
+        self._sortKeys: dict[int, list[tuple]] = {}
+        self._sortColumn = -1
+        self._sortOrder = Qt.SortOrder.AscendingOrder
+        # column and order the rows are currently sorted by
+        self._sortedBy: tuple[int, Qt.SortOrder] = None
+
         if load_resources:
             self.reloadResources()
 
@@ -89,38 +546,768 @@ class ResourceTableModel(QAbstractTableModel):
         """
         Call this to reload all Qt resources
         """
+        self.cancelResourceScan()
+        resources = scanResources(
+            prefixes=self.prefix_filters, suffixes=self.filetype_filters
+        )
+        added, removed = self.updateResources(list(resources))
+        self._updateResourceIndex(
+            resourceFingerprint(
+                prefixes=self.prefix_filters, suffixes=self.filetype_filters
+            )
+        )
+        self.resourcesUpdated.emit(added, removed)
+
+    def updateResources(self, resources: list[str]) -> tuple[int, int]:
+        """
+        Updates the model to contain the given resources. Instead of resetting the
+        model, only the rows of removed resources are removed and new resources are
+        appended, so that selections and proxy states of unchanged rows are kept.
+        :param resources: list of resource paths
+        :return: number of added and removed resources
+        """
+        resources = self._filterResources(resources)
+        new_resources = set(resources)
+        removed_rows = [
+            row for row, r in enumerate(self.RESOURCES) if r not in new_resources
+        ]
+        self._removeResourceRows(removed_rows)
+
+        known_resources = set(self.RESOURCES)
+        added = [r for r in resources if r not in known_resources]
+        self._insertResources(added)
+        self._resort()
+        return len(added), len(removed_rows)
+
+    def loadResourceIndex(self) -> bool:
+        """
+        Loads the resources from the index file, without scanning the resource tree.
+        Use .checkResourceIndex() afterwards to rescan if the index is outdated.
+        :return: True if the index file could be loaded
+        """
+        if self.indexPath is None:
+            return False
+        resource_index = ResourceIndex.load(self.indexPath)
+        if resource_index is None:
+            return False
+
+        self.cancelResourceScan()
         self.beginResetModel()
         self.RESOURCES.clear()
-        resources = list(scanResources())
+        self.RESOURCES.extend(resource_index.paths)
+        # the loaded list is released, the index refers to the store instead
+        resource_index.paths = self.RESOURCES
+        self._rowIndex = None
+        self._resetIndexRows()
+        self._sortedBy = None
+        self.endResetModel()
+        self.resourceIndex = resource_index
+        self._resort()
+        return True
+
+    def checkResourceIndex(self):
+        """
+        Computes the resource fingerprint in background and starts a resource scan
+        if it does not match the fingerprint of the current resource index.
+        """
+        if self._checker is not None:
+            return
+        checker = ResourceFingerprintChecker(
+            self, prefixes=self.prefix_filters, suffixes=self.filetype_filters
+        )
+        checker.fingerprintReady.connect(partial(self._onFingerprintReady, checker))
+        checker.finished.connect(checker.deleteLater)
+        self._checker = checker
+        checker.start()
+
+    def _onFingerprintReady(
+        self, checker: ResourceFingerprintChecker, fingerprint: str
+    ):
+        if checker is not self._checker:
+            return
+        self._checker = None
+        if fingerprint != self.resourceIndex.fingerprint:
+            self.startResourceScan()
+
+    def _updateResourceIndex(self, fingerprint: str):
+        """
+        Replaces the resource index by the current model content and saves it.
+        Metadata are computed from resource contents, so metadata of resources
+        that still exist are only kept if the fingerprint did not change.
+        """
+        metadata = self.resourceIndex.metadata
+        if fingerprint != self.resourceIndex.fingerprint:
+            self.cancelResourceHashing()
+            self.cancelResourceInspection()
+            metadata = {}
+        self.resourceIndex = ResourceIndex(
+            fingerprint=fingerprint,
+            paths=self.RESOURCES,
+            metadata={p: metadata[p] for p in self.RESOURCES if p in metadata},
+        )
+        self._saveResourceIndex()
+
+    def _saveResourceIndex(self):
+        if self.indexPath is not None:
+            try:
+                self.resourceIndex.save(self.indexPath)
+            except OSError as err:
+                PlgLogger.log(
+                    message=f"Unable to save resource index {self.indexPath}: {err}",
+                    log_level=1,
+                )
+
+    def startResourceScan(self, chunk_size: int = 500):
+        """
+        Reloads all Qt resources without blocking the GUI thread. The resource tree
+        is walked in a ResourceScanner thread and new resources are appended
+        chunk by chunk, so the model can be used while the scan is running.
+        Resources that no longer exist are removed when the scan has finished.
+        :param chunk_size: number of resources inserted at once.
+        """
+        self.cancelResourceScan()
+
+        scanner = ResourceScanner(
+            self,
+            prefixes=self.prefix_filters,
+            suffixes=self.filetype_filters,
+            chunk_size=chunk_size,
+        )
+        scanner.chunkReady.connect(partial(self._onScanChunk, scanner))
+        scanner.progressChanged.connect(partial(self._onScanProgress, scanner))
+        scanner.finished.connect(partial(self._onScanFinished, scanner))
+        scanner.finished.connect(scanner.deleteLater)
+        self._scanner = scanner
+        self._scanKnown = set(self.RESOURCES)
+        self._scanSeen = set()
+        self._scanAdded = 0
+        self._scanStartTime = time.perf_counter()
+        self.scanStarted.emit()
+        scanner.start()
+
+    def cancelResourceScan(self, wait: bool = False):
+        """
+        Cancels a running background scan. Resources found so far are kept.
+        :param wait: set True to block until the scanner thread has stopped.
+        """
+        checker = self._checker
+        if checker is not None:
+            self._checker = None
+            if wait:
+                checker.wait()
+
+        scanner = self._scanner
+        if scanner is None:
+            return
+        self._scanner = None
+        self._scanKnown.clear()
+        self._scanSeen.clear()
+        scanner.requestInterruption()
+        if wait:
+            scanner.wait()
+        self.scanFinished.emit(False)
+
+    def isScanning(self) -> bool:
+        """
+        Returns True while a background scan is running.
+        """
+        return self._scanner is not None
+
+    def startResourceHashing(self, chunk_size: int = 500):
+        """
+        Computes the content digest and the perceptual hash of resources that miss
+        them in the resource index, in a ResourceHasher thread. Hashes are stored
+        in the resource index, so resources are hashed once per index fingerprint.
+        hashingFinished is emitted when all resources are hashed and duplicates are
+        counted.
+        :param chunk_size: number of hashed resources stored at once.
+        """
+        self.cancelResourceHashing()
+        metadata = self.resourceIndex.metadata
+        paths = [
+            p
+            for p in self.RESOURCES
+            if "digest" not in metadata.get(p, {}) or "dhash" not in metadata[p]
+        ]
+        if len(paths) == 0:
+            self._updateDuplicateCounts()
+            self.hashingFinished.emit(True)
+            return
+
+        hasher = ResourceHasher(self, paths=paths, chunk_size=chunk_size)
+        hasher.hashesReady.connect(partial(self._onHashesReady, hasher))
+        hasher.finished.connect(partial(self._onHashingFinished, hasher))
+        hasher.finished.connect(hasher.deleteLater)
+        self._hasher = hasher
+        hasher.start()
+
+    def cancelResourceHashing(self, wait: bool = False):
+        """
+        Cancels a running background hashing. Digests computed so far are kept.
+        :param wait: set True to block until the hasher thread has stopped.
+        """
+        hasher = self._hasher
+        if hasher is None:
+            return
+        self._hasher = None
+        hasher.requestInterruption()
+        if wait:
+            hasher.wait()
+        self.hashingFinished.emit(False)
+
+    def isHashing(self) -> bool:
+        """
+        Returns True while a background hashing is running.
+        """
+        return self._hasher is not None
+
+    def _onHashesReady(self, hasher: ResourceHasher, hashes: dict[str, dict]):
+        if hasher is not self._hasher:
+            return
+        metadata = self.resourceIndex.metadata
+        for path, values in hashes.items():
+            metadata.setdefault(path, {}).update(values)
+
+    def _onHashingFinished(self, hasher: ResourceHasher):
+        if hasher is not self._hasher:
+            return
+        self._hasher = None
+        self._saveResourceIndex()
+        self._updateDuplicateCounts()
+        self.hashingFinished.emit(True)
+
+    def _updateDuplicateCounts(self):
+        self._similarityIndex = None
+        metadata = self.resourceIndex.metadata
+        self._digestCounts = Counter(
+            metadata[p]["digest"]
+            for p in self.RESOURCES
+            if metadata.get(p, {}).get("digest") is not None
+        )
+        if len(self.RESOURCES) > 0:
+            self.dataChanged.emit(
+                self.index(0, self.ciDuplicates),
+                self.index(len(self.RESOURCES) - 1, self.ciDuplicates),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole],
+            )
+        if self._sortColumn == self.ciDuplicates:
+            self._sortedBy = None
+            self._resort()
+
+    def digest(self, row: int) -> str:
+        """
+        Returns the content digest of a row, or None if it is not hashed yet.
+        """
+        return self.resourceIndex.metadata.get(self.RESOURCES.path(row), {}).get(
+            "digest"
+        )
+
+    def duplicateCount(self, row: int) -> int:
+        """
+        Returns the number of other resources with the same content as a row.
+        Counts are updated when a hashing has finished.
+        """
+        digest = self.digest(row)
+        if digest is None:
+            return 0
+        return max(self._digestCounts.get(digest, 0) - 1, 0)
+
+    def duplicateRows(self, rows: Sequence[int] = None) -> list[int]:
+        """
+        Returns the rows of resources sharing their content with other resources,
+        grouped by content. Groups are ordered by their first row.
+        :param rows: optional rows to restrict the result to, e.g. search results
+        """
+        if rows is None:
+            rows = range(len(self.RESOURCES))
+        groups: dict[str, list[int]] = {}
+        for row in rows:
+            if self.duplicateCount(row) > 0:
+                groups.setdefault(self.digest(row), []).append(row)
+        return [row for group in groups.values() for row in group]
+
+    def startResourceInspection(self, chunk_size: int = 500):
+        """
+        Reads the byte size, pixel dimensions and format of resources that miss
+        them in the resource index, in a ResourceInspector thread. Only file
+        headers are read. Properties are stored in the resource index and their
+        columns are updated chunk by chunk, so the model can be sorted and
+        filtered while they fill in.
+        :param chunk_size: number of inspected resources stored at once.
+        """
+        self.cancelResourceInspection()
+        metadata = self.resourceIndex.metadata
+        paths = [p for p in self.RESOURCES if "size" not in metadata.get(p, {})]
+        if len(paths) == 0:
+            return
+
+        inspector = ResourceInspector(self, paths=paths, chunk_size=chunk_size)
+        inspector.propertiesReady.connect(partial(self._onPropertiesReady, inspector))
+        inspector.finished.connect(partial(self._onInspectionFinished, inspector))
+        inspector.finished.connect(inspector.deleteLater)
+        self._inspector = inspector
+        inspector.start()
+
+    def cancelResourceInspection(self, wait: bool = False):
+        """
+        Cancels a running background inspection. Properties read so far are kept.
+        :param wait: set True to block until the inspector thread has stopped.
+        """
+        inspector = self._inspector
+        if inspector is None:
+            return
+        self._inspector = None
+        inspector.requestInterruption()
+        if wait:
+            inspector.wait()
+
+    def isInspecting(self) -> bool:
+        """
+        Returns True while a background inspection is running.
+        """
+        return self._inspector is not None
+
+    def _onPropertiesReady(
+        self, inspector: ResourceInspector, properties: dict[str, dict]
+    ):
+        if inspector is not self._inspector:
+            return
+        metadata = self.resourceIndex.metadata
+        rows = []
+        for path, values in properties.items():
+            metadata.setdefault(path, {}).update(values)
+            row = self.resourceRow(path)
+            if row >= 0:
+                rows.append(row)
+
+        # update contiguous row ranges, so proxies filter and sort only these rows
+        # again. All roles of all columns change, as proxies may filter on any.
+        ranges = []
+        for row in sorted(rows):
+            if len(ranges) > 0 and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        last_column = self.columnCount() - 1
+        for first, last in ranges:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+
+    def _onInspectionFinished(self, inspector: ResourceInspector):
+        if inspector is not self._inspector:
+            return
+        self._inspector = None
+        self._saveResourceIndex()
+        if self._sortColumn in self._propertyKeys:
+            self._sortedBy = None
+            self._resort()
+
+    def propertyKey(self, column: int) -> str:
+        """
+        Returns the metadata key of the property shown in a column, or None if the
+        column does not show a resource property.
+        """
+        return self._propertyKeys.get(column)
+
+    def resourceProperty(self, row: int, key: str) -> Any:
+        """
+        Returns a property of a row, e.g. its "size" in bytes, its "width" and
+        "height" in pixels or its image "format".
+        :return: the property value, or None if it is not known (yet)
+        """
+        return self.resourceIndex.metadata.get(self.RESOURCES.path(row), {}).get(key)
+
+    def resourceRow(self, uri: str) -> int:
+        """
+        Returns the row of a resource, or -1 if it is not in the model.
+        """
+        if self._rowIndex is None:
+            self._rowIndex = {path: row for row, path in enumerate(self.RESOURCES)}
+        return self._rowIndex.get(uri, -1)
+
+    def perceptualHash(self, row: int) -> int:
+        """
+        Returns the perceptual hash of a row, or None if it is not an image or not
+        hashed yet.
+        """
+        return self.resourceIndex.metadata.get(self.RESOURCES.path(row), {}).get(
+            "dhash"
+        )
+
+    def similarityIndex(self) -> BKTree:
+        """
+        Returns a BK-tree of the index rows by perceptual hash. It is built on first
+        use and rebuilt once a hashing has finished or rows were removed.
+        """
+        if self._similarityIndex is None:
+            tree = BKTree()
+            for index_row, row in enumerate(self._idRows):
+                if row == _REMOVED_ROW:
+                    continue
+                h = self.perceptualHash(row)
+                if h is not None:
+                    tree.add(h, index_row)
+            self._similarityIndex = tree
+        return self._similarityIndex
+
+    def similarRows(self, row: int, max_distance: int = 8) -> list[tuple[int, int]]:
+        """
+        Returns the rows of images that look alike the image of a row, i.e. whose
+        perceptual hashes differ by at most max_distance of 64 bits.
+        :return: list of (row, distance) tuples, most similar first, without row
+        """
+        h = self.perceptualHash(row)
+        if h is None:
+            return []
+        id_rows = self._idRows
+        return [
+            (id_rows[other], d)
+            for d, other in self.similarityIndex().search(h, max_distance)
+            if id_rows[other] not in (row, _REMOVED_ROW)
+        ]
+
+    def appendResources(self, resources: list[str]):
+        """
+        Appends resources to the end of the model.
+        :param resources: list of resource paths
+        """
+        self._insertResources(self._filterResources(resources))
+
+    def setResourceFilters(self, prefixes: list[str], filetypes: list[str]) -> bool:
+        """
+        Sets the prefixes and filetypes (or suffixes) resources are scanned for.
+        Sub-directories that cannot contain matching resources are not scanned.
+        Use empty lists [] to scan all resources.
+        :param prefixes: List[str]
+        :param filetypes: List[str]
+        :return: True if the filters changed, i.e. if resources need to be reloaded
+        """
+        assert isinstance(prefixes, list)
+        assert isinstance(filetypes, list)
+        if prefixes == self.prefix_filters and filetypes == self.filetype_filters:
+            return False
+        self.prefix_filters = list(prefixes)
+        self.filetype_filters = list(filetypes)
+        return True
+
+    def trigramIndex(self) -> TrigramIndex:
+        """
+        Returns the trigram index of the resource paths, by index row. Appended rows
+        are indexed in chunks from the event loop; the rows not indexed yet are
+        indexed now.
+        """
+        self._indexTrigramChunk(len(self._idRows))
+        return self._trigramIndex
+
+    def _indexTrigramChunk(self, size: int = None):
+        # removed rows are indexed as empty paths, to keep the index rows
+        index = self._trigramIndex
+        id_rows = self._idRows
+        first = len(index)
+        last = min(first + (size or self.TRIGRAM_CHUNK_SIZE), len(id_rows))
+        store = self.RESOURCES
+        index.extend(
+            "" if id_rows[i] == _REMOVED_ROW else store.path(id_rows[i])
+            for i in range(first, last)
+        )
+        if last >= len(id_rows):
+            self._trigramTimer.stop()
+
+    def fuzzyIndex(self) -> FuzzyIndex:
+        """
+        Returns the fuzzy search index of the resource basenames, by index row.
+        It is built on first use and kept up to date by appended resources.
+        """
+        if self._fuzzyIndex is None or len(self._fuzzyIndex) != len(self._idRows):
+            store = self.RESOURCES
+            self._fuzzyIndex = FuzzyIndex(
+                "" if row == _REMOVED_ROW else store.name(row) for row in self._idRows
+            )
+        return self._fuzzyIndex
+
+    def candidateRows(self, fragments: Sequence[str]) -> list[int]:
+        """
+        Returns the rows whose path may contain all fragments, ignoring case, as
+        found by the trigram index. Rows not indexed yet are all candidates.
+        :return: sorted candidate rows, or None if the fragments are too short to
+                 exclude any row
+        """
+        index = self._trigramIndex
+        candidates = index.candidates(fragments)
+        if candidates is None:
+            return None
+        id_rows = self._idRows
+        candidates.extend(range(len(index), len(id_rows)))
+        return sorted(
+            id_rows[index_row]
+            for index_row in candidates
+            if id_rows[index_row] != _REMOVED_ROW
+        )
+
+    def fuzzySearch(
+        self, query: str, limit: int = 100, accept: Callable[[int], bool] = None
+    ) -> list[tuple[int, int]]:
+        """
+        Returns the rows whose basename contains the query as a subsequence,
+        ignoring case, ordered by decreasing score. See FuzzyIndex.search().
+        :param accept: optional function returning False for rows to skip
+        :return: list of (row, score) tuples
+        """
+        id_rows = self._idRows
+
+        def accept_index_row(index_row: int) -> bool:
+            row = id_rows[index_row]
+            return row != _REMOVED_ROW and (accept is None or accept(row))
+
+        results = self.fuzzyIndex().search(query, limit, accept_index_row)
+        return [(id_rows[index_row], score) for index_row, score in results]
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """
+        Sorts the rows by a column. Rows are ordered by precomputed sort keys in a
+        single sorted() call, without comparing model data: paths and names in
+        natural order, duplicate counts and properties by value, unknown values
+        first. The rows are reordered, so proxies can keep the model order.
+        Rows appended by a scan are sorted once the scan has finished, rows whose
+        duplicates or properties changed once hashing or inspection has finished.
+        """
+        self._sortColumn = column
+        self._sortOrder = order
+        if column < 0 or (column, order) == self._sortedBy:
+            return
+        with DIAGNOSTICS.timer("sort"):
+            keys = self._rowSortKeys(column)
+            if keys is None:
+                return
+            rows = sorted(
+                range(len(keys)),
+                key=keys.__getitem__,
+                reverse=order == Qt.SortOrder.DescendingOrder,
+            )
+            self._sortedBy = (column, order)
+            if rows != list(range(len(rows))):
+                self._permuteRows(rows)
 
+    def _resort(self):
+        # sorts rows again by the last sort column, if they may be out of order
+        if self._sortColumn >= 0:
+            self.sort(self._sortColumn, self._sortOrder)
+
+    def _rowSortKeys(self, column: int) -> list:
+        store = self.RESOURCES
+        n = len(store)
+        if column in (self.ciUri, self.ciIcon):
+            # natural sort keys are costly, they are kept by index row
+            keys = self._sortKeys.setdefault(column, [])
+            text = store.path if column == self.ciUri else store.name
+            id_rows = self._idRows
+            for index_row in range(len(keys), len(id_rows)):
+                row = id_rows[index_row]
+                keys.append(() if row == _REMOVED_ROW else naturalSortKey(text(row)))
+            return [keys[index_row] for index_row in self._rowIds]
+        if column == self.ciDuplicates:
+            return [self.duplicateCount(row) for row in range(n)]
+        key = self._propertyKeys.get(column)
+        if key is None:
+            return None
+        unknown = (0, "" if key == "format" else 0)
+        values = (self.resourceProperty(row, key) for row in range(n))
+        return [unknown if v is None else (1, v) for v in values]
+
+    def _permuteRows(self, rows: list[int]):
+        # row i becomes the former row rows[i]
+        hint = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+        self.layoutAboutToBeChanged.emit([], hint)
+        new_rows = [0] * len(rows)
+        for row, old_row in enumerate(rows):
+            new_rows[old_row] = row
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[idx.row()], idx.column()) for idx in old_indexes],
+        )
+        self.RESOURCES.permute(rows)
+        self._rowIds = array("I", [self._rowIds[old_row] for old_row in rows])
+        for row, index_row in enumerate(self._rowIds):
+            self._idRows[index_row] = row
+        self._rowIndex = None
+        self.rowsPermuted.emit(rows, len(rows))
+        self.layoutChanged.emit([], hint)
+
+    def _resetIndexRows(self):
+        # search indexes are rebuilt from the current row order
+        self._rowIds = array("I", range(len(self.RESOURCES)))
+        self._idRows = array("I", self._rowIds)
+        self._sortKeys.clear()
+        self._trigramIndex = TrigramIndex()
+        self._fuzzyIndex = None
+        self._similarityIndex = None
+        self._trigramTimer.start()
+
+    def _filterResources(self, resources: list[str]) -> list[str]:
         # filter available resource domains and file types
-        if len(self.prefix_filters) > 0:
-            resources = [
-                f for r in resources for f in self.prefix_filters if r.startswith(f)
-            ]
-        if len(self.filetype_filters) > 0:
-            resources = [
-                f for r in resources for f in self.prefix_filters if r.endswith(f)
-            ]
+        if len(self.prefix_filters) == 0 and len(self.filetype_filters) == 0:
+            return resources
+        prefixes = tuple(self.prefix_filters)
+        suffixes = tuple(self.filetype_filters)
+        return [r for r in resources if acceptsResource(r, prefixes, suffixes)]
 
+    def _insertResources(self, resources: list[str]):
+        if len(resources) == 0:
+            return
+        first = len(self.RESOURCES)
+        self.beginInsertRows(QModelIndex(), first, first + len(resources) - 1)
         self.RESOURCES.extend(resources)
-        self.endResetModel()
+        if self._fuzzyIndex is not None:
+            self._fuzzyIndex.extend(r[r.rfind("/") + 1 :] for r in resources)
+        if self._rowIndex is not None:
+            self._rowIndex.update((r, first + i) for i, r in enumerate(resources))
+        # appended rows get the next index rows
+        first_id = len(self._idRows)
+        self._rowIds.extend(range(first_id, first_id + len(resources)))
+        self._idRows.extend(range(first, first + len(resources)))
+        self._trigramTimer.start()
+        self._sortedBy = None
+        self.endInsertRows()
+
+    def _removeResourceRows(self, rows: list[int]):
+        rows = sorted(set(rows))
+        if len(rows) == 0:
+            return
+        removed_ids = [self._rowIds[row] for row in rows]
+        first, last = rows[0], rows[-1]
+        if last - first + 1 == len(rows):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self.RESOURCES.removeRows(first, last)
+            del self._rowIds[first : last + 1]
+            self._rowIndex = None
+            self.endRemoveRows()
+        else:
+            # scattered rows are removed at once as a layout change, instead of
+            # rebuilding the store once per row range
+            self.layoutAboutToBeChanged.emit()
+            removed = set(rows)
+            kept = [row for row in range(len(self.RESOURCES)) if row not in removed]
+            new_rows = [-1] * len(self.RESOURCES)
+            for row, old_row in enumerate(kept):
+                new_rows[old_row] = row
+            old_indexes = self.persistentIndexList()
+            self.changePersistentIndexList(
+                old_indexes,
+                [
+                    (
+                        self.index(new_rows[idx.row()], idx.column())
+                        if new_rows[idx.row()] >= 0
+                        else QModelIndex()
+                    )
+                    for idx in old_indexes
+                ],
+            )
+            n = len(self.RESOURCES)
+            self.RESOURCES.removeRowSet(removed)
+            self._rowIds = array("I", [self._rowIds[old_row] for old_row in kept])
+            self._rowIndex = None
+            self.rowsPermuted.emit(kept, n)
+            self.layoutChanged.emit()
+
+        # removed rows keep their index rows, so search indexes stay valid
+        id_rows = self._idRows
+        for index_row in removed_ids:
+            id_rows[index_row] = _REMOVED_ROW
+        for row, index_row in enumerate(self._rowIds):
+            id_rows[index_row] = row
+        if 2 * len(self._rowIds) < len(id_rows):
+            self._resetIndexRows()
+
+    def _onScanChunk(self, scanner: ResourceScanner, resources: list[str]):
+        # ignore chunks still queued by a cancelled scanner
+        if scanner is not self._scanner:
+            return
+        self._scanSeen.update(resources)
+        added = [r for r in resources if r not in self._scanKnown]
+        self._scanKnown.update(added)
+        self._scanAdded += len(added)
+        self._insertResources(added)
+
+    def _onScanProgress(self, scanner: ResourceScanner, done: int, total: int):
+        if scanner is self._scanner:
+            self.scanProgress.emit(done, total)
+
+    def _onScanFinished(self, scanner: ResourceScanner):
+        if scanner is not self._scanner:
+            return
+        self._scanner = None
+        removed_rows = [
+            row for row, r in enumerate(self.RESOURCES) if r not in self._scanSeen
+        ]
+        self._removeResourceRows(removed_rows)
+        self._scanKnown.clear()
+        self._scanSeen.clear()
+        self._updateResourceIndex(scanner.fingerprint)
+        self._resort()
+        if DIAGNOSTICS.enabled:
+            DIAGNOSTICS.record("scan", time.perf_counter() - self._scanStartTime)
+            DIAGNOSTICS.count("scan_resources", len(self.RESOURCES))
+        self.scanFinished.emit(True)
+        self.resourcesUpdated.emit(self._scanAdded, len(removed_rows))
+
+    def setThumbnailSize(self, size: QSize, device_pixel_ratio: float = 1.0):
+        """
+        Sets the size of the thumbnails returned for the DecorationRole.
+        :param size: thumbnail size, in device independent pixels
+        :param device_pixel_ratio: device pixel ratio of the view showing thumbnails
+        """
+        if size == self.thumbnailSize and device_pixel_ratio == self.devicePixelRatio:
+            return
+        self.thumbnailSize = QSize(size)
+        self.devicePixelRatio = device_pixel_ratio
+        self.thumbnailPlaceholder = self._createThumbnailPlaceholder()
+        if len(self.RESOURCES) > 0:
+            self.dataChanged.emit(
+                self.index(0, self.ciIcon),
+                self.index(len(self.RESOURCES) - 1, self.ciIcon),
+                [Qt.ItemDataRole.DecorationRole],
+            )
+
+    def _createThumbnailPlaceholder(self) -> QPixmap:
+        # a transparent pixmap, so that rows keep their layout until rendered
+        pixmap = QPixmap(self.thumbnailSize * self.devicePixelRatio)
+        pixmap.setDevicePixelRatio(self.devicePixelRatio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+
+    def cancelThumbnails(self, visible_rows: list[int]):
+        """
+        Cancels the waiting thumbnail renderings, except for the visible rows.
+        :param visible_rows: rows currently shown in a view
+        """
+        n = len(self.RESOURCES)
+        self.thumbnailRenderer.cancel(
+            self.RESOURCES.path(row) for row in visible_rows if 0 <= row < n
+        )
+
+    def _onThumbnailReady(self, uri: str, row: int):
+        if not (0 <= row < len(self.RESOURCES) and self.RESOURCES.path(row) == uri):
+            # rows have moved since the request, e.g. sorted
+            row = self.resourceRow(uri)
+        if row >= 0:
+            idx = self.index(row, self.ciIcon)
+            self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DecorationRole])
 
     def columnCount(self, parent: QModelIndex = ...) -> int:
-        return 2
+        return len(self._columnNames)
 
     def rowCount(self, parent: QModelIndex = ...) -> int:
         return len(self.RESOURCES)
 
     def columnNames(self) -> list[str]:
-        return [self.cnUri, self.cnIcon]
+        return list(self._columnNames)
 
     def headerData(
         self, section: int, orientation: Qt.Orientation, role: int = ...
     ) -> Any:
         if role == Qt.ItemDataRole.DisplayRole:
             if orientation == Qt.Orientation.Horizontal:
-                return self.columnNames()[section]
+                return self._columnNames[section]
 
         if (
             role == Qt.ItemDataRole.TextAlignmentRole
@@ -128,29 +1315,69 @@ class ResourceTableModel(QAbstractTableModel):
         ):
             return Qt.AlignmentFlag.AlignRight
 
+        if (
+            role == Qt.ItemDataRole.ToolTipRole
+            and orientation == Qt.Orientation.Horizontal
+            and section in (self.ciWidth, self.ciHeight)
+        ):
+            return self.tr("Intrinsic size in pixels, the viewBox size for SVGs")
+
         return super().headerData(section, orientation, role)
 
     def data(self, index: QModelIndex, role: int = ...) -> Any:
         if not index.isValid():
             return None
 
-        uri = self.RESOURCES[index.row()]
-        cn = self.columnNames()[index.column()]
+        row = index.row()
+        column = index.column()
 
         if role == Qt.ItemDataRole.DisplayRole:
-            if cn == self.cnUri:
-                return uri
+            if column == self.ciUri:
+                return self.RESOURCES.path(row)
+            elif column == self.ciDuplicates:
+                n = self.duplicateCount(row)
+                return n if n > 0 else None
+            elif column in self._propertyKeys:
+                value = self.resourceProperty(row, self._propertyKeys[column])
+                if value is None:
+                    return None
+                if column == self.ciSize:
+                    return QLocale().formattedDataSize(value)
+                if column == self.ciFormat:
+                    return value.upper()
+                return value
             else:
-                return os.path.basename(uri)
+                return self.RESOURCES.name(row)
         if role == Qt.ItemDataRole.DecorationRole:
-            if cn == self.cnIcon:
-                return QIcon(uri)
+            if column == self.ciIcon:
+                pixmap = self.thumbnailRenderer.thumbnail(
+                    self.RESOURCES.path(row),
+                    self.thumbnailSize,
+                    self.devicePixelRatio,
+                    row,
+                )
+                if pixmap is None:
+                    return self.thumbnailPlaceholder
+                if not pixmap.isNull():
+                    return pixmap
 
         if role == Qt.ItemDataRole.ToolTipRole:
-            if cn == self.cnUri:
-                return uri
+            if column == self.ciUri:
+                return self.RESOURCES.path(row)
+            if column == self.ciDuplicates and self.duplicateCount(row) > 0:
+                return self.tr("Same content as {} other resources").format(
+                    self.duplicateCount(row)
+                )
+            if column == self.ciSize:
+                size = self.resourceProperty(row, "size")
+                if size is not None:
+                    return self.tr("{} bytes").format(size)
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (self.ciSize, self.ciWidth, self.ciHeight):
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
 
         if role == Qt.ItemDataRole.UserRole:
-            return uri
+            return self.RESOURCES.path(row)
 
         return None
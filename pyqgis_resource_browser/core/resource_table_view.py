@@ -1,7 +1,7 @@
 import os
 
-from qgis.PyQt.QtCore import QModelIndex, Qt
-from qgis.PyQt.QtGui import QContextMenuEvent, QPixmap
+from qgis.PyQt.QtCore import QAbstractProxyModel, QModelIndex, Qt, pyqtSignal
+from qgis.PyQt.QtGui import QContextMenuEvent, QPixmap, QResizeEvent
 from qgis.PyQt.QtWidgets import QApplication, QMenu, QTableView
 
 
@@ -10,8 +10,43 @@ class ResourceTableView(QTableView):
     A table view to visualize Qt resources
     """
 
+    # emitted with the source model rows shown in the viewport, when they change
+    viewportRowsChanged = pyqtSignal(list)
+    # emitted when the user asks to export the selected or shown icons
+    exportIconsRequested = pyqtSignal()
+
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
+        self.verticalScrollBar().valueChanged.connect(self.emitViewportRows)
+
+    def visibleSourceRows(self) -> list[int]:
+        """
+        Returns the source model rows currently shown in the viewport.
+        """
+        model = self.model()
+        if model is None:
+            return []
+        first = self.rowAt(0)
+        if first < 0:
+            return []
+        last = self.rowAt(self.viewport().height() - 1)
+        if last < 0:
+            last = model.rowCount() - 1
+
+        rows = []
+        for row in range(first, last + 1):
+            idx = model.index(row, 0)
+            if isinstance(model, QAbstractProxyModel):
+                idx = model.mapToSource(idx)
+            rows.append(idx.row())
+        return rows
+
+    def emitViewportRows(self):
+        self.viewportRowsChanged.emit(self.visibleSourceRows())
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self.emitViewportRows()
 
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
         idx = self.indexAt(event.pos())
@@ -34,6 +69,10 @@ class ResourceTableView(QTableView):
                 lambda *args, n=uri: QApplication.clipboard().setPixmap(QPixmap(n))
             )
 
+            m.addSeparator()
+            a = m.addAction(self.tr("Export icons..."))
+            a.triggered.connect(lambda *args: self.exportIconsRequested.emit())
+
             m.exec(event.globalPos())
 
         pass
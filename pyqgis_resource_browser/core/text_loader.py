@@ -0,0 +1,139 @@
+import codecs
+import copy
+import re
+import time
+from collections.abc import Callable, Iterator
+
+from qgis.PyQt.QtCore import QFile, QThread, pyqtSignal
+
+from .diagnostics import DIAGNOSTICS
+
+_TEXT_RESOURCE = re.compile(r"\.(svg|html|xml|txt|js|css)$", re.I)
+
+
+def isTextResource(uri: str) -> bool:
+    """
+    Returns True if a resource can be previewed as text, judging by its extension.
+    """
+    return _TEXT_RESOURCE.search(uri) is not None
+
+
+def createTextDecoder(head: bytes) -> codecs.IncrementalDecoder:
+    """
+    Returns an incremental decoder for a text starting with head. UTF-16 is
+    detected by its byte order mark, anything else is decoded as UTF-8 without
+    its optional byte order mark. Invalid bytes are replaced.
+    """
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = "utf-16"
+    else:
+        encoding = "utf-8-sig"
+    return codecs.getincrementaldecoder(encoding)(errors="replace")
+
+
+class TextReader:
+    """
+    Reads a text resource in chunks. Bytes are decoded incrementally and the
+    position is kept, so reading can continue later where it stopped, even within
+    a multi-byte character. Can be used outside the GUI thread.
+    """
+
+    def __init__(self, uri: str):
+        self.uri = uri
+        # position to continue reading from, in bytes
+        self.offset = 0
+        # total size of the resource, in bytes, known once read
+        self.size = -1
+        self.decoder: codecs.IncrementalDecoder = None
+
+    def atEnd(self) -> bool:
+        """
+        Returns True if the whole resource has been read.
+        """
+        return 0 <= self.size <= self.offset
+
+    def copy(self) -> "TextReader":
+        """
+        Returns an independent reader continuing from the same position.
+        """
+        reader = copy.copy(self)
+        reader.decoder = copy.copy(self.decoder)
+        return reader
+
+    def read(
+        self,
+        max_bytes: int,
+        chunk_size: int = 64 * 1024,
+        interrupted: Callable[[], bool] = None,
+    ) -> Iterator[str]:
+        """
+        Reads and decodes up to max_bytes from the current position.
+        :param max_bytes: maximum number of bytes to read.
+        :param chunk_size: number of bytes decoded per yielded text.
+        :param interrupted: optional function returning True to stop reading.
+        :return: iterator over the decoded texts.
+        """
+        file = QFile(self.uri)
+        if not file.open(QFile.OpenModeFlag.ReadOnly):
+            self.size = 0
+            return
+        try:
+            self.size = file.size()
+            end = min(self.size, self.offset + max_bytes)
+            file.seek(self.offset)
+            while self.offset < end:
+                if interrupted is not None and interrupted():
+                    return
+                data = bytes(file.read(min(chunk_size, end - self.offset)))
+                if len(data) == 0:
+                    self.size = self.offset
+                    break
+                if self.decoder is None:
+                    self.decoder = createTextDecoder(data)
+                self.offset += len(data)
+                text = self.decoder.decode(data, self.atEnd())
+                if len(text) > 0:
+                    yield text.replace("\r\n", "\n")
+        finally:
+            file.close()
+
+
+class TextLoader(QThread):
+    """
+    A thread that reads a text resource with a TextReader off the GUI thread and
+    reports its text in chunks, up to a maximum number of bytes.
+    """
+
+    chunkReady = pyqtSignal(str)
+
+    def __init__(
+        self,
+        *args,
+        reader: TextReader = None,
+        max_bytes: int = 256 * 1024,
+        chunk_size: int = 64 * 1024,
+        **kwds,
+    ):
+        """
+        :param args:
+        :param reader: reader of the text resource, possibly continuing a
+                previous load.
+        :param max_bytes: maximum number of bytes to read.
+        :param chunk_size: number of bytes decoded per chunkReady signal.
+        :param kwds:
+        """
+        super().__init__(*args, **kwds)
+        self.reader = reader
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+
+    def run(self):
+        start = time.perf_counter()
+        offset = self.reader.offset
+        for text in self.reader.read(
+            self.max_bytes, self.chunk_size, self.isInterruptionRequested
+        ):
+            self.chunkReady.emit(text)
+        if DIAGNOSTICS.enabled:
+            DIAGNOSTICS.record("text_load", time.perf_counter() - start)
+            DIAGNOSTICS.count("text_load_bytes", self.reader.offset - offset)
@@ -0,0 +1,69 @@
+from qgis.PyQt.QtCore import QSize, Qt
+from qgis.PyQt.QtGui import QImage, QImageReader, QPixmap
+
+from .lru_cache import LRUCache
+
+
+def renderThumbnail(uri: str, size: QSize) -> QImage:
+    """
+    Renders an image resource into a QImage that fits into size, keeping its
+    aspect ratio. Only the requested size is rasterized, which is much cheaper than
+    rendering SVGs at their intrinsic size. Can be called outside the GUI thread.
+    :return: the rendered image, or a null QImage if the resource is not an image.
+    """
+    reader = QImageReader(uri)
+    if not reader.canRead():
+        return QImage()
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(
+            source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+    return reader.read()
+
+
+def pixmapCost(pixmap: QPixmap) -> int:
+    """
+    Returns the memory used by a pixmap, in bytes. Null pixmaps cost a small
+    constant, so caching non-image resources stays bounded too.
+    """
+    return max(64, pixmap.width() * pixmap.height() * max(pixmap.depth(), 1) // 8)
+
+
+class ThumbnailCache(LRUCache):
+    """
+    A size-bounded LRU cache of rendered thumbnails, keyed by resource path,
+    thumbnail size and device pixel ratio.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        :param max_bytes: memory budget of the cached thumbnails, in bytes
+        """
+        super().__init__(max_cost=max_bytes, cost=pixmapCost)
+
+    @staticmethod
+    def key(uri: str, size: QSize, device_pixel_ratio: float = 1.0) -> tuple:
+        """
+        Returns the cache key of a thumbnail.
+        """
+        return uri, size.width(), size.height(), device_pixel_ratio
+
+    def thumbnail(
+        self, uri: str, size: QSize, device_pixel_ratio: float = 1.0
+    ) -> QPixmap:
+        """
+        Returns the thumbnail of a resource, rendering and caching it if needed.
+        :param uri: resource path
+        :param size: thumbnail size, in device independent pixels
+        :param device_pixel_ratio: ratio of physical to device independent pixels
+        :return: the thumbnail, or a null QPixmap if the resource is not an image.
+        """
+        key = self.key(uri, size, device_pixel_ratio)
+        pixmap = self.get(key)
+        if pixmap is None:
+            image = renderThumbnail(uri, size * device_pixel_ratio)
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            self.insert(key, pixmap)
+        return pixmap
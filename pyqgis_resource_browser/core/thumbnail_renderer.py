@@ -0,0 +1,118 @@
+from collections.abc import Iterable
+
+from qgis.PyQt.QtCore import QObject, QRunnable, QSize, QThreadPool, pyqtSignal
+from qgis.PyQt.QtGui import QImage, QPixmap
+
+from .diagnostics import DIAGNOSTICS
+from .thumbnail_cache import ThumbnailCache, renderThumbnail
+
+
+class _ThumbnailJobSignals(QObject):
+    rendered = pyqtSignal(object, object, int)
+
+
+class ThumbnailJob(QRunnable):
+    """
+    Renders a single thumbnail into a QImage, outside the GUI thread.
+    """
+
+    def __init__(
+        self,
+        key: tuple,
+        uri: str,
+        size: QSize,
+        row: int,
+        signals: _ThumbnailJobSignals,
+    ):
+        super().__init__()
+        # the job is owned by the ThumbnailRenderer, so it can be taken back from
+        # the thread pool while it is waiting
+        self.setAutoDelete(False)
+        self.key = key
+        self.uri = uri
+        self.size = size
+        self.row = row
+        self.signals = signals
+
+    def run(self):
+        with DIAGNOSTICS.timer("thumbnail_render"):
+            image: QImage = renderThumbnail(self.uri, self.size)
+        self.signals.rendered.emit(self.key, image, self.row)
+
+
+class ThumbnailRenderer(QObject):
+    """
+    Renders thumbnails on a thread pool and stores them into a ThumbnailCache.
+    Requests that are not rendered yet return None, so that a placeholder can be
+    shown meanwhile. The most recent requests are rendered first, and waiting
+    requests can be cancelled, e.g. when their rows scrolled out of the viewport.
+    """
+
+    thumbnailReady = pyqtSignal(str, int)
+
+    def __init__(self, cache: ThumbnailCache, *args, **kwds):
+        super().__init__(*args, **kwds)
+        self.cache = cache
+        self.pool = QThreadPool(self)
+        self._signals = _ThumbnailJobSignals(self)
+        self._signals.rendered.connect(self._onRendered)
+        self._pending: dict[tuple, ThumbnailJob] = {}
+        self._priority = 0
+
+    def thumbnail(
+        self, uri: str, size: QSize, device_pixel_ratio: float = 1.0, row: int = -1
+    ) -> QPixmap:
+        """
+        Returns the cached thumbnail of a resource, or schedules its rendering.
+        :param uri: resource path
+        :param size: thumbnail size, in device independent pixels
+        :param device_pixel_ratio: ratio of physical to device independent pixels
+        :param row: model row of the resource, sent back with thumbnailReady
+        :return: the thumbnail (a null QPixmap if the resource is not an image),
+                 or None if it is not rendered yet.
+        """
+        key = self.cache.key(uri, size, device_pixel_ratio)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        if key not in self._pending:
+            job = ThumbnailJob(key, uri, size * device_pixel_ratio, row, self._signals)
+            self._pending[key] = job
+            self._priority += 1
+            self.pool.start(job, self._priority)
+        return None
+
+    def isPending(self, uri: str) -> bool:
+        """
+        Returns True if a thumbnail of the resource is waiting or being rendered.
+        """
+        return any(job.uri == uri for job in self._pending.values())
+
+    def cancel(self, keep: Iterable[str] = ()):
+        """
+        Cancels the waiting requests, except the ones for the resources to keep.
+        Requests whose rendering already started are not interrupted.
+        :param keep: resource paths whose requests are kept
+        """
+        keep = set(keep)
+        for key, job in list(self._pending.items()):
+            if job.uri not in keep and self.pool.tryTake(job):
+                del self._pending[key]
+
+    def stop(self):
+        """
+        Cancels all waiting requests and waits for the running ones to finish.
+        """
+        self.cancel()
+        self.pool.waitForDone()
+
+    def _onRendered(self, key: tuple, image: QImage, row: int):
+        job = self._pending.pop(key, None)
+        if job is None:
+            return
+        uri, width, height, device_pixel_ratio = key
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self.cache.insert(key, pixmap)
+        self.thumbnailReady.emit(job.uri, row)
@@ -0,0 +1,81 @@
+import re
+from array import array
+from collections.abc import Iterable, Sequence
+
+# characters with a special meaning in wildcard patterns, or escaping one
+_WILDCARD_SPECIALS = re.compile(r"\[[^\]]*\]?|[*?\\]")
+
+
+def wildcardFragments(pattern: str) -> list[str]:
+    """
+    Returns the literal substrings of a wildcard pattern, i.e. the substrings every
+    string matched by the pattern contains.
+    """
+    return [f for f in _WILDCARD_SPECIALS.split(pattern) if f != ""]
+
+
+def trigrams(s: str) -> set[str]:
+    """
+    Returns the distinct substrings of length 3 of s.
+    """
+    return {s[i : i + 3] for i in range(len(s) - 2)}
+
+
+class TrigramIndex:
+    """
+    An inverted index of the trigrams of lowercase resource paths. It returns the
+    rows that contain all trigrams of a query by intersecting posting lists, so
+    that a substring search only needs to verify a few candidate rows instead of
+    matching every path.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._postings: dict[str, array] = {}
+        self._size = 0
+        self.extend(paths)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def clear(self):
+        self._postings.clear()
+        self._size = 0
+
+    def extend(self, paths: Iterable[str]):
+        """
+        Indexes paths as rows following the already indexed ones.
+        """
+        postings = self._postings
+        row = self._size
+        for path in paths:
+            for trigram in trigrams(path.lower()):
+                posting = postings.get(trigram)
+                if posting is None:
+                    posting = postings[trigram] = array("I")
+                posting.append(row)
+            row += 1
+        self._size = row
+
+    def candidates(self, fragments: Sequence[str]) -> list[int]:
+        """
+        Returns the rows whose path contains the trigrams of all fragments,
+        ignoring case. Candidates still need to be verified against the query.
+        :param fragments: substrings each matching path contains
+        :return: sorted candidate rows, or None if the fragments are too short to
+                 exclude any row
+        """
+        query = set()
+        for fragment in fragments:
+            query.update(trigrams(fragment.lower()))
+        if len(query) == 0:
+            return None
+
+        postings = sorted(
+            (self._postings.get(trigram, array("I")) for trigram in query), key=len
+        )
+        rows = set(postings[0])
+        for posting in postings[1:]:
+            if len(rows) == 0:
+                break
+            rows.intersection_update(posting)
+        return sorted(rows)
@@ -91,6 +91,12 @@ class ConfigOptionsPage(QgsOptionsPageWidget):
         settings.filter_filetypes = self.gb_filter_resourcefiletype.isChecked()
         settings.filter_prefixes = self.gb_filter_resourceprefix.isChecked()
 
+        # performance
+        settings.resource_index_cache = self.opt_resource_index_cache.isChecked()
+        settings.resource_catalog = self.opt_resource_catalog.isChecked()
+        settings.thumbnail_cache_size = self.sb_thumbnail_cache_size.value()
+        settings.text_preview_max_size = self.sb_text_preview_max_size.value()
+
         # dump new settings into QgsSettings
         self.plg_settings.save_from_object(settings)
 
@@ -116,6 +122,12 @@ class ConfigOptionsPage(QgsOptionsPageWidget):
         self.te_resource_prefixes.setPlainText("\n".join(settings.prefix_filters))
         self.te_resource_filetypes.setPlainText("\n".join(settings.filetype_filters))
 
+        # performance
+        self.opt_resource_index_cache.setChecked(settings.resource_index_cache)
+        self.opt_resource_catalog.setChecked(settings.resource_catalog)
+        self.sb_thumbnail_cache_size.setValue(settings.thumbnail_cache_size)
+        self.sb_text_preview_max_size.setValue(settings.text_preview_max_size)
+
     def reset_settings(self):
         """Reset settings to default values (set in preferences.py module)."""
         default_settings = PlgSettingsStructure()
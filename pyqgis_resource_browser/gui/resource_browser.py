@@ -1,6 +1,5 @@
 # standard lib
 import os
-import re
 from functools import partial
 from pathlib import Path
 from typing import Literal
@@ -10,27 +9,35 @@ from qgis.PyQt import uic
 from qgis.PyQt.QtCore import (
     QFile,
     QModelIndex,
+    QPersistentModelIndex,
     QRegularExpression,
+    QSize,
     Qt,
-    QTextStream,
+    QTimer,
     pyqtSignal,
 )
-from qgis.PyQt.QtGui import QContextMenuEvent, QPixmap
+from qgis.PyQt.QtGui import QCloseEvent, QContextMenuEvent, QShowEvent, QTextCursor
 
 try:
     from PyQt6.QtSvgWidgets import QGraphicsSvgItem  # noqa: QGS103
 except ImportError:
     from qgis.PyQt.QtSvg import QGraphicsSvgItem
 
+from qgis.PyQt.QtSvg import QSvgRenderer
 from qgis.PyQt.QtWidgets import (
     QAction,
     QApplication,
+    QFileDialog,
     QGraphicsPixmapItem,
     QGraphicsScene,
     QGraphicsView,
     QLabel,
     QLineEdit,
     QMenu,
+    QPlainTextEdit,
+    QProgressBar,
+    QPushButton,
+    QStyle,
     QTextBrowser,
     QToolButton,
     QWidget,
@@ -41,22 +48,39 @@ from qgis.utils import iface
 
 # plugin
 from pyqgis_resource_browser.__about__ import __title__
+from pyqgis_resource_browser.core.diagnostics import DIAGNOSTICS
+from pyqgis_resource_browser.core.icon_export import IconExporter
+from pyqgis_resource_browser.core.preview_cache import PreviewCache
+from pyqgis_resource_browser.core.preview_prefetcher import PreviewPrefetcher
+from pyqgis_resource_browser.core.resource_catalog import ResourceCatalog
+from pyqgis_resource_browser.core.resource_catalog_model import ResourceCatalogModel
+from pyqgis_resource_browser.core.resource_index import defaultIndexPath
+from pyqgis_resource_browser.core.resource_properties import parsePropertyFilters
 from pyqgis_resource_browser.core.resource_table_model import (
     ResourceTableFilterModel,
     ResourceTableModel,
 )
 from pyqgis_resource_browser.core.resource_table_view import ResourceTableView
+from pyqgis_resource_browser.core.text_loader import (
+    TextLoader,
+    TextReader,
+    isTextResource,
+)
+from pyqgis_resource_browser.core.trigram_index import wildcardFragments
 from pyqgis_resource_browser.toolbelt import PlgLogger, PlgOptionsManager
 
 
 class ResourceGraphicsView(QGraphicsView):
     resized = pyqtSignal()
+    findSimilarRequested = pyqtSignal(str)
     uri: str = ""
 
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
         self.log = PlgLogger().log
         self.item = None
+        # shared renderer of the shown SVG item, which does not own it
+        self.renderer: QSvgRenderer = None
 
     def setItem(self, item: QGraphicsSvgItem | QGraphicsPixmapItem):
         """Set view item.
@@ -67,6 +91,10 @@ class ResourceGraphicsView(QGraphicsView):
         self.scene().clear()
         self.scene().addItem(item)
         self.item = item
+        if isinstance(item, QGraphicsSvgItem):
+            self.renderer = item.renderer()
+        else:
+            self.renderer = None
         self.fitInView(item, Qt.AspectRatioMode.KeepAspectRatio)
 
     def resizeEvent(self, QResizeEvent):
@@ -125,6 +153,16 @@ class ResourceGraphicsView(QGraphicsView):
             partial(self.copy_to_clipboard, "qpixmap")
         )
 
+        # Find visually similar images
+        action_find_similar = QAction(
+            icon=QgsApplication.getThemeIcon("mActionFilter2.svg"),
+            text=self.tr("Find similar"),
+            parent=self,
+        )
+        action_find_similar.triggered.connect(
+            lambda: self.findSimilarRequested.emit(self.uri)
+        )
+
         # add actions to context menu
         menu.addAction(action_copy_name)
         menu.addAction(action_copy_path)
@@ -132,6 +170,8 @@ class ResourceGraphicsView(QGraphicsView):
         menu.addAction(action_copy_theme_icon)
         menu.addAction(action_copy_qicon)
         menu.addAction(action_copy_qpixmap)
+        menu.addSeparator()
+        menu.addAction(action_find_similar)
 
         # open the menu at the event global position
         menu.exec(event.globalPos())
@@ -186,6 +226,13 @@ class ResourceBrowser(QWidget):
     A widget to browser Qt resources, i.e. icons and text files.
     """
 
+    # maximum number of rows shown by a fuzzy search
+    FUZZY_SEARCH_LIMIT = 200
+    # number of rows before and after the selection whose previews are prefetched
+    PREFETCH_ROWS = 3
+    # delay without selection change before the selection is previewed, in ms
+    PREVIEW_DELAY = 80
+
     def __init__(self, *args, **kwds):
         super().__init__(*args, **kwds)
 
@@ -196,41 +243,143 @@ class ResourceBrowser(QWidget):
         self.setWindowTitle("Resource Browser")
         self.setWindowIcon(QgsApplication.getThemeIcon("mActionAddImage.svg"))
         self.actionReload: QAction
+        self.actionCancelScan: QAction
         self.optionUseRegex: QAction
+        self.optionFuzzySearch: QAction
+        self.optionGroupDuplicates: QAction
         self.tbFilter: QLineEdit
         self.tableView: ResourceTableView
         self.btnUseRegex: QToolButton
+        self.btnFuzzySearch: QToolButton
+        self.btnGroupDuplicates: QToolButton
         self.btnCaseSensitive: QToolButton
         self.btnReload: QToolButton
+        self.btnCancelScan: QToolButton
+        self.progressScan: QProgressBar
         self.preview: QLabel
 
         self.graphicsScene = QGraphicsScene()
         self.graphicsView: ResourceGraphicsView
         self.graphicsView.setScene(self.graphicsScene)
+        self.graphicsView.findSimilarRequested.connect(self.showSimilar)
+        self.previewCache = PreviewCache(64 * 1024**2)
+        self.previewPrefetcher = PreviewPrefetcher(self.previewCache, self)
 
         self.textBrowser: QTextBrowser
-
-        self.resourceModel: ResourceTableModel = ResourceTableModel()
+        self.btnLoadMoreText: QPushButton
+        self.btnLoadMoreText.setVisible(False)
+        self.btnLoadMoreText.clicked.connect(self.loadMoreText)
+        self.textPreviewMaxSize = 256 * 1024
+        self._textLoader: TextLoader = None
+        # reader to continue the text preview with
+        self._textMore: TextReader = None
+
+        # the diagnostics tab is shown in debug mode only
+        self.diagnosticsText: QPlainTextEdit
+        self.btnCopyReport: QPushButton
+        self.btnResetDiagnostics: QPushButton
+        self.btnCopyReport.clicked.connect(self.copyDiagnosticsReport)
+        self.btnResetDiagnostics.clicked.connect(self.resetDiagnostics)
+        # refreshes the report while the diagnostics tab is current
+        self.diagnosticsTimer = QTimer(self)
+        self.diagnosticsTimer.setInterval(1000)
+        self.diagnosticsTimer.timeout.connect(self.updateDiagnostics)
+        self.tabWidget.currentChanged.connect(self.onTabChanged)
+
+        self.resourceModel: ResourceTableModel = ResourceTableModel(
+            load_resources=False
+        )
+        self.resourceModel.hashingFinished.connect(self.onHashingFinished)
 
         self.resourceProxyModel = ResourceTableFilterModel()
         self.resourceProxyModel.setSourceModel(self.resourceModel)
         self.resourceProxyModel.setFilterKeyColumn(0)
         self.resourceProxyModel.setFilterRole(Qt.ItemDataRole.UserRole)
 
+        # very large resource trees can be browsed from an SQLite catalog instead,
+        # without regular expressions, fuzzy search, property filters, duplicates
+        # and similar images, which need the resources in memory
+        self.catalogModel: ResourceCatalogModel = None
+        self.browsedModel: ResourceTableModel | ResourceCatalogModel = (
+            self.resourceModel
+        )
+        if PlgOptionsManager.get_plg_settings().resource_catalog:
+            self.catalogModel = ResourceCatalogModel(self)
+            self.browsedModel = self.catalogModel
+        self.browsedModel.scanStarted.connect(self.onScanStarted)
+        self.browsedModel.scanProgress.connect(self.onScanProgress)
+        self.browsedModel.scanFinished.connect(self.onScanFinished)
+        self.browsedModel.resourcesUpdated.connect(self.onResourcesUpdated)
+
         self.tableView.setSortingEnabled(True)
-        self.tableView.setModel(self.resourceProxyModel)
+        if self.catalogModel is None:
+            self.tableView.setModel(self.resourceProxyModel)
+        else:
+            self.tableView.setModel(self.catalogModel)
+        icon_size = self.tableView.iconSize()
+        if not icon_size.isValid():
+            extent = self.tableView.style().pixelMetric(
+                QStyle.PixelMetric.PM_SmallIconSize
+            )
+            icon_size = QSize(extent, extent)
+        self.browsedModel.setThumbnailSize(
+            icon_size, self.tableView.devicePixelRatioF()
+        )
         self.tableView.selectionModel().selectionChanged.connect(
             self.onSelectionChanged
         )
+        # preview the selection once it stopped changing, e.g. while keys repeat
+        self.previewTimer = QTimer(self)
+        self.previewTimer.setSingleShot(True)
+        self.previewTimer.setInterval(self.PREVIEW_DELAY)
+        self.previewTimer.timeout.connect(self.showSelectionPreview)
+        self._previewIndex: QPersistentModelIndex = None
+        # do not render thumbnails of rows that scrolled out of the viewport
+        self.tableView.viewportRowsChanged.connect(self.browsedModel.cancelThumbnails)
+        self.tableView.exportIconsRequested.connect(self.exportIcons)
+        self.iconExporter: IconExporter = None
 
         self.btnReload.setDefaultAction(self.actionReload)
         self.btnUseRegex.setDefaultAction(self.optionUseRegex)
+        self.btnFuzzySearch.setDefaultAction(self.optionFuzzySearch)
+        self.btnGroupDuplicates.setDefaultAction(self.optionGroupDuplicates)
         self.btnCaseSensitive.setDefaultAction(self.optionCaseSensitive)
-        self.actionReload.triggered.connect(self.resourceModel.reloadResources)
+        self.btnCancelScan.setDefaultAction(self.actionCancelScan)
+        self.btnCancelScan.setVisible(False)
+        self.progressScan.setVisible(False)
+        self.actionReload.triggered.connect(
+            lambda: self.browsedModel.startResourceScan()
+        )
+        self.actionCancelScan.triggered.connect(
+            lambda: self.browsedModel.cancelResourceScan()
+        )
+
+        # filter once typing paused, instead of on each keystroke
+        self.filterTimer = QTimer(self)
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(200)
+        self.filterTimer.timeout.connect(self.updateFilter)
+        # text, regex and case sensitivity of the current text filter
+        self._filterState = ("", False, False)
 
+        self.optionUseRegex.toggled.connect(
+            partial(self.onSearchModeToggled, self.optionFuzzySearch)
+        )
+        self.optionFuzzySearch.toggled.connect(
+            partial(self.onSearchModeToggled, self.optionUseRegex)
+        )
         self.optionCaseSensitive.toggled.connect(self.updateFilter)
         self.optionUseRegex.toggled.connect(self.updateFilter)
-        self.tbFilter.textChanged.connect(self.updateFilter)
+        self.optionFuzzySearch.toggled.connect(self.updateFilter)
+        self.optionGroupDuplicates.toggled.connect(self.updateFilter)
+        self.tbFilter.textChanged.connect(lambda: self.filterTimer.start())
+        self.tbFilter.setToolTip(
+            self.tr(
+                "Filter resources by path. Words like width<=32, height>=48, "
+                "size<2k or format:png filter by resource properties."
+            )
+        )
+        self.tbFilter.returnPressed.connect(self.updateFilter)
 
         # settings button
         self.btn_settings.setToolTip(self.tr("Settings"))
@@ -242,53 +391,422 @@ class ResourceBrowser(QWidget):
             partial(iface.showOptionsDialog, currentPage=f"mOptionsPage{__title__}")
         )
 
+        if self.catalogModel is not None:
+            for option in (
+                self.optionUseRegex,
+                self.optionFuzzySearch,
+                self.optionGroupDuplicates,
+            ):
+                option.setChecked(False)
+                option.setEnabled(False)
+
         self.slot_config_changed()
 
+        # warm start from the resource index, rescan only if it is outdated
+        if self.catalogModel is not None:
+            self.catalogModel.startResourceScan()
+        elif self.resourceModel.loadResourceIndex():
+            self.info.setText(
+                self.tr("{} resources loaded from cache").format(
+                    len(self.resourceModel)
+                )
+            )
+            self.resourceModel.checkResourceIndex()
+            self.resourceModel.startResourceInspection()
+            self.resourceModel.startResourceHashing()
+        else:
+            self.resourceModel.startResourceScan()
+
+    def showEvent(self, event: QShowEvent):
+        super().showEvent(event)
+        # the catalog is closed with the browser, it is scanned again when reopened
+        if self.catalogModel is not None and self.catalogModel.isClosed():
+            self.catalogModel.setCatalog(ResourceCatalog())
+            self.catalogModel.startResourceScan()
+
+    def closeEvent(self, event: QCloseEvent):
+        self.browsedModel.cancelResourceScan(wait=True)
+        self.resourceModel.cancelResourceHashing(wait=True)
+        self.resourceModel.cancelResourceInspection(wait=True)
+        if self.iconExporter is not None:
+            self.iconExporter.cancel(wait=True)
+        self.previewTimer.stop()
+        self.diagnosticsTimer.stop()
+        self.cancelTextPreview(wait=True)
+        self.previewPrefetcher.stop()
+        self.resourceModel.thumbnailRenderer.stop()
+        if self.catalogModel is not None:
+            self.catalogModel.thumbnailRenderer.stop()
+            # release the database, a temporary one is removed
+            self.catalogModel.close()
+        PlgLogger.log(
+            message="DEBUG - Thumbnail cache: {}".format(
+                self.browsedModel.thumbnailCache.stats()
+            ),
+            log_level=4,
+        )
+        PlgLogger.log(
+            message="DEBUG - Preview cache: {}".format(self.previewCache.stats()),
+            log_level=4,
+        )
+        PlgLogger.log(
+            message="DEBUG - Text mask cache: {}".format(
+                self.resourceProxyModel.textMaskCache.stats()
+            ),
+            log_level=4,
+        )
+        if DIAGNOSTICS.enabled:
+            for line in DIAGNOSTICS.summaries():
+                PlgLogger.log(message=f"DEBUG - Diagnostics: {line}", log_level=4)
+        super().closeEvent(event)
+
+    def onScanStarted(self):
+        self.progressScan.setRange(0, 0)
+        self.progressScan.setVisible(True)
+        self.btnCancelScan.setVisible(True)
+        self.info.setText(self.tr("Scanning resources..."))
+
+    def onScanProgress(self, done: int, total: int):
+        self.progressScan.setRange(0, total)
+        self.progressScan.setValue(done)
+        self.info.setText(
+            self.tr("Scanning resources... {} found").format(self.resourceCount())
+        )
+
+    def onScanFinished(self, completed: bool):
+        self.progressScan.setVisible(False)
+        self.btnCancelScan.setVisible(False)
+        if completed:
+            self.info.setText("")
+        else:
+            self.info.setText(
+                self.tr("Scan cancelled, {} resources loaded").format(
+                    self.resourceCount()
+                )
+            )
+
+    def onResourcesUpdated(self, added: int, removed: int):
+        if self.optionFuzzySearch.isChecked():
+            # rank the new resources too
+            self.updateFilter()
+        if self.catalogModel is None:
+            # read the properties of new resources and hash them to find duplicates
+            self.resourceModel.startResourceInspection()
+            self.resourceModel.startResourceHashing()
+        self.info.setText(
+            self.tr("{} resources: {} added, {} removed").format(
+                self.resourceCount(), added, removed
+            )
+        )
+
+    def resourceCount(self) -> int:
+        """
+        Returns the number of browsed resources, shown or not.
+        """
+        if self.catalogModel is not None:
+            if self.catalogModel.isClosed():
+                return 0
+            return len(self.catalogModel.catalog)
+        return len(self.resourceModel)
+
+    def exportIcons(self, output_dir: str = None):
+        """
+        Exports the selected resources, or all shown resources if at most one is
+        selected, as PNG files at several sizes and as sprite sheets.
+        :param output_dir: directory to export into. Asked to the user if None.
+        """
+        if self.iconExporter is not None:
+            return
+        indexes = self.tableView.selectionModel().selectedRows()
+        if len(indexes) <= 1:
+            model = self.tableView.model()
+            indexes = [model.index(r, 0) for r in range(model.rowCount())]
+        else:
+            indexes.sort(key=lambda idx: idx.row())
+        uris = [idx.data(Qt.ItemDataRole.UserRole) for idx in indexes]
+        if len(uris) == 0:
+            return
+        if output_dir is None:
+            output_dir = QFileDialog.getExistingDirectory(
+                self, self.tr("Export {} icons to").format(len(uris))
+            )
+            if output_dir == "":
+                return
+
+        exporter = IconExporter(output_dir, self)
+        exporter.progressChanged.connect(self.onExportProgress)
+        exporter.finished.connect(partial(self.onExportFinished, exporter))
+        self.iconExporter = exporter
+        try:
+            exporter.start(uris)
+        except OSError as err:
+            self.iconExporter = None
+            exporter.deleteLater()
+            PlgLogger.log(
+                message=self.tr("Icons cannot be exported: {}").format(err),
+                log_level=2,
+                push=True,
+            )
+
+    def onExportProgress(self, done: int, total: int):
+        self.progressScan.setRange(0, total)
+        self.progressScan.setValue(done)
+        self.progressScan.setVisible(True)
+        self.info.setText(self.tr("Exporting icons... {}/{}").format(done, total))
+
+    def onExportFinished(self, exporter: IconExporter, completed: bool):
+        if exporter is not self.iconExporter:
+            return
+        self.iconExporter = None
+        exporter.deleteLater()
+        self.progressScan.setVisible(self.browsedModel.isScanning())
+        self.info.setText(
+            self.tr("{} icons exported to {}").format(
+                exporter.exportedCount(), exporter.outputDir
+            )
+        )
+        errors = exporter.errors()
+        if len(errors) > 0:
+            PlgLogger.log(
+                message=self.tr("{} errors while exporting icons:\n{}").format(
+                    len(errors), "\n".join(errors[:10])
+                ),
+                log_level=2,
+                push=True,
+            )
+
+    def onHashingFinished(self, completed: bool):
+        if completed and self.optionGroupDuplicates.isChecked():
+            self.updateFilter()
+
     def slot_config_changed(self):
         """When settings have been saved."""
         settings = PlgOptionsManager.get_plg_settings()
+        self.textPreviewMaxSize = settings.text_preview_max_size * 1024
+        self.previewPrefetcher.textHeadSize = min(64 * 1024, self.textPreviewMaxSize)
+        self.browsedModel.thumbnailCache.setMaxCost(
+            settings.thumbnail_cache_size * 1024**2
+        )
+        DIAGNOSTICS.setEnabled(settings.debug_mode)
+        # a hidden tab can still be current, so leave it and disable it too
+        if not settings.debug_mode and (
+            self.tabWidget.currentWidget() is self.pageDiagnostics
+        ):
+            self.tabWidget.setCurrentWidget(self.pageImage)
+        diagnostics_index = self.tabWidget.indexOf(self.pageDiagnostics)
+        self.tabWidget.setTabEnabled(diagnostics_index, settings.debug_mode)
+        self.tabWidget.setTabVisible(diagnostics_index, settings.debug_mode)
+        if settings.resource_index_cache:
+            self.resourceModel.indexPath = defaultIndexPath()
+        else:
+            self.resourceModel.indexPath = None
+
         if settings.filter_prefixes:
-            self.resourceProxyModel.setPrefixFilters(settings.prefix_filters)
+            prefix_filters = settings.prefix_filters
         else:
-            self.resourceProxyModel.setPrefixFilters([])
+            prefix_filters = []
 
         if settings.filter_filetypes:
-            self.resourceProxyModel.setFileTypeFilters(settings.filetype_filters)
+            filetype_filters = settings.filetype_filters
+        else:
+            filetype_filters = []
+
+        # hide filtered rows right away, even before a rescan has removed them
+        self.resourceProxyModel.setPrefixFilters(prefix_filters)
+        self.resourceProxyModel.setFileTypeFilters(filetype_filters)
+
+        # scan only the subtrees that can match the filters
+        if self.browsedModel.setResourceFilters(prefix_filters, filetype_filters):
+            if self.resourceCount() > 0 or self.browsedModel.isScanning():
+                self.browsedModel.startResourceScan()
+
+    def onTabChanged(self, index: int):
+        if self.tabWidget.widget(index) is self.pageDiagnostics:
+            self.updateDiagnostics()
+            self.diagnosticsTimer.start()
         else:
-            self.resourceProxyModel.setFileTypeFilters([])
+            self.diagnosticsTimer.stop()
+
+    def diagnosticsReport(self) -> str:
+        """
+        Returns the timing diagnostics and the cache statistics as text.
+        """
+        caches = [
+            ("Thumbnail cache", self.browsedModel.thumbnailCache),
+            ("Preview cache", self.previewCache),
+            ("Text mask cache", self.resourceProxyModel.textMaskCache),
+        ]
+        lines = [f"Resources: {self.resourceCount()}"]
+        lines.extend(f"{name}: {cache.stats()}" for name, cache in caches)
+        lines.append("")
+        lines.append(DIAGNOSTICS.report())
+        return "\n".join(lines)
+
+    def updateDiagnostics(self):
+        text = self.diagnosticsReport()
+        if text != self.diagnosticsText.toPlainText():
+            self.diagnosticsText.setPlainText(text)
+
+    def copyDiagnosticsReport(self):
+        QApplication.clipboard().setText(self.diagnosticsReport())
+        self.info.setText(self.tr("Diagnostics report copied to the clipboard"))
+
+    def resetDiagnostics(self):
+        DIAGNOSTICS.reset()
+        self.updateDiagnostics()
+
+    def onSearchModeToggled(self, other_mode: QAction, checked: bool):
+        # regex and fuzzy search are exclusive, but both can be off
+        if checked:
+            other_mode.setChecked(False)
 
     def updateFilter(self):
-        txt = self.tbFilter.text()
+        self.filterTimer.stop()
+        text, property_filters = parsePropertyFilters(self.tbFilter.text())
+        use_regex = self.optionUseRegex.isChecked()
+        case_sensitive = self.optionCaseSensitive.isChecked()
+
+        if self.catalogModel is not None:
+            # the catalog filters wildcard patterns, property filters are ignored
+            self.catalogModel.setTextFilter(text, case_sensitive)
+            self._filterState = (text, use_regex, case_sensitive)
+            self.info.setText("")
+            return
+
+        self.resourceProxyModel.setPropertyFilters(property_filters)
+
+        if text == "":
+            self.resourceProxyModel.setTextFilter(QRegularExpression())
+            self.resourceProxyModel.setRanking(self.groupDuplicates(None))
+            self._filterState = (text, use_regex, case_sensitive)
+            self.info.setText("")
+            return
+
+        if self.optionFuzzySearch.isChecked():
+            with DIAGNOSTICS.timer("fuzzy_search"):
+                results = self.resourceModel.fuzzySearch(
+                    text,
+                    limit=self.FUZZY_SEARCH_LIMIT,
+                    accept=self.resourceProxyModel.acceptsResourceRow,
+                )
+            if self.resourceProxyModel.textFilter().pattern() != "":
+                self.resourceProxyModel.setTextFilter(QRegularExpression())
+            self.resourceProxyModel.setRanking(
+                self.groupDuplicates([row for row, score in results])
+            )
+            # a fuzzy search is not narrowed by the next wildcard query
+            self._filterState = ("", use_regex, case_sensitive)
+            self.info.setText("")
+            return
+        self.resourceProxyModel.setRanking(self.groupDuplicates(None))
+
+        # a wildcard pattern extended at its end can only match fewer resources,
+        # unless the previous pattern ended inside a [...] set or an escape
+        last_text, last_regex, last_case_sensitive = self._filterState
+        narrowing = (
+            not use_regex
+            and not last_regex
+            and case_sensitive == last_case_sensitive
+            and last_text != ""
+            and text.startswith(last_text)
+            and "[" not in last_text
+            and "\\" not in last_text
+        )
 
-        if not self.optionUseRegex.isChecked():
+        txt = text
+        fragments = []
+        if not use_regex:
+            fragments = wildcardFragments(text)
             txt = QRegularExpression.wildcardToRegularExpression(
                 txt,
                 QRegularExpression.WildcardConversionOption.UnanchoredWildcardConversion,
             )
 
         expr = QRegularExpression(txt)
-        if not self.optionCaseSensitive.isChecked():
+        if not case_sensitive:
             expr.setPatternOptions(
                 QRegularExpression.PatternOption.CaseInsensitiveOption
             )
 
         if expr.isValid():
-            self.resourceProxyModel.setFilterRegularExpression(expr)
+            self.resourceProxyModel.setTextFilter(expr, narrowing, fragments)
+            self._filterState = (text, use_regex, case_sensitive)
             self.info.setText("")
         else:
-            self.resourceProxyModel.setFilterRegularExpression(QRegularExpression())
+            self.resourceProxyModel.setTextFilter(QRegularExpression())
+            self._filterState = ("", use_regex, case_sensitive)
             self.info.setText(expr.errorString())
 
+    def showSimilar(self, uri: str):
+        """
+        Shows the images that look alike an image resource, most similar first.
+        Editing the filter shows all resources again.
+        """
+        row = self.resourceModel.resourceRow(uri)
+        if row < 0:
+            return
+        if self.resourceModel.perceptualHash(row) is None:
+            self.info.setText(
+                self.tr("Similar images of {} are not known yet").format(
+                    Path(uri).name
+                )
+            )
+            return
+
+        similar_rows = [r for r, distance in self.resourceModel.similarRows(row)]
+        self.filterTimer.stop()
+        self.tbFilter.blockSignals(True)
+        self.tbFilter.clear()
+        self.tbFilter.blockSignals(False)
+        self._filterState = (
+            "",
+            self.optionUseRegex.isChecked(),
+            self.optionCaseSensitive.isChecked(),
+        )
+        self.resourceProxyModel.setTextFilter(QRegularExpression())
+        self.resourceProxyModel.setPropertyFilters([])
+        self.resourceProxyModel.setRanking([row, *similar_rows])
+        self.info.setText(
+            self.tr("{} images similar to {}").format(
+                len(similar_rows), Path(uri).name
+            )
+        )
+
+    def groupDuplicates(self, rows: list[int]) -> list[int]:
+        """
+        Restricts rows to resources with duplicates, grouped by content, if
+        duplicates are grouped.
+        :param rows: ranked source rows, or None for all rows
+        """
+        if self.optionGroupDuplicates.isChecked():
+            return self.resourceModel.duplicateRows(rows)
+        return rows
+
     def onSelectionChanged(self, selected, deselected):
         selectedIdx = selected.indexes()
         if len(selectedIdx) == 0:
-            self.updatePreview(None)
+            self._previewIndex = None
         else:
             idx1 = selectedIdx[0]
             assert isinstance(idx1, QModelIndex)
+            self._previewIndex = QPersistentModelIndex(idx1)
+
+        # drop the work for rows passed meanwhile, preview once navigation settles
+        self.cancelTextPreview()
+        self.previewPrefetcher.prefetch([])
+        self.previewTimer.start()
 
-            uri = idx1.data(Qt.ItemDataRole.UserRole)
-            self.updatePreview(uri)
+    def showSelectionPreview(self):
+        """
+        Shows the preview of the latest selected row and prefetches its neighbors.
+        """
+        idx = self._previewIndex
+        self._previewIndex = None
+        if idx is None or not idx.isValid():
+            self.updatePreview(None)
+            return
+        self.updatePreview(idx.data(Qt.ItemDataRole.UserRole))
+        self.prefetchNeighbors(idx.row())
 
     def updatePreview(self, uri: str):
         """
@@ -296,17 +814,24 @@ class ResourceBrowser(QWidget):
         """
         hasImage = False
         hasText = False
+        self.cancelTextPreview()
+        self.btnLoadMoreText.setVisible(False)
+        self._textMore = None
         self.textBrowser.clear()
         self.graphicsScene.clear()
 
         if isinstance(uri, str) and "." in uri:
             ext = os.path.splitext(uri)[1]
 
+            # parsed renderers and decoded pixmaps are shared across selections
             item = None
             if ext == ".svg":
-                item = QGraphicsSvgItem(uri)
+                renderer = self.previewCache.svgRenderer(uri)
+                if renderer is not None:
+                    item = QGraphicsSvgItem()
+                    item.setSharedRenderer(renderer)
             else:
-                pm = QPixmap(uri)
+                pm = self.previewCache.pixmap(uri)
                 if not pm.isNull():
                     item = QGraphicsPixmapItem(pm)
 
@@ -315,26 +840,113 @@ class ResourceBrowser(QWidget):
                 self.graphicsView.setItem(item)
                 self.graphicsView.uri = uri
 
-            if re.search(r"\.(svg|html|xml|txt|js|css)$", uri, re.I) is not None:
-                file = QFile(uri)
-                if file.open(QFile.OpenModeFlag.ReadOnly | QFile.OpenModeFlag.Text):
-                    stream = QTextStream(file)
-                    stream.setAutoDetectUnicode(True)
-                    txt = stream.readAll()
-                    self.textBrowser.setPlainText(txt)
+            if isTextResource(uri):
+                if QFile.exists(uri):
+                    self.loadTextPreview(uri)
                     hasText = True
-                    file.close()
 
         self.tabWidget.setTabEnabled(self.tabWidget.indexOf(self.pageImage), hasImage)
         self.tabWidget.setTabEnabled(self.tabWidget.indexOf(self.pageText), hasText)
 
-        # try to show a view that shows content
-        if not self.tabWidget.widget(self.tabWidget.currentIndex()).isEnabled():
-            for i in range(self.tabWidget.count()):
-                if self.tabWidget.widget(i).isEnabled():
-                    self.tabWidget.setCurrentIndex(i)
+        # try to show a view that shows content, never the diagnostics
+        if not self.tabWidget.currentWidget().isEnabled():
+            for page in (self.pageImage, self.pageText):
+                if page.isEnabled():
+                    self.tabWidget.setCurrentWidget(page)
                     break
 
+    def loadTextPreview(self, uri: str):
+        """
+        Loads the text of a resource into the text preview, in chunks and off the
+        GUI thread. A prefetched head of the text is shown at once. At most the
+        configured text preview size is loaded.
+        :param uri: path of the text resource
+        """
+        head = self.previewCache.textHead(uri)
+        if head is None:
+            self.continueTextPreview(TextReader(uri))
+            return
+        text, reader = head
+        self.appendPreviewText(text)
+        if not reader.atEnd():
+            self.continueTextPreview(reader, self.textPreviewMaxSize - reader.offset)
+
+    def continueTextPreview(self, reader: TextReader, max_bytes: int = None):
+        """
+        Continues loading a text preview, in chunks and off the GUI thread.
+        :param reader: reader of the text resource, positioned after the shown text
+        :param max_bytes: maximum number of bytes to load, defaults to the text
+                preview size
+        """
+        self.cancelTextPreview()
+        self.btnLoadMoreText.setVisible(False)
+        if max_bytes is None:
+            max_bytes = self.textPreviewMaxSize
+        loader = TextLoader(self, reader=reader, max_bytes=max(max_bytes, 0))
+        loader.chunkReady.connect(partial(self.onTextChunk, loader))
+        loader.finished.connect(partial(self.onTextLoaded, loader))
+        loader.finished.connect(loader.deleteLater)
+        self._textLoader = loader
+        loader.start()
+
+    def cancelTextPreview(self, wait: bool = False):
+        """
+        Cancels the text preview loading in flight, if any.
+        :param wait: set True to block until the loader thread has stopped.
+        """
+        loader = self._textLoader
+        if loader is None:
+            return
+        self._textLoader = None
+        loader.requestInterruption()
+        if wait:
+            loader.wait()
+
+    def appendPreviewText(self, text: str):
+        # append without moving the view
+        cursor = QTextCursor(self.textBrowser.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
+    def onTextChunk(self, loader: TextLoader, text: str):
+        # ignore chunks still queued by a cancelled loader
+        if loader is self._textLoader:
+            self.appendPreviewText(text)
+
+    def onTextLoaded(self, loader: TextLoader):
+        if loader is not self._textLoader:
+            return
+        self._textLoader = None
+        reader = loader.reader
+        if not reader.atEnd():
+            self.btnLoadMoreText.setText(
+                self.tr("Load more ({} of {} KiB loaded)").format(
+                    reader.offset // 1024, reader.size // 1024
+                )
+            )
+            self.btnLoadMoreText.setVisible(True)
+            self._textMore = reader
+
+    def loadMoreText(self):
+        if self._textMore is not None:
+            reader = self._textMore
+            self._textMore = None
+            self.continueTextPreview(reader)
+
+    def prefetchNeighbors(self, row: int):
+        """
+        Prefetches the previews of the rows around a row of the table view, in
+        the current sort and filter order, the next rows first.
+        :param row: row of the table view
+        """
+        model = self.tableView.model()
+        uris = []
+        for distance in range(1, self.PREFETCH_ROWS + 1):
+            for neighbor in (row + distance, row - distance):
+                if 0 <= neighbor < model.rowCount():
+                    uris.append(model.index(neighbor, 0).data(Qt.ItemDataRole.UserRole))
+        self.previewPrefetcher.prefetch(uris)
+
     def useFilterRegex(self) -> bool:
         return self.optionUseRegex.isChecked()
 
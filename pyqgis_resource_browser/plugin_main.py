@@ -161,6 +161,20 @@ class PlgPyQgisResourceBrowserPlugin:
                 log_level=4,
             )
 
+        # the browser is created again to switch to or from the SQLite catalog
+        browser = self.browser
+        if isinstance(browser, ResourceBrowser) and settings.resource_catalog != (
+            browser.catalogModel is not None
+        ):
+            self.options_factory.configChanged.disconnect(browser.slot_config_changed)
+            self.options_factory.configChanged.disconnect(self.slot_config_changed)
+            visible = browser.isVisible()
+            browser.close()
+            browser.deleteLater()
+            self.browser = None
+            if visible:
+                self.run()
+
     def tr(self, message: str) -> str:
         """Get the translation for a string using Qt translation API.
 
@@ -192,6 +206,15 @@ class PlgPyQgisResourceBrowserPlugin:
             self.iface.removeToolBarIcon(self.action_toolbar)
             self.action_toolbar = None
 
+        # -- Stop the background work of the browser before it is destroyed
+        browser = self.browser
+        if isinstance(browser, ResourceBrowser):
+            self.options_factory.configChanged.disconnect(browser.slot_config_changed)
+            self.options_factory.configChanged.disconnect(self.slot_config_changed)
+            browser.close()
+            browser.deleteLater()
+            self.browser = None
+
         # -- Clean up preferences panel in QGIS settings
         self.iface.unregisterOptionsWidgetFactory(self.options_factory)
 
@@ -45,6 +45,12 @@ class PlgSettingsStructure:
         default_factory=lambda: ["ico", "png", "svg", "xpn"]
     )
 
+    # performance
+    resource_index_cache: bool = True
+    resource_catalog: bool = False
+    thumbnail_cache_size: int = 32
+    text_preview_max_size: int = 256
+
     # misc
     toolbar_browser_shortcut: bool = True
 
@@ -0,0 +1,108 @@
+#! python3  # noqa E265
+
+"""
+Filter benchmark of the SQLite resource catalog against the in-memory model.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_catalog
+    python -m tests.benchmarks.bench_catalog --entries 500000
+"""
+
+# standard library
+import argparse
+import time
+
+# PyQGIS
+from qgis.PyQt.QtCore import QRegularExpression
+from qgis.testing import start_app
+
+# project
+from pyqgis_resource_browser.core.resource_catalog import CatalogQuery
+from pyqgis_resource_browser.core.resource_catalog_model import ResourceCatalogModel
+from pyqgis_resource_browser.core.resource_table_model import (
+    ResourceTableFilterModel,
+    ResourceTableModel,
+)
+from tests.benchmarks.bench_resource_store import measure_memory, synthetic_paths
+
+app = start_app()
+
+QUERIES = [
+    CatalogQuery(text="mAction"),
+    CatalogQuery(prefixes=(":/plugins/",), text="q1"),
+    CatalogQuery(extensions=("png", "ico")),
+]
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def timed(function) -> float:
+    """Returns the duration of function(), in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def table_filter(fm: ResourceTableFilterModel, query: CatalogQuery):
+    """Applies a query to the proxy model of the in-memory model."""
+    fm.setPrefixFilters(list(query.prefixes))
+    fm.setFileTypeFilters(list(query.extensions))
+    expr = QRegularExpression(QRegularExpression.escape(query.text))
+    expr.setPatternOptions(QRegularExpression.PatternOption.CaseInsensitiveOption)
+    fm.setTextFilter(expr)
+    fm.rowCount()
+
+
+def catalog_filter(m: ResourceCatalogModel, query: CatalogQuery):
+    """Applies a query to the catalog model and fetches its first page."""
+    m.setResourceFilters(list(query.prefixes), list(query.extensions))
+    m.setTextFilter(query.text)
+    m.fetchMore()
+    m.totalCount()
+
+
+def main(entries: int):
+    paths = synthetic_paths(entries)
+    print(f"entries: {entries}")
+
+    def create_table():
+        m = ResourceTableModel(load_resources=False)
+        m.appendResources(paths)
+        return m
+
+    def create_catalog():
+        m = ResourceCatalogModel()
+        m.catalog.addResources(paths)
+        return m
+
+    print(f"  table model memory: {measure_memory(create_table) / 1024**2:8.1f} MiB")
+    print(
+        f"  catalog model memory: {measure_memory(create_catalog) / 1024**2:8.1f} MiB"
+        " (Python objects only)"
+    )
+
+    table = create_table()
+    fm = ResourceTableFilterModel()
+    fm.setSourceModel(table)
+    catalog = create_catalog()
+    for query in QUERIES:
+        print(f"  {query}")
+        duration = timed(lambda: table_filter(fm, query))
+        print(f"    table model:   {duration * 1e3:10.2f} ms")
+        duration = timed(lambda: catalog_filter(catalog, query))
+        print(f"    catalog model: {duration * 1e3:10.2f} ms")
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=200000)
+    args = parser.parse_args()
+    main(args.entries)
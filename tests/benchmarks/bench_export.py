@@ -0,0 +1,76 @@
+#! python3  # noqa E265
+
+"""
+Memory benchmark of the catalog export, streaming a scanned directory tree.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_export
+    python -m tests.benchmarks.bench_export --entries 100000
+"""
+
+# standard library
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# PyQGIS
+from qgis.testing import start_app
+
+# project
+from pyqgis_resource_browser.core.catalog_export import exportCatalog
+from tests.benchmarks.bench_resource_store import synthetic_paths
+
+app = start_app()
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def create_tree(root: Path, entries: int):
+    """Creates empty files at the synthetic resource paths, below root."""
+    for path in synthetic_paths(entries):
+        file_path = root / path[2:]
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.touch()
+
+
+def measure_export(root: Path, output: Path) -> tuple[float, int]:
+    """Returns the duration and the peak memory allocated by an export."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    exportCatalog(str(output), path=str(root))
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main(entries: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        for n in (entries // 10, entries):
+            root = tmp_dir / f"tree{n}"
+            create_tree(root, n)
+            print(f"entries: {n}")
+            for suffix in ("jsonl", "csv", "sqlite"):
+                duration, peak = measure_export(root, tmp_dir / f"catalog.{suffix}")
+                print(
+                    f"  {suffix:6s} export: {duration * 1e3:10.2f} ms, "
+                    f"peak memory {peak / 1024:10.1f} KiB"
+                )
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.entries)
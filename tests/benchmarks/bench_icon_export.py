@@ -0,0 +1,65 @@
+#! python3  # noqa E265
+
+"""
+Benchmark of the icon export with one thread against all processors.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_icon_export
+    python -m tests.benchmarks.bench_icon_export --icons 2000
+"""
+
+# standard library
+import argparse
+import tempfile
+import time
+from itertools import islice
+
+# PyQGIS
+from qgis.PyQt.QtCore import QCoreApplication, QThread
+from qgis.testing import start_app
+
+# project
+from pyqgis_resource_browser.core import scanResources
+from pyqgis_resource_browser.core.icon_export import IconExporter
+
+app = start_app()
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def timed_export(uris: list[str], threads: int) -> float:
+    """Returns the duration of the export of uris with a number of threads."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exporter = IconExporter(tmp_dir)
+        exporter.pool.setMaxThreadCount(threads)
+        start = time.perf_counter()
+        exporter.start(uris)
+        while exporter.isRunning():
+            QCoreApplication.processEvents()
+        return time.perf_counter() - start
+
+
+def main(icons: int):
+    uris = list(islice(scanResources(suffixes=["svg", "png"]), icons))
+    print(f"icons: {len(uris)}")
+    for threads in sorted({1, QThread.idealThreadCount()}):
+        duration = timed_export(uris, threads)
+        print(
+            f"  {threads:3d} threads: {duration:8.2f} s, "
+            f"{len(uris) / duration:8.0f} icons/s"
+        )
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--icons", type=int, default=5000)
+    args = parser.parse_args()
+    main(args.icons)
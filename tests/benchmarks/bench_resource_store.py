@@ -0,0 +1,107 @@
+#! python3  # noqa E265
+
+"""
+Memory and lookup benchmark of the ResourceStore against a plain list of paths.
+
+The memory of a model loaded from a resource index file is measured too, so that
+paths kept alive next to the store, e.g. by the resource index, are accounted for.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_resource_store
+    python -m tests.benchmarks.bench_resource_store --entries 100000
+"""
+
+# standard library
+import argparse
+import os
+import random
+import string
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# project
+from pyqgis_resource_browser.core.resource_index import ResourceIndex
+from pyqgis_resource_browser.core.resource_store import ResourceStore
+from pyqgis_resource_browser.core.resource_table_model import ResourceTableModel
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def synthetic_paths(n: int, seed: int = 42) -> list[str]:
+    """Returns n distinct resource-like paths, spread over nested directories."""
+    rnd = random.Random(seed)
+    extensions = ["svg", "png", "svg", "svg", "ico", "qml", "txt"]
+    roots = [":/images/themes/default", ":/plugins", ":/qt-project.org/styles"]
+    paths = []
+    for i in range(n):
+        directory = "{}/{}{}".format(rnd.choice(roots), rnd.choice("mpqa"), i % 97)
+        name = "".join(rnd.choices(string.ascii_letters, k=rnd.randint(6, 24)))
+        paths.append(f"{directory}/{name}{i}.{rnd.choice(extensions)}")
+    return paths
+
+
+def measure_memory(factory) -> int:
+    """Returns the memory allocated by factory() and still alive, in bytes."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = factory()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return after - before
+
+
+def loaded_model(index_path: Path) -> ResourceTableModel:
+    """Returns a model warm started from a resource index file."""
+    m = ResourceTableModel(load_resources=False, index_path=index_path)
+    m.loadResourceIndex()
+    return m
+
+
+def main(entries: int):
+    # serialize paths into one string, so that each container builds its own objects
+    source = "\n".join(synthetic_paths(entries))
+
+    mem_list = measure_memory(lambda: source.split("\n"))
+    mem_store = measure_memory(lambda: ResourceStore(source.split("\n")))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index_path = Path(tmp_dir) / "index.json"
+        ResourceIndex(paths=source.split("\n")).save(index_path)
+        mem_model = measure_memory(lambda: loaded_model(index_path))
+
+    paths = source.split("\n")
+    store = ResourceStore(paths)
+    rows = [random.randrange(entries) for _ in range(10000)]
+
+    t_list = timeit.timeit(
+        lambda: [os.path.basename(paths[r]) for r in rows], number=10
+    )
+    t_store = timeit.timeit(lambda: [store.name(r) for r in rows], number=10)
+
+    print(f"entries: {entries}")
+    print(f"memory list[str]:     {mem_list / 1024**2:8.2f} MiB")
+    print(f"memory ResourceStore: {mem_store / 1024**2:8.2f} MiB")
+    print(f"memory saved:         {100 * (1 - mem_store / mem_list):8.1f} %")
+    print(f"memory loaded model:  {mem_model / 1024**2:8.2f} MiB")
+    print(f"basename list[str]:     {t_list * 1e6 / 1e5:6.3f} µs/lookup")
+    print(f"basename ResourceStore: {t_store * 1e6 / 1e5:6.3f} µs/lookup")
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    from qgis.testing import start_app
+
+    app = start_app()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=50000)
+    args = parser.parse_args()
+    main(args.entries)
@@ -0,0 +1,258 @@
+#! python3  # noqa E265
+
+"""
+Scale benchmark suite on synthetic resource bundles, with regression checks.
+
+Bundles of synthetic resources are generated and registered with
+QResource.registerResource(), so that timings do not depend on the resources
+compiled into QGIS. Durations are the minimum of several runs. They are compared
+to a JSON baseline, and the run fails if a duration regressed by more than the
+threshold.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # record a baseline on this machine
+    python -m tests.benchmarks.bench_scale --save
+    # compare to the baseline, fails on regressions of more than 25 %
+    python -m tests.benchmarks.bench_scale --sizes 1000 10000 --threshold 0.25
+"""
+
+# standard library
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# PyQGIS
+from qgis.PyQt.QtCore import QCoreApplication, QRegularExpression, Qt, qVersion
+from qgis.testing import start_app
+
+# project
+from pyqgis_resource_browser.core import scanResources
+from pyqgis_resource_browser.core.resource_table_model import (
+    ResourceTableFilterModel,
+    ResourceTableModel,
+)
+from pyqgis_resource_browser.core.trigram_index import wildcardFragments
+from pyqgis_resource_browser.gui.resource_browser import ResourceBrowser
+from tests.benchmarks.synthetic_rcc import (
+    register_bundle,
+    synthetic_files,
+    unregister_bundle,
+    write_rcc,
+)
+
+app = start_app()
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "bench_scale.json"
+# differences below this duration are noise, in seconds
+NOISE_FLOOR = 0.002
+# pattern of the filter benchmarks, matching about a third of the synthetic paths
+FILTER_PATTERN = "themes*.svg"
+# number of resources previewed by the preview benchmark
+PREVIEW_COUNT = 100
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def best_of(repeat: int, function: Callable, setup: Callable = None) -> float:
+    """Returns the shortest duration of function() over repeated runs, in seconds.
+    setup() is called before each run, untimed."""
+    durations = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def loaded_model(root: str) -> ResourceTableModel:
+    """Returns a model containing the resources of a bundle."""
+    m = ResourceTableModel(load_resources=False)
+    m.setResourceFilters([f":{root}/"], [])
+    m.reloadResources()
+    return m
+
+
+def filter_expression() -> QRegularExpression:
+    expr = QRegularExpression(
+        QRegularExpression.wildcardToRegularExpression(
+            FILTER_PATTERN,
+            QRegularExpression.WildcardConversionOption.UnanchoredWildcardConversion,
+        )
+    )
+    expr.setPatternOptions(QRegularExpression.PatternOption.CaseInsensitiveOption)
+    return expr
+
+
+def bench_model(root: str, repeat: int) -> dict[str, float]:
+    """Times the model operations on the resources of a bundle."""
+    results = {}
+    results["scan_resources"] = best_of(repeat, lambda: list(scanResources(f":{root}")))
+    results["reload_resources"] = best_of(repeat, lambda: loaded_model(root))
+
+    m = loaded_model(root)
+    fm = ResourceTableFilterModel()
+    fm.setSourceModel(m)
+    expr = filter_expression()
+
+    def reset_filter():
+        fm.setTextFilter(QRegularExpression())
+        fm.textMaskCache.clear()
+
+    def apply_filter(fragments=()):
+        fm.setTextFilter(expr, fragments=fragments)
+        fm.rowCount()
+
+    # each row is tested by filterAcceptsRow()
+    results["filter_rows"] = best_of(repeat, apply_filter, reset_filter)
+    # only the candidates of the trigram index are tested
+    fragments = wildcardFragments(FILTER_PATTERN)
+    results["filter_trigram"] = best_of(
+        repeat, lambda: apply_filter(fragments), reset_filter
+    )
+    reset_filter()
+
+    results["sort"] = best_of(
+        repeat,
+        lambda: fm.sort(m.ciIcon, Qt.SortOrder.DescendingOrder),
+        lambda: fm.sort(m.ciUri, Qt.SortOrder.AscendingOrder),
+    )
+
+    def read_data():
+        for row in range(m.rowCount()):
+            for column in (m.ciUri, m.ciIcon):
+                idx = m.index(row, column)
+                m.data(idx, Qt.ItemDataRole.DisplayRole)
+                m.data(idx, Qt.ItemDataRole.ToolTipRole)
+            m.data(m.index(row, m.ciUri), Qt.ItemDataRole.UserRole)
+
+    results["data"] = best_of(repeat, read_data)
+    m.thumbnailRenderer.stop()
+    return results
+
+
+def bench_preview(browser: ResourceBrowser, uris: list[str], repeat: int) -> float:
+    """Times the preview of resources, from parsing to the loaded text."""
+
+    def preview():
+        for uri in uris:
+            browser.updatePreview(uri)
+            while browser._textLoader is not None:
+                QCoreApplication.processEvents()
+
+    return best_of(repeat, preview, browser.previewCache.clear)
+
+
+def run(sizes: list[int], repeat: int) -> dict[str, dict[str, float]]:
+    """Runs the benchmarks on bundles of each size.
+    :return: durations in seconds, by bundle size and benchmark name"""
+    browser = ResourceBrowser()
+    browser.resourceModel.cancelResourceScan(wait=True)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            root = f"/bench{size}"
+            bundle = Path(tmp_dir) / f"bench{size}.rcc"
+            write_rcc(synthetic_files(size), bundle)
+            if not register_bundle(bundle, root):
+                raise RuntimeError(f"Cannot register {bundle}")
+            try:
+                results[str(size)] = bench_model(root, repeat)
+                uris = list(scanResources(f":{root}"))
+                uris = random.Random(42).sample(uris, min(PREVIEW_COUNT, len(uris)))
+                results[str(size)]["update_preview"] = bench_preview(
+                    browser, uris, repeat
+                )
+            finally:
+                unregister_bundle(bundle, root)
+            for name, duration in results[str(size)].items():
+                print(f"{size:8d} {name:20s} {duration * 1e3:12.2f} ms")
+    browser.close()
+    return results
+
+
+def regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Returns the benchmarks slower than their baseline by more than threshold,
+    as relative slowdown. Benchmarks without baseline are ignored."""
+    slower = []
+    for size, durations in results.items():
+        for name, duration in durations.items():
+            reference = baseline.get(size, {}).get(name)
+            if reference is None:
+                continue
+            if (
+                duration > reference * (1 + threshold)
+                and duration - reference > NOISE_FLOOR
+            ):
+                slowdown = 100 * (duration / reference - 1)
+                slower.append(
+                    f"{size} {name}: {reference * 1e3:.2f} ms -> "
+                    f"{duration * 1e3:.2f} ms (+{slowdown:.0f} %)"
+                )
+    return slower
+
+
+def main(
+    sizes: list[int], repeat: int, baseline_path: Path, save: bool, threshold: float
+) -> int:
+    results = run(sizes, repeat)
+    if save:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "qt": qVersion(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}, use --save to record one")
+        return 0
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    slower = regressions(results, baseline, threshold)
+    for line in slower:
+        print(f"REGRESSION {line}")
+    return 1 if len(slower) > 0 else 0
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="record the baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="tolerated relative slowdown, e.g. 0.25 for 25 %%",
+    )
+    args = parser.parse_args()
+    sys.exit(main(args.sizes, args.repeat, args.baseline, args.save, args.threshold))
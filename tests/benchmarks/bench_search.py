@@ -0,0 +1,120 @@
+#! python3  # noqa E265
+
+"""
+Search benchmark of the trigram index against the proxy regular expression filter.
+
+Both filter the rows of a ResourceTableFilterModel the way the resource browser
+does, i.e. text filter then row count, so the timings include the proxy filtering.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_search
+    python -m tests.benchmarks.bench_search --entries 100000
+"""
+
+# standard library
+import argparse
+import time
+from collections.abc import Callable
+
+# PyQGIS
+from qgis.PyQt.QtCore import QRegularExpression
+from qgis.testing import start_app
+
+# project
+from pyqgis_resource_browser.core.resource_table_model import (
+    ResourceTableFilterModel,
+    ResourceTableModel,
+)
+from pyqgis_resource_browser.core.trigram_index import wildcardFragments
+from tests.benchmarks.bench_resource_store import synthetic_paths
+
+app = start_app()
+
+QUERIES = ["mpq", "default/a1", "*/p4*.png", "xyzzy"]
+# duration of a frame at 60 Hz, in seconds
+FRAME = 1 / 60
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def wildcard_expression(query: str) -> QRegularExpression:
+    """Returns the case-insensitive expression the resource browser filters with."""
+    expr = QRegularExpression(
+        QRegularExpression.wildcardToRegularExpression(
+            query,
+            QRegularExpression.WildcardConversionOption.UnanchoredWildcardConversion,
+        )
+    )
+    expr.setPatternOptions(QRegularExpression.PatternOption.CaseInsensitiveOption)
+    return expr
+
+
+def best_of(number: int, function: Callable, setup: Callable) -> float:
+    """Returns the shortest duration of function() over number runs, in seconds.
+    setup() is called before each run, untimed."""
+    durations = []
+    for _ in range(number):
+        setup()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main(entries: int, number: int = 5):
+    paths = synthetic_paths(entries)
+
+    model = ResourceTableModel(load_resources=False)
+    model.appendResources(paths)
+    # the index is filled by chunks from the event loop, index all rows at once
+    start = time.perf_counter()
+    model.trigramIndex()
+    t_build = time.perf_counter() - start
+    t_chunk = t_build * model.TRIGRAM_CHUNK_SIZE / entries
+
+    proxy = ResourceTableFilterModel()
+    proxy.setSourceModel(model)
+
+    def reset_filter():
+        # cached text masks would skip the filtering
+        proxy.setTextFilter(QRegularExpression())
+        proxy.textMaskCache.clear()
+
+    print(f"entries: {entries}")
+    print(f"trigram index build:   {t_build * 1e3:8.2f} ms")
+    print(f"trigram index chunk:   {t_chunk * 1e3:8.2f} ms")
+    for query in QUERIES:
+        expr = wildcard_expression(query)
+        fragments = wildcardFragments(query)
+
+        def filter_proxy(fragments=()) -> int:
+            # the path of the resource browser: filter, then count the shown rows
+            proxy.setTextFilter(expr, fragments=fragments)
+            return proxy.rowCount()
+
+        reset_filter()
+        n_regex = filter_proxy()
+        reset_filter()
+        assert n_regex == filter_proxy(fragments)
+
+        t_regex = best_of(number, filter_proxy, reset_filter)
+        t_trigram = best_of(number, lambda: filter_proxy(fragments), reset_filter)
+        print(f"query {query!r}: {n_regex} matches")
+        print(f"  proxy regex filter:    {t_regex * 1e3:8.2f} ms")
+        print(f"  proxy trigram filter:  {t_trigram * 1e3:8.2f} ms")
+        print(f"  frames:                {t_trigram / FRAME:8.2f}")
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.entries)
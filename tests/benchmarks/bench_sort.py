@@ -0,0 +1,75 @@
+#! python3  # noqa E265
+
+"""
+Sort benchmark of the model sort keys against QSortFilterProxyModel comparisons.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.bench_sort
+    python -m tests.benchmarks.bench_sort --entries 50000
+"""
+
+# standard library
+import argparse
+import time
+
+# PyQGIS
+from qgis.PyQt.QtCore import QSortFilterProxyModel, Qt
+from qgis.testing import start_app
+
+# project
+from pyqgis_resource_browser.core.resource_table_model import (
+    ResourceTableFilterModel,
+    ResourceTableModel,
+)
+from tests.benchmarks.bench_resource_store import synthetic_paths
+
+app = start_app()
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def timed(function) -> float:
+    """Returns the duration of function(), in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(entries: int):
+    paths = synthetic_paths(entries)
+
+    print(f"entries: {entries}")
+    for column, label in [(0, "path"), (1, "name")]:
+        model = ResourceTableModel(load_resources=False)
+        model.appendResources(paths)
+
+        # the default proxy calls data() twice per comparison
+        reference = QSortFilterProxyModel()
+        reference.setSourceModel(model)
+        t_proxy = timed(lambda: reference.sort(column, Qt.SortOrder.AscendingOrder))
+        reference.setSourceModel(None)
+
+        proxy = ResourceTableFilterModel()
+        proxy.setSourceModel(model)
+        t_keys = timed(lambda: proxy.sort(column, Qt.SortOrder.AscendingOrder))
+        t_resort = timed(lambda: proxy.sort(column, Qt.SortOrder.DescendingOrder))
+
+        print(f"sort by {label}:")
+        print(f"  proxy comparisons:      {t_proxy * 1e3:8.2f} ms")
+        print(f"  model sort keys:        {t_keys * 1e3:8.2f} ms")
+        print(f"  model, cached keys:     {t_resort * 1e3:8.2f} ms")
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=50000)
+    args = parser.parse_args()
+    main(args.entries)
@@ -0,0 +1,188 @@
+#! python3  # noqa E265
+
+"""
+Generates synthetic Qt resource bundles (.rcc files) for benchmarks, without the
+rcc tool, so that benchmarks do not depend on the resources compiled into QGIS.
+
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    python -m tests.benchmarks.synthetic_rcc bundle.rcc --entries 10000
+"""
+
+# standard library
+import argparse
+import random
+import struct
+from collections import deque
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+# PyQGIS
+from qgis.PyQt.QtCore import QBuffer, QByteArray, QIODevice, QResource
+from qgis.PyQt.QtGui import QColor, QImage
+
+# project
+from tests.benchmarks.bench_resource_store import synthetic_paths
+
+# binary resource format version written, without node timestamps
+RCC_VERSION = 1
+# node flags of the binary resource format
+RCC_DIRECTORY = 0x02
+# QLocale.Language.C and QLocale.Country.AnyCountry, i.e. any locale
+RCC_LANGUAGE_C = 1
+RCC_ANY_TERRITORY = 0
+
+# ############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def qt_hash(name: str) -> int:
+    """Returns the hash Qt uses to look up resource names, see qhash.cpp."""
+    data = name.encode("utf-16-be")
+    h = 0
+    for i in range(0, len(data), 2):
+        h = ((h << 4) + (data[i] << 8 | data[i + 1])) & 0xFFFFFFFF
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+def write_rcc(files: Iterable[tuple[str, bytes]], file_path: Path):
+    """
+    Writes files into a binary Qt resource bundle, to be registered with
+    QResource.registerResource().
+    :param files: (path, content) pairs, paths being relative to the bundle root
+    :param file_path: path of the .rcc file
+    """
+    root = {}
+    for path, content in files:
+        *directories, name = path.strip("/").split("/")
+        node = root
+        for directory in directories:
+            node = node.setdefault(directory, {})
+        node[name] = content
+
+    # nodes are laid out breadth first, the children of each directory being
+    # contiguous and sorted by name hash, as QResource looks them up by bisection
+    nodes = [("", root)]
+    first_child = {}
+    queue = deque([0])
+    while queue:
+        i = queue.popleft()
+        entry = nodes[i][1]
+        if not isinstance(entry, dict):
+            continue
+        first_child[i] = len(nodes)
+        for name in sorted(entry, key=qt_hash):
+            queue.append(len(nodes))
+            nodes.append((name, entry[name]))
+
+    names = bytearray()
+    name_offsets = {}
+    tree = bytearray()
+    payloads = bytearray()
+    for i, (name, entry) in enumerate(nodes):
+        name_offset = 0
+        if i > 0:
+            if name not in name_offsets:
+                name_offsets[name] = len(names)
+                units = name.encode("utf-16-be")
+                names += struct.pack(">HI", len(units) // 2, qt_hash(name)) + units
+            name_offset = name_offsets[name]
+        if isinstance(entry, dict):
+            tree += struct.pack(
+                ">IHII", name_offset, RCC_DIRECTORY, len(entry), first_child[i]
+            )
+        else:
+            tree += struct.pack(
+                ">IHHHI",
+                name_offset,
+                0,
+                RCC_ANY_TERRITORY,
+                RCC_LANGUAGE_C,
+                len(payloads),
+            )
+            payloads += struct.pack(">I", len(entry)) + entry
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(tree)
+    names_offset = data_offset + len(payloads)
+    with open(file_path, "wb") as f:
+        f.write(b"qres")
+        f.write(
+            struct.pack(">IIII", RCC_VERSION, tree_offset, data_offset, names_offset)
+        )
+        f.write(tree)
+        f.write(payloads)
+        f.write(names)
+
+
+def png_bytes(size: int, color: QColor) -> bytes:
+    """Returns a plain square PNG image."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(color)
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(data)
+
+
+def synthetic_files(n: int, seed: int = 42) -> Iterator[tuple[str, bytes]]:
+    """
+    Returns n distinct resource-like files, spread over nested directories: SVG
+    icons of various sizes, PNG images and text files.
+    """
+    rnd = random.Random(seed)
+    sizes = [16, 24, 32, 48, 64]
+    pngs = [
+        png_bytes(size, QColor.fromHsv(40 * i, 200, 200))
+        for i, size in enumerate(sizes)
+    ]
+    for path in synthetic_paths(n, seed):
+        extension = path.rsplit(".", 1)[1]
+        if extension == "svg":
+            size = rnd.choice(sizes)
+            center = size // 2
+            content = (
+                f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" '
+                f'height="{size}" viewBox="0 0 {size} {size}">'
+                f'<circle cx="{center}" cy="{center}" r="{rnd.randint(2, center)}" '
+                f'fill="#{rnd.randrange(0x1000000):06x}"/></svg>'
+            ).encode()
+        elif extension in ("png", "ico"):
+            content = rnd.choice(pngs)
+        else:
+            content = "\n".join(
+                f"line {i} of {path}" for i in range(rnd.randint(1, 200))
+            ).encode()
+        # synthetic paths look like Qt resource paths, i.e. start with ":/"
+        yield path[2:], content
+
+
+def register_bundle(file_path: Path, root: str) -> bool:
+    """Registers a bundle so that its files are found below ":" + root."""
+    return QResource.registerResource(str(file_path), root)
+
+
+def unregister_bundle(file_path: Path, root: str) -> bool:
+    return QResource.unregisterResource(str(file_path), root)
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    from qgis.testing import start_app
+
+    app = start_app()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--entries", type=int, default=10000)
+    args = parser.parse_args()
+    write_rcc(synthetic_files(args.entries), args.file)
@@ -0,0 +1,104 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_catalog_export
+    # for specific test
+    python -m unittest tests.qgis.test_catalog_export.TestCatalogExport.test_catalog_export
+"""
+
+# standard library
+import csv
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+# PyQGIS
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.__main__ import main
+from pyqgis_resource_browser.core import scanResources
+from pyqgis_resource_browser.core.catalog_export import catalogEntries, exportCatalog
+
+app = start_app()
+
+PREFIXES = [":/images/themes/default/"]
+SUFFIXES = ["svg"]
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestCatalogExport(unittest.TestCase):
+    def test_catalog_entries(self):
+        entries = list(
+            catalogEntries([":/images/a.svg", ":/b", ":/c/d.tar.gz"], metadata=True)
+        )
+        self.assertEqual(
+            [(e["directory"], e["name"], e["extension"]) for e in entries],
+            [(":/images", "a.svg", "svg"), (":", "b", ""), (":/c", "d.tar.gz", "gz")],
+        )
+        # missing resources have no properties
+        self.assertEqual(entries[0]["size"], 0)
+        self.assertIsNone(entries[0]["width"])
+
+    def test_catalog_export(self):
+        expected = list(scanResources(prefixes=PREFIXES, suffixes=SUFFIXES))
+        self.assertTrue(len(expected) > 0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = Path(tmp_dir) / "catalog.jsonl"
+            n = exportCatalog(
+                str(output), prefixes=PREFIXES, suffixes=SUFFIXES, metadata=True
+            )
+            self.assertEqual(n, len(expected))
+            with open(output, encoding="utf-8") as f:
+                entries = [json.loads(line) for line in f]
+            self.assertEqual([e["path"] for e in entries], expected)
+            self.assertEqual({e["format"] for e in entries}, {"svg"})
+
+            output = Path(tmp_dir) / "catalog.csv"
+            exportCatalog(str(output), prefixes=PREFIXES, suffixes=SUFFIXES)
+            with open(output, encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([r["path"] for r in rows], expected)
+            self.assertNotIn("size", rows[0])
+
+            output = Path(tmp_dir) / "catalog.sqlite"
+            exportCatalog(
+                str(output), prefixes=PREFIXES, suffixes=SUFFIXES, digests=True
+            )
+            connection = sqlite3.connect(str(output))
+            try:
+                rows = connection.execute(
+                    "SELECT path, digest FROM resources ORDER BY rowid"
+                ).fetchall()
+            finally:
+                connection.close()
+            self.assertEqual([path for path, digest in rows], expected)
+            self.assertTrue(all(len(digest) == 32 for path, digest in rows))
+
+            with self.assertRaises(ValueError):
+                exportCatalog(str(output), catalog_format="xml")
+
+    def test_export_command(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output = Path(tmp_dir) / "icons.csv"
+            args = ["export", str(output), "--prefix", PREFIXES[0], "--suffix", "svg"]
+            self.assertEqual(main(args), 0)
+            self.assertTrue(output.is_file())
+            self.assertEqual(main(["export", "-", "--format", "sqlite"]), 1)
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
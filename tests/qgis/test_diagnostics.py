@@ -0,0 +1,145 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_diagnostics
+    # for specific test
+    python -m unittest tests.qgis.test_diagnostics.TestDiagnostics.test_histogram
+"""
+
+# standard library
+import threading
+
+# PyQGIS
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.diagnostics import (
+    DIAGNOSTICS,
+    Diagnostics,
+    DurationHistogram,
+)
+from pyqgis_resource_browser.core.resource_table_model import (
+    ResourceTableFilterModel,
+    ResourceTableModel,
+)
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestDiagnostics(unittest.TestCase):
+    def test_histogram(self):
+        h = DurationHistogram()
+        self.assertEqual(h.mean(), 0.0)
+        self.assertEqual(h.percentile(50), 0.0)
+
+        # 0.5 µs, 3 µs, 100 µs and 10 ms
+        for seconds in (0.5e-6, 3e-6, 100e-6, 10e-3):
+            h.add(seconds)
+        self.assertEqual(h.count, 4)
+        self.assertEqual(h.buckets[0], 1)
+        self.assertEqual(h.buckets[2], 1)
+        self.assertEqual(h.buckets[7], 1)
+        self.assertEqual(h.buckets[14], 1)
+        self.assertAlmostEqual(h.mean(), (0.5e-6 + 3e-6 + 100e-6 + 10e-3) / 4)
+        self.assertEqual(h.min, 0.5e-6)
+        self.assertEqual(h.max, 10e-3)
+
+        # percentiles are bucket upper bounds, capped by the maximum
+        self.assertEqual(h.percentile(0), 1e-6)
+        self.assertEqual(h.percentile(50), 4e-6)
+        self.assertEqual(h.percentile(75), 128e-6)
+        self.assertEqual(h.percentile(100), 10e-3)
+
+        # very long durations end in the last bucket
+        h.add(1e6)
+        self.assertEqual(h.buckets[-1], 1)
+
+    def test_timer(self):
+        d = Diagnostics()
+        self.assertFalse(d.enabled)
+        with d.timer("op"):
+            pass
+        self.assertEqual(d.histograms, {})
+
+        d.setEnabled(True)
+        for _ in range(3):
+            with d.timer("op"):
+                pass
+        d.count("items", 10)
+        d.count("items", 5)
+        self.assertEqual(d.histograms["op"].count, 3)
+        self.assertEqual(d.counters["items"], 15)
+
+        d.reset()
+        self.assertEqual(d.histograms, {})
+        self.assertEqual(len(d.counters), 0)
+
+    def test_record_threads(self):
+        d = Diagnostics()
+        d.setEnabled(True)
+
+        def record():
+            for _ in range(1000):
+                d.record("op", 1e-3)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(d.histograms["op"].count, 4000)
+
+    def test_report(self):
+        d = Diagnostics()
+        self.assertEqual(d.summaries(), [])
+        d.setEnabled(True)
+        d.record("scan", 0.2)
+        d.record("sort", 1e-3)
+        d.record("sort", 3e-3)
+        d.count("scan_resources", 42)
+
+        summaries = d.summaries()
+        self.assertEqual(len(summaries), 3)
+        self.assertTrue(summaries[0].startswith("scan: 1 calls"))
+        self.assertTrue(summaries[1].startswith("sort: 2 calls, total 4.0 ms"))
+        self.assertEqual(summaries[2], "scan_resources: 42")
+
+        report = d.report()
+        for line in summaries:
+            self.assertIn(line, report)
+        self.assertIn("sort durations:", report)
+        self.assertIn("ms", report)
+
+    def test_instrumented_model(self):
+        DIAGNOSTICS.reset()
+        DIAGNOSTICS.setEnabled(True)
+        try:
+            m = ResourceTableModel(load_resources=False)
+            m.setResourceFilters([":/images/themes/default/"], [])
+            m.reloadResources()
+            fm = ResourceTableFilterModel()
+            fm.setSourceModel(m)
+            fm.sort(m.ciIcon)
+            fm.setPrefixFilters([":/images/themes/default/mAction"])
+            self.assertIn("sort", DIAGNOSTICS.histograms)
+            self.assertIn("filter", DIAGNOSTICS.histograms)
+            m.thumbnailRenderer.stop()
+        finally:
+            DIAGNOSTICS.setEnabled(False)
+            DIAGNOSTICS.reset()
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_fuzzy_search
+    # for specific test
+    python -m unittest tests.qgis.test_fuzzy_search.TestFuzzySearch.test_fuzzy_index
+"""
+
+# PyQGIS
+from qgis.testing import unittest
+
+# project
+from pyqgis_resource_browser.core.fuzzy_search import FuzzyIndex, fuzzyScore
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestFuzzySearch(unittest.TestCase):
+    def test_fuzzy_score(self):
+        self.assertIsNone(fuzzyScore("xyz", "mactionaddimage.svg"))
+        self.assertIsNotNone(fuzzyScore("addimg", "mactionaddimage.svg"))
+
+        # consecutive matches and word starts score higher
+        self.assertGreater(
+            fuzzyScore("addimg", "mactionaddimage.svg"),
+            fuzzyScore("addimg", "mactionaddlayerimage.svg"),
+        )
+        self.assertGreater(fuzzyScore("img", "img.png"), fuzzyScore("img", "mimg.png"))
+
+    def test_fuzzy_index(self):
+        names = [
+            "mActionAddLayer.svg",
+            "mActionAddImage.svg",
+            "mIconImage.svg",
+            "mActionRemoveImage.svg",
+        ]
+        idx = FuzzyIndex(names)
+        self.assertEqual(len(idx), 4)
+        self.assertEqual(idx.name(1), "mactionaddimage.svg")
+
+        results = idx.search("mActionAddImg")
+        self.assertEqual([row for row, score in results], [1])
+
+        rows = [row for row, score in idx.search("img")]
+        self.assertEqual(sorted(rows), [1, 2, 3])
+        self.assertEqual(len(idx.search("img", limit=2)), 2)
+        results = idx.search("img", accept=lambda row: row != 2)
+        self.assertNotIn(2, [row for row, score in results])
+        self.assertEqual(idx.search(""), [])
+
+        idx.extend(["img.png"])
+        self.assertEqual(idx.search("img")[0][0], 4)
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_icon_export
+    # for specific test
+    python -m unittest tests.qgis.test_icon_export.TestIconExport.test_icon_exporter
+"""
+
+# standard library
+import json
+import tempfile
+from pathlib import Path
+
+# PyQGIS
+from qgis.PyQt.QtCore import QCoreApplication, QDeadlineTimer
+from qgis.PyQt.QtGui import QImage
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core import scanResources
+from pyqgis_resource_browser.core.icon_export import (
+    SPRITE_MAP_NAME,
+    IconExporter,
+    iconFileNames,
+    rasterizeIcon,
+)
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestIconExport(unittest.TestCase):
+    def test_icon_file_names(self):
+        self.assertEqual(
+            iconFileNames([":/images/a.svg", ":/images/a.png", ":/images/b"]),
+            ["images/a.png", "images/a.png.png", "images/b.png"],
+        )
+
+    def test_rasterize_icon(self):
+        images = rasterizeIcon(":/images/themes/default/mActionAddImage.svg", [16, 64])
+        self.assertEqual(len(images), 2)
+        self.assertEqual(max(images[0].width(), images[0].height()), 16)
+        self.assertEqual(max(images[1].width(), images[1].height()), 64)
+
+        images = rasterizeIcon(":/images/themes/default/mIconQgis.png", [24])
+        self.assertEqual(max(images[0].width(), images[0].height()), 24)
+
+        self.assertEqual(rasterizeIcon(":/not/a/resource.svg", [16]), [])
+
+    def test_icon_exporter(self):
+        uris = list(
+            scanResources(":/images/themes/default/", suffixes=["svg", "png"])
+        )[:10]
+        uris.append(":/not/a/resource.png")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            exporter = IconExporter(tmp_dir, sizes=(16, 32), icons_per_sheet=4)
+            finished = []
+            exporter.finished.connect(finished.append)
+            exporter.start(uris)
+            self.assertTrue(exporter.isRunning())
+            deadline = QDeadlineTimer(60000)
+            while len(finished) == 0 and not deadline.hasExpired():
+                QCoreApplication.processEvents()
+            self.assertEqual(finished, [True])
+            self.assertEqual(exporter.exportedCount(), 10)
+
+            with open(Path(tmp_dir) / SPRITE_MAP_NAME, encoding="utf-8") as f:
+                sprite_map = json.load(f)
+            self.assertEqual(sprite_map["sizes"], [16, 32])
+            # icons are listed in the order of the resources
+            self.assertEqual(list(sprite_map["icons"]), uris[:10])
+
+            for uri, icon in sprite_map["icons"].items():
+                self.assertTrue((Path(tmp_dir) / "16" / icon["file"]).is_file())
+                for size in (16, 32):
+                    sheet, x, y, width, height = icon[str(size)]
+                    image = QImage(str(Path(tmp_dir) / sheet))
+                    self.assertFalse(image.isNull())
+                    # sheets have 2 columns of 4 icons at most
+                    self.assertLessEqual(image.width(), 2 * size)
+                    self.assertLessEqual(image.height(), 2 * size)
+                    self.assertLessEqual(x + width, image.width())
+                    self.assertLessEqual(y + height, image.height())
+            self.assertEqual(exporter.errors(), [])
+
+    def test_icon_exporter_errors(self):
+        uris = list(scanResources(":/images/themes/default/", suffixes=["svg"]))[:4]
+
+        def export(output_dir: Path) -> IconExporter:
+            exporter = IconExporter(output_dir, sizes=(16, 32), icons_per_sheet=2)
+            finished = []
+            exporter.finished.connect(finished.append)
+            exporter.start(uris)
+            deadline = QDeadlineTimer(60000)
+            while len(finished) == 0 and not deadline.hasExpired():
+                QCoreApplication.processEvents()
+            self.assertEqual(finished, [True])
+            self.assertFalse(exporter.isRunning())
+            return exporter
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # icon files cannot be written below a file
+            (Path(tmp_dir) / "16").write_text("", encoding="utf-8")
+            exporter = export(Path(tmp_dir))
+            self.assertGreater(len(exporter.errors()), 0)
+            self.assertEqual(exporter.exportedCount(), 0)
+            with open(Path(tmp_dir) / SPRITE_MAP_NAME, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["icons"], {})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # the first 32 px sheet cannot be written over a directory
+            (Path(tmp_dir) / "sprites" / "sprite-32-0000.png").mkdir(parents=True)
+            exporter = export(Path(tmp_dir))
+            self.assertEqual(len(exporter.errors()), 1)
+            self.assertEqual(exporter.exportedCount(), 4)
+            with open(Path(tmp_dir) / SPRITE_MAP_NAME, encoding="utf-8") as f:
+                icons = json.load(f)["icons"]
+            self.assertNotIn("32", icons[uris[0]])
+            self.assertIn("16", icons[uris[0]])
+            self.assertIn("32", icons[uris[2]])
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
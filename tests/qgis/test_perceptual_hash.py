@@ -0,0 +1,83 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_perceptual_hash
+    # for specific test
+    python -m unittest tests.qgis.test_perceptual_hash.TestPerceptualHash.test_bk_tree
+"""
+
+# standard library
+import random
+
+# PyQGIS
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.perceptual_hash import (
+    BKTree,
+    hammingDistance,
+    imageDHash,
+)
+from pyqgis_resource_browser.core.resource_table_model import ResourceTableModel
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestPerceptualHash(unittest.TestCase):
+    def test_image_dhash(self):
+        uri = ":/images/themes/default/mActionAddImage.svg"
+        h = imageDHash(uri)
+        self.assertIsInstance(h, int)
+        self.assertTrue(0 <= h < 2**64)
+        self.assertEqual(h, imageDHash(uri))
+        self.assertIsNone(imageDHash(":/not/an/image"))
+
+    def test_bk_tree(self):
+        self.assertEqual(hammingDistance(0b1011, 0b0001), 2)
+
+        rnd = random.Random(42)
+        hashes = [rnd.getrandbits(64) for _ in range(2000)]
+        # a cluster of hashes close to the first one
+        hashes.extend(hashes[0] ^ (1 << i) for i in range(10))
+
+        tree = BKTree()
+        for item, h in enumerate(hashes):
+            tree.add(h, item)
+        self.assertEqual(len(tree), len(hashes))
+
+        for query in hashes[:20]:
+            expected = sorted(
+                (hammingDistance(query, h), item)
+                for item, h in enumerate(hashes)
+                if hammingDistance(query, h) <= 6
+            )
+            self.assertEqual(sorted(tree.search(query, 6)), expected)
+        self.assertEqual(len(tree.search(hashes[0], 1)), 11)
+
+    def test_resource_table_model_similar_rows(self):
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/a.svg", ":/b.svg", ":/c.svg", ":/d.txt"])
+        for path, h in zip(m.RESOURCES, [0b0000, 0b0001, 0b1111, None]):
+            m.resourceIndex.metadata[path] = {"digest": path, "dhash": h}
+
+        self.assertEqual(m.resourceRow(":/c.svg"), 2)
+        self.assertEqual(m.resourceRow(":/e.svg"), -1)
+        self.assertEqual(m.similarRows(0, max_distance=2), [(1, 1)])
+        self.assertEqual(m.similarRows(0, max_distance=4), [(1, 1), (2, 4)])
+        self.assertEqual(m.similarRows(3), [])
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_preview_cache
+    # for specific test
+    python -m unittest tests.qgis.test_preview_cache.TestPreviewCache.test_preview_cache
+"""
+
+# PyQGIS
+from qgis.PyQt.QtCore import QCoreApplication, QDeadlineTimer
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.preview_cache import PreviewCache
+from pyqgis_resource_browser.core.preview_prefetcher import PreviewPrefetcher
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestPreviewCache(unittest.TestCase):
+    def test_preview_cache(self):
+        svg = ":/images/themes/default/mActionAddImage.svg"
+        cache = PreviewCache(16 * 1024**2)
+
+        renderer = cache.svgRenderer(svg)
+        self.assertTrue(renderer.isValid())
+        # the parsed renderer is shared by the next selections
+        self.assertIs(cache.svgRenderer(svg), renderer)
+        self.assertEqual(cache.hits, 1)
+
+        self.assertIsNone(cache.svgRenderer(":/not/an/image.svg"))
+        self.assertTrue(cache.pixmap(":/not/an/image.png").isNull())
+
+        pixmap = cache.pixmap(svg)
+        self.assertFalse(pixmap.isNull())
+        self.assertEqual(cache.pixmap(svg).cacheKey(), pixmap.cacheKey())
+
+        # evicted renderers stay valid while referenced
+        cache.setMaxCost(0)
+        self.assertEqual(len(cache), 0)
+        self.assertTrue(renderer.isValid())
+
+    def test_preview_prefetcher(self):
+        svg = ":/images/themes/default/mActionAddImage.svg"
+        png = ":/images/themes/default/mIconQgis.png"
+        cache = PreviewCache(16 * 1024**2)
+        prefetcher = PreviewPrefetcher(cache)
+        prefetcher.prefetch([svg, png])
+
+        deadline = QDeadlineTimer(10000)
+        while (
+            prefetcher.isPending(svg) or prefetcher.isPending(png)
+        ) and not deadline.hasExpired():
+            QCoreApplication.processEvents()
+        prefetcher.stop()
+
+        self.assertTrue(cache.hasPreview(svg, text=True))
+        self.assertTrue(cache.hasPreview(png))
+        self.assertTrue(cache.svgRenderer(svg).isValid())
+        self.assertFalse(cache.pixmap(png).isNull())
+
+        # the cached text head continues where it stopped
+        text, reader = cache.textHead(svg)
+        self.assertTrue(text.lstrip().startswith("<"))
+        self.assertEqual(reader.offset, len(text.encode("utf-8")))
+
+        # cached previews are not prefetched again
+        prefetcher.prefetch([svg, png])
+        self.assertFalse(prefetcher.isPending(svg))
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
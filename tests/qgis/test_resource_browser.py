@@ -14,11 +14,14 @@ Usage from the repo root folder:
 # standard library
 # import unittest
 
+from qgis.PyQt.QtCore import QCoreApplication, QDeadlineTimer, QEventLoop, Qt, QTimer
 from qgis.PyQt.QtWidgets import QWidget
 from qgis.testing import start_app, unittest
 
+from pyqgis_resource_browser.core.resource_catalog_model import ResourceCatalogModel
 from pyqgis_resource_browser.core.resource_table_model import ResourceTableModel
 from pyqgis_resource_browser.gui.resource_browser import ResourceBrowser
+from pyqgis_resource_browser.toolbelt import PlgOptionsManager
 
 # create a QgsApplication(QApplication)
 app = start_app()
@@ -37,6 +40,74 @@ class TestResourceBrowser(unittest.TestCase):
         # app.exec_()
         self.assertIsInstance(B.resourceModel, ResourceTableModel)
 
+    def test_resource_browser_selection_preview(self):
+        B = ResourceBrowser()
+        B.resourceModel.cancelResourceScan(wait=True)
+        B.resourceModel.updateResources(
+            [
+                ":/images/themes/default/mActionAddImage.svg",
+                ":/images/themes/default/mActionFileOpen.svg",
+                ":/images/themes/default/mActionFileSave.svg",
+            ]
+        )
+        previewed = []
+        updatePreview = B.updatePreview
+
+        def spy(uri: str):
+            previewed.append(uri)
+            updatePreview(uri)
+
+        B.updatePreview = spy
+
+        # rows passed while navigating are not previewed
+        for row in range(3):
+            B.tableView.selectRow(row)
+        self.assertEqual(previewed, [])
+        self.assertTrue(B.previewTimer.isActive())
+
+        loop = QEventLoop()
+        QTimer.singleShot(B.PREVIEW_DELAY * 3, loop.quit)
+        loop.exec()
+        uri = B.tableView.model().index(2, 0).data(Qt.ItemDataRole.UserRole)
+        self.assertEqual(previewed, [uri])
+        self.assertEqual(B.graphicsView.uri, uri)
+        B.close()
+
+    def test_resource_browser_catalog(self):
+        PlgOptionsManager.set_value_from_key("resource_catalog", True)
+        try:
+            B = ResourceBrowser()
+        finally:
+            PlgOptionsManager.set_value_from_key("resource_catalog", False)
+        self.assertIsInstance(B.catalogModel, ResourceCatalogModel)
+        self.assertIs(B.tableView.model(), B.catalogModel)
+        self.assertFalse(B.optionFuzzySearch.isEnabled())
+        self.assertTrue(B.catalogModel.isScanning())
+        deadline = QDeadlineTimer(60000)
+        while B.catalogModel.isScanning() and not deadline.hasExpired():
+            QCoreApplication.processEvents()
+        self.assertGreater(B.resourceCount(), 0)
+        self.assertEqual(len(B.resourceModel), 0)
+
+        B.tbFilter.setText("mActionFileOpen")
+        B.updateFilter()
+        self.assertEqual(B.catalogModel.query().text, "mActionFileOpen")
+        B.catalogModel.fetchMore()
+        uri = B.tableView.model().index(0, 0).data(Qt.ItemDataRole.UserRole)
+        self.assertIn("mActionFileOpen", uri)
+
+        # the catalog is released on close and scanned again when shown
+        file_path = B.catalogModel.catalog.filePath
+        B.show()
+        B.close()
+        self.assertTrue(B.catalogModel.isClosed())
+        self.assertFalse(file_path.exists())
+        self.assertEqual(B.resourceCount(), 0)
+        B.show()
+        self.assertFalse(B.catalogModel.isClosed())
+        self.assertTrue(B.catalogModel.isScanning())
+        B.close()
+
 
 # ############################################################################
 # ####### Stand-alone run ########
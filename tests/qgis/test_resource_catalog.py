@@ -0,0 +1,191 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_resource_catalog
+    # for specific test
+    python -m unittest tests.qgis.test_resource_catalog.TestResourceCatalog.test_catalog_query
+"""
+
+# PyQGIS
+from qgis.PyQt.QtCore import QCoreApplication, QDeadlineTimer, Qt
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core import scanResources
+from pyqgis_resource_browser.core.resource_catalog import (
+    CatalogQuery,
+    ResourceCatalog,
+    wildcardToGlob,
+)
+from pyqgis_resource_browser.core.resource_catalog_model import ResourceCatalogModel
+
+app = start_app()
+
+PATHS = [
+    ":/images/themes/default/mActionAdd.svg",
+    ":/images/themes/default/mActionAdd.png",
+    ":/images/themes/default/mIconFolder.SVG",
+    ":/images/flags/fr.svg",
+    ":/plugins/help/readme.txt",
+]
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestResourceCatalog(unittest.TestCase):
+    def test_wildcard_to_glob(self):
+        self.assertEqual(wildcardToGlob("a*b?"), "*a*b?*")
+        self.assertEqual(wildcardToGlob(r"a\*[!b]"), "*a[*][^b]*")
+
+    def test_catalog_update(self):
+        catalog = ResourceCatalog()
+        self.assertEqual(catalog.addResources(PATHS), len(PATHS))
+        self.assertEqual(catalog.addResources(PATHS[:2]), 0)
+        self.assertEqual(len(catalog), len(PATHS))
+
+        catalog.startUpdate()
+        catalog.addResources(PATHS[1:] + [":/images/new.png"])
+        self.assertEqual(catalog.finishUpdate(), 1)
+        self.assertEqual(len(catalog), len(PATHS))
+        self.assertEqual(catalog.count(CatalogQuery(text="mActionAdd.svg")), 0)
+
+        self.assertEqual(catalog.removeResources([":/images/new.png"]), 1)
+        catalog.clear()
+        self.assertEqual(len(catalog), 0)
+
+    def test_catalog_connect(self):
+        catalog = ResourceCatalog()
+        catalog.addResources(PATHS[:2])
+        writer = catalog.connect()
+        writer.startUpdate()
+        writer.addResources(PATHS[1:])
+        # committed writes of other connections are read at once
+        self.assertEqual(len(catalog), len(PATHS))
+        self.assertEqual(catalog.count(CatalogQuery(text="readme")), 1)
+        self.assertEqual(writer.finishUpdate(), 1)
+        writer.close()
+        self.assertEqual(len(catalog), len(PATHS) - 1)
+
+        # temporary databases are removed with their catalog
+        file_path = catalog.filePath
+        self.assertTrue(file_path.is_file())
+        catalog.close()
+        self.assertFalse(file_path.exists())
+
+    def test_catalog_query(self):
+        catalog = ResourceCatalog()
+        catalog.addResources(PATHS)
+
+        def paths(**kwds) -> list[str]:
+            return [path for path, name in catalog.page(CatalogQuery(**kwds))]
+
+        self.assertEqual(paths(prefixes=(":/images/themes/",)), sorted(PATHS[:3]))
+        self.assertEqual(paths(extensions=("svg",)), sorted([PATHS[0], *PATHS[2:4]]))
+        self.assertEqual(paths(extensions=(".txt",)), [PATHS[4]])
+        self.assertEqual(paths(text="actionadd"), sorted(PATHS[:2]))
+        self.assertEqual(paths(text="actionadd", case_sensitive=True), [])
+        self.assertEqual(
+            paths(text="images*.svg", case_sensitive=True), sorted(PATHS[0::3])
+        )
+        # fragments shorter than a trigram are matched too
+        self.assertEqual(paths(text="fr"), [PATHS[3]])
+        self.assertEqual(paths(text="images", names_only=True), [])
+        self.assertEqual(
+            catalog.count(CatalogQuery(prefixes=(":/images/",), text="folder")), 1
+        )
+
+    def test_catalog_pages(self):
+        catalog = ResourceCatalog()
+        catalog.addResources(PATHS)
+        for sort_key, descending in [("path", False), ("name", True)]:
+            rows = []
+            after = None
+            while True:
+                page = catalog.page(
+                    sort_key=sort_key, descending=descending, after=after, limit=2
+                )
+                rows.extend(page)
+                if len(page) < 2:
+                    break
+                after = catalog.sortKey(page[-1], sort_key)
+            expected = sorted(
+                catalog.page(), key=lambda row: catalog.sortKey(row, sort_key)
+            )
+            if descending:
+                expected.reverse()
+            self.assertEqual(rows, expected)
+
+    def test_catalog_model(self):
+        m = ResourceCatalogModel(page_size=2)
+        m.catalog.addResources(PATHS)
+        m.refresh()
+        self.assertEqual(m.rowCount(), 0)
+        self.assertEqual(m.totalCount(), len(PATHS))
+        self.assertTrue(m.canFetchMore())
+        while m.canFetchMore():
+            m.fetchMore()
+        self.assertEqual(
+            [m.index(r, m.ciUri).data() for r in range(m.rowCount())], sorted(PATHS)
+        )
+
+        m.sort(m.ciIcon, Qt.SortOrder.DescendingOrder)
+        m.fetchMore()
+        self.assertEqual(m.rowCount(), 2)
+        self.assertEqual(m.index(0, m.ciIcon).data(), "readme.txt")
+
+        m.setTextFilter("mAction")
+        while m.canFetchMore():
+            m.fetchMore()
+        self.assertEqual(m.rowCount(), 2)
+        self.assertEqual(m.totalCount(), 2)
+
+        # closing removes the temporary database
+        file_path = m.catalog.filePath
+        m.close()
+        self.assertTrue(m.isClosed())
+        self.assertFalse(file_path.exists())
+        self.assertEqual(m.rowCount(), 0)
+        self.assertEqual(m.totalCount(), 0)
+        self.assertFalse(m.canFetchMore())
+
+        m.setCatalog(ResourceCatalog())
+        m.catalog.addResources(PATHS)
+        m.setTextFilter("")
+        m.fetchMore()
+        self.assertEqual(m.rowCount(), 2)
+
+    def test_catalog_model_scan(self):
+        m = ResourceCatalogModel()
+        self.assertTrue(m.setResourceFilters([":/images/themes/default/"], ["svg"]))
+        self.assertFalse(m.setResourceFilters([":/images/themes/default/"], ["svg"]))
+        m.catalog.addResources([":/images/themes/default/gone.svg"])
+        updates = []
+        m.resourcesUpdated.connect(lambda added, removed: updates.append(removed))
+        m.startResourceScan(chunk_size=50)
+        self.assertTrue(m.isScanning())
+        deadline = QDeadlineTimer(60000)
+        while m.isScanning() and not deadline.hasExpired():
+            QCoreApplication.processEvents()
+
+        expected = list(
+            scanResources(prefixes=[":/images/themes/default/"], suffixes=["svg"])
+        )
+        # the scanner thread added the resources and removed the missing one
+        self.assertEqual(updates, [1])
+        self.assertEqual(m.totalCount(), len(expected))
+        m.fetchMore()
+        self.assertEqual(m.index(0, m.ciUri).data(), min(expected))
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
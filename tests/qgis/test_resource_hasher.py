@@ -0,0 +1,82 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_resource_hasher
+    # for specific test
+    python -m unittest tests.qgis.test_resource_hasher.TestResourceHasher.test_resource_digest
+"""
+
+# PyQGIS
+from qgis.PyQt.QtCore import QEventLoop, QTimer
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.resource_hasher import resourceDigest
+from pyqgis_resource_browser.core.resource_table_model import ResourceTableModel
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestResourceHasher(unittest.TestCase):
+    def test_resource_digest(self):
+        uri = ":/images/themes/default/mActionAddImage.svg"
+        digest = resourceDigest(uri)
+        self.assertIsInstance(digest, str)
+        self.assertEqual(len(digest), 32)
+        self.assertEqual(digest, resourceDigest(uri))
+        self.assertIsNone(resourceDigest(":/not/a/resource"))
+
+    def test_resource_table_model_hashing(self):
+        m = ResourceTableModel(load_resources=False)
+        m.setResourceFilters([":/images/themes/default/"], ["svg"])
+        m.reloadResources()
+        self.assertTrue(len(m) > 0)
+
+        loop = QEventLoop()
+        results = []
+        m.hashingFinished.connect(results.append)
+        m.hashingFinished.connect(loop.quit)
+        QTimer.singleShot(60000, loop.quit)
+
+        m.startResourceHashing(chunk_size=100)
+        self.assertTrue(m.isHashing())
+        loop.exec()
+
+        self.assertEqual(results, [True])
+        for row in range(len(m)):
+            self.assertEqual(m.digest(row), resourceDigest(m.RESOURCES.path(row)))
+            self.assertIsInstance(m.perceptualHash(row), int)
+
+        # resources are not hashed again
+        m.startResourceHashing()
+        self.assertFalse(m.isHashing())
+        self.assertEqual(results, [True, True])
+
+    def test_resource_table_model_duplicates(self):
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/a.svg", ":/b.svg", ":/c.svg", ":/d.svg"])
+        for path, digest in zip(m.RESOURCES, ["x", "y", "x", "x"]):
+            m.resourceIndex.metadata[path] = {"digest": digest}
+        m.startResourceHashing()
+
+        self.assertEqual([m.duplicateCount(row) for row in range(4)], [2, 0, 2, 2])
+        self.assertEqual(m.duplicateRows(), [0, 2, 3])
+        self.assertEqual(m.duplicateRows([3, 1, 0]), [3, 0])
+        self.assertEqual(m.index(0, m.ciDuplicates).data(), 2)
+        self.assertIsNone(m.index(1, m.ciDuplicates).data())
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
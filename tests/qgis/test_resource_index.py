@@ -0,0 +1,82 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_resource_index
+    # for specific test
+    python -m unittest tests.qgis.test_resource_index.TestResourceIndex.test_resource_index_roundtrip
+"""
+
+# standard library
+import tempfile
+from pathlib import Path
+
+# PyQGIS
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.resource_index import (
+    ResourceIndex,
+    resourceFingerprint,
+)
+from pyqgis_resource_browser.core.resource_table_model import ResourceTableModel
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestResourceIndex(unittest.TestCase):
+    def test_resource_fingerprint(self):
+        fp = resourceFingerprint()
+        self.assertIsInstance(fp, str)
+        self.assertEqual(fp, resourceFingerprint())
+
+    def test_resource_index_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index_path = Path(tmp_dir) / "sub" / "index.json"
+            self.assertIsNone(ResourceIndex.load(index_path))
+
+            idx = ResourceIndex(
+                fingerprint="abc",
+                paths=[":/a.svg", ":/b/c.png"],
+                metadata={":/a.svg": {"size": 12}, ":/b/c.png": {}},
+            )
+            idx.save(index_path)
+
+            idx2 = ResourceIndex.load(index_path)
+            self.assertEqual(idx2.fingerprint, "abc")
+            self.assertEqual(idx2.paths, idx.paths)
+            self.assertEqual(idx2.metadata, {":/a.svg": {"size": 12}})
+
+            index_path.write_text("not json", encoding="utf-8")
+            self.assertIsNone(ResourceIndex.load(index_path))
+
+    def test_resource_table_model_index(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index_path = Path(tmp_dir) / "index.json"
+            m = ResourceTableModel(load_resources=False, index_path=index_path)
+            self.assertFalse(m.loadResourceIndex())
+            m.reloadResources()
+            self.assertTrue(index_path.is_file())
+            self.assertEqual(m.resourceIndex.fingerprint, resourceFingerprint())
+
+            m2 = ResourceTableModel(load_resources=False, index_path=index_path)
+            self.assertTrue(m2.loadResourceIndex())
+            self.assertEqual(list(m2.RESOURCES), list(m.RESOURCES))
+            # the index refers to the store instead of keeping a list of paths
+            self.assertIs(m.resourceIndex.paths, m.RESOURCES)
+            self.assertIs(m2.resourceIndex.paths, m2.RESOURCES)
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_resource_properties
+    # for specific test
+    python -m unittest tests.qgis.test_resource_properties.TestResourceProperties.test_svg_size
+"""
+
+# PyQGIS
+from qgis.PyQt.QtCore import QCoreApplication, QDeadlineTimer, QFileInfo, Qt
+from qgis.PyQt.QtGui import QImage
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.resource_properties import (
+    PropertyFilter,
+    parsePropertyFilters,
+    resourceProperties,
+    svgSize,
+)
+from pyqgis_resource_browser.core.resource_table_model import (
+    ResourceTableFilterModel,
+    ResourceTableModel,
+)
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestResourceProperties(unittest.TestCase):
+    def test_svg_size(self):
+        self.assertEqual(
+            svgSize(b'<?xml version="1.0"?>\n<svg width="16" height="16px">'), (16, 16)
+        )
+        # relative lengths fall back to the viewBox
+        self.assertEqual(
+            svgSize(b'<svg width="100%"\n height="100%" viewBox="0,0,24.5,12">'),
+            (24, 12),
+        )
+        self.assertIsNone(svgSize(b"<svg>"))
+        self.assertIsNone(svgSize(b"<html></html>"))
+
+    def test_resource_properties(self):
+        svg = ":/images/themes/default/mActionAddImage.svg"
+        properties = resourceProperties(svg)
+        self.assertEqual(properties["size"], QFileInfo(svg).size())
+        self.assertEqual(properties["format"], "svg")
+        self.assertIsInstance(properties["width"], int)
+
+        png = ":/images/themes/default/mIconQgis.png"
+        image = QImage(png)
+        properties = resourceProperties(png)
+        self.assertEqual(properties["format"], "png")
+        self.assertEqual(properties["width"], image.width())
+        self.assertEqual(properties["height"], image.height())
+
+        properties = resourceProperties(":/not/a/resource")
+        self.assertIsNone(properties["format"])
+        self.assertIsNone(properties["width"])
+
+    def test_parse_property_filters(self):
+        text, filters = parsePropertyFilters("icon width>=48 size<2k format:PNG")
+        self.assertEqual(text, "icon")
+        self.assertEqual(
+            filters,
+            [
+                PropertyFilter("width", ">=", 48),
+                PropertyFilter("size", "<", 2048),
+                PropertyFilter("format", ":", "png"),
+            ],
+        )
+        self.assertTrue(filters[0].accepts(64))
+        self.assertFalse(filters[0].accepts(None))
+
+        # other words are kept as they are
+        self.assertEqual(parsePropertyFilters("a*b "), ("a*b ", []))
+        self.assertEqual(parsePropertyFilters("width>4k"), ("width>4k", []))
+
+    def test_resource_table_model_properties(self):
+        m = ResourceTableModel(load_resources=False)
+        m.setResourceFilters([":/images/themes/default/"], ["png"])
+        m.reloadResources()
+        n = len(m)
+        self.assertTrue(n > 1)
+
+        m.startResourceInspection(chunk_size=10)
+        self.assertTrue(m.isInspecting())
+        deadline = QDeadlineTimer(60000)
+        while m.isInspecting() and not deadline.hasExpired():
+            QCoreApplication.processEvents()
+
+        for row in range(n):
+            self.assertEqual(m.resourceProperty(row, "format"), "png")
+            self.assertIsInstance(m.resourceProperty(row, "width"), int)
+        self.assertEqual(m.index(0, m.ciFormat).data(), "PNG")
+
+        fm = ResourceTableFilterModel()
+        fm.setSourceModel(m)
+        fm.sort(m.ciWidth, Qt.SortOrder.AscendingOrder)
+        widths = [fm.index(r, m.ciWidth).data() for r in range(fm.rowCount())]
+        self.assertEqual(widths, sorted(widths))
+
+        fm.setPropertyFilters([PropertyFilter("width", "<=", widths[0])])
+        self.assertTrue(fm.rowCount() > 0)
+        for r in range(fm.rowCount()):
+            self.assertEqual(fm.index(r, m.ciWidth).data(), widths[0])
+        fm.setPropertyFilters([])
+        self.assertEqual(fm.rowCount(), n)
+
+        # properties are not read again
+        m.startResourceInspection()
+        self.assertFalse(m.isInspecting())
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
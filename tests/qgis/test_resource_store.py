@@ -0,0 +1,112 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_resource_store
+    # for specific test
+    python -m unittest tests.qgis.test_resource_store.TestResourceStore.test_resource_store
+"""
+
+# PyQGIS
+from qgis.testing import unittest
+
+# project
+from pyqgis_resource_browser.core.resource_store import SEGMENT_ROWS, ResourceStore
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestResourceStore(unittest.TestCase):
+    def test_resource_store(self):
+        paths = [":/images/a.svg", ":/top.txt", ":/images/b", ":/images/c.tar.gz"]
+        store = ResourceStore(paths)
+
+        self.assertEqual(len(store), 4)
+        self.assertEqual(list(store), paths)
+        self.assertEqual(store[1], ":/top.txt")
+        self.assertEqual(
+            [store.name(i) for i in range(4)], ["a.svg", "top.txt", "b", "c.tar.gz"]
+        )
+        self.assertEqual(
+            [store.directory(i) for i in range(4)],
+            [":/images", ":", ":/images", ":/images"],
+        )
+        self.assertEqual(
+            [store.extension(i) for i in range(4)], ["svg", "txt", "", "gz"]
+        )
+        self.assertEqual(store.directoryId(0), store.directoryId(2))
+
+        store.extend([":/x/y.png"])
+        self.assertEqual(store.path(4), ":/x/y.png")
+        self.assertEqual(store.name(4), "y.png")
+
+        store.removeRows(1, 2)
+        self.assertEqual(
+            list(store), [":/images/a.svg", ":/images/c.tar.gz", ":/x/y.png"]
+        )
+        self.assertEqual(store.name(2), "y.png")
+
+        store.removeRows(2, 2)
+        self.assertEqual(list(store), [":/images/a.svg", ":/images/c.tar.gz"])
+
+        store.extend([":/x/y.png"])
+        store.permute([2, 0, 1])
+        self.assertEqual(
+            list(store), [":/x/y.png", ":/images/a.svg", ":/images/c.tar.gz"]
+        )
+        self.assertEqual(
+            [store.name(i) for i in range(3)], ["y.png", "a.svg", "c.tar.gz"]
+        )
+        self.assertEqual([store.extension(i) for i in range(3)], ["png", "svg", "gz"])
+        self.assertEqual(store.directory(0), ":/x")
+
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertEqual(list(store), [])
+
+    def test_resource_store_segments(self):
+        paths = [f":/dir{i % 7}/icon{i}.svg" for i in range(3 * SEGMENT_ROWS + 5)]
+        store = ResourceStore()
+        # chunks not aligned with segments
+        for i in range(0, len(paths), 300):
+            store.extend(paths[i : i + 300])
+        self.assertEqual(list(store), paths)
+        self.assertEqual(store.name(SEGMENT_ROWS), f"icon{SEGMENT_ROWS}.svg")
+
+        # rows removed across a segment boundary
+        first, last = SEGMENT_ROWS - 10, 2 * SEGMENT_ROWS + 10
+        store.removeRows(first, last)
+        del paths[first : last + 1]
+        self.assertEqual(list(store), paths)
+        self.assertEqual([store.path(r) for r in range(len(store))], paths)
+
+        # scattered rows removed at once
+        rows = set(range(5, len(paths), 3))
+        store.removeRowSet(rows)
+        paths = [path for row, path in enumerate(paths) if row not in rows]
+        self.assertEqual(list(store), paths)
+        self.assertEqual(
+            [store.name(r) for r in range(len(store))],
+            [path.rsplit("/", 1)[1] for path in paths],
+        )
+        self.assertEqual(store.directory(len(store) - 1), paths[-1].rsplit("/", 1)[0])
+
+        store.extend([":/x/y.png"])
+        paths.append(":/x/y.png")
+        rows = list(reversed(range(len(paths))))
+        store.permute(rows)
+        self.assertEqual(list(store), [paths[r] for r in rows])
+        self.assertEqual(store.name(0), "y.png")
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
@@ -12,14 +12,24 @@ Usage from the repo root folder:
 """
 
 # PyQGIS
-from qgis.PyQt.QtCore import Qt
-from qgis.testing import unittest
+from qgis.PyQt.QtCore import (
+    QEventLoop,
+    QPersistentModelIndex,
+    QRegularExpression,
+    Qt,
+    QTimer,
+)
+from qgis.testing import start_app, unittest
 
+from pyqgis_resource_browser.core import scanResources
 from pyqgis_resource_browser.core.resource_table_model import (
     ResourceTableFilterModel,
     ResourceTableModel,
+    naturalSortKey,
 )
 
+app = start_app()
+
 # ############################################################################
 # ########## Classes #############
 # ################################
@@ -51,6 +61,288 @@ class TestResourceTableModel(unittest.TestCase):
             uri = fm.index(row, 0).data(Qt.ItemDataRole.UserRole)
             self.assertTrue(uri.startswith(":/images/"))
 
+    def test_resource_table_filter_model_accept_mask(self):
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/images/a.svg", ":/images/b.png", ":/other/c.svg"])
+
+        fm = ResourceTableFilterModel()
+        fm.setSourceModel(m)
+        fm.setPrefixFilters([":/images/"])
+        fm.setFileTypeFilters(["svg"])
+        self.assertEqual(fm.rowCount(), 1)
+
+        # the accept mask follows inserted and removed source rows
+        m.updateResources(
+            [":/images/a.svg", ":/other/c.svg", ":/images/d.svg", ":/images/e.png"]
+        )
+        self.assertEqual(
+            sorted(fm.index(r, 0).data(Qt.ItemDataRole.UserRole) for r in range(2)),
+            [":/images/a.svg", ":/images/d.svg"],
+        )
+        self.assertEqual(fm.rowCount(), 2)
+
+        m.updateResources([":/other/c.svg", ":/images/e.png"])
+        self.assertEqual(fm.rowCount(), 0)
+        fm.setFileTypeFilters([])
+        self.assertEqual(fm.rowCount(), 1)
+
+    def test_resource_table_filter_model_text_filter(self):
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/images/add.svg", ":/images/addImage.png", ":/a/b.svg"])
+
+        fm = ResourceTableFilterModel()
+        fm.setSourceModel(m)
+
+        def uris() -> list[str]:
+            return sorted(
+                fm.index(r, 0).data(Qt.ItemDataRole.UserRole)
+                for r in range(fm.rowCount())
+            )
+
+        fm.setTextFilter(QRegularExpression("add"))
+        self.assertEqual(uris(), [":/images/add.svg", ":/images/addImage.png"])
+
+        # narrowing only tests the accepted rows again
+        fm.setTextFilter(QRegularExpression("addI"), narrowing=True)
+        self.assertEqual(uris(), [":/images/addImage.png"])
+
+        # the text mask follows inserted rows
+        m.appendResources([":/images/addIcon.svg"])
+        self.assertEqual(uris(), [":/images/addIcon.svg", ":/images/addImage.png"])
+
+        fm.setTextFilter(QRegularExpression("svg"))
+        self.assertEqual(
+            uris(), [":/a/b.svg", ":/images/add.svg", ":/images/addIcon.svg"]
+        )
+
+        # fragments are looked up in the trigram index first
+        fm.setTextFilter(QRegularExpression("add.*svg"), fragments=["add", "svg"])
+        self.assertEqual(uris(), [":/images/add.svg", ":/images/addIcon.svg"])
+        fm.setTextFilter(QRegularExpression("b"), fragments=["b.svg"])
+        self.assertEqual(uris(), [":/a/b.svg"])
+
+        fm.setTextFilter(QRegularExpression())
+        self.assertEqual(fm.rowCount(), len(m))
+
+    def test_resource_table_filter_model_text_mask_cache(self):
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/images/add.svg", ":/images/addImage.png", ":/a/b.svg"])
+        fm = ResourceTableFilterModel()
+        fm.setSourceModel(m)
+        cache = fm.textMaskCache
+
+        fm.setTextFilter(QRegularExpression("add"))
+        fm.setTextFilter(QRegularExpression("addI"), narrowing=True)
+        self.assertEqual(fm.rowCount(), 1)
+        self.assertEqual(cache.hits, 0)
+
+        # going back to a previous filter reuses its mask
+        fm.setTextFilter(QRegularExpression("add"))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(fm.rowCount(), 2)
+
+        # case sensitivity is part of the key
+        expr = QRegularExpression(
+            "ADD", QRegularExpression.PatternOption.CaseInsensitiveOption
+        )
+        fm.setTextFilter(expr)
+        self.assertEqual(fm.rowCount(), 2)
+        fm.setTextFilter(QRegularExpression("ADD"))
+        self.assertEqual(fm.rowCount(), 0)
+        fm.setTextFilter(expr)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(fm.rowCount(), 2)
+
+        # masks of other filters are dropped when source rows change
+        m.appendResources([":/images/addIcon.svg"])
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(fm.rowCount(), 3)
+        fm.setTextFilter(QRegularExpression("add"))
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(fm.rowCount(), 3)
+
+    def test_resource_table_filter_model_ranking(self):
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/a/addImage.svg", ":/b/img.png", ":/c/other.svg"])
+
+        fm = ResourceTableFilterModel()
+        fm.setSourceModel(m)
+        fm.sort(0, Qt.SortOrder.DescendingOrder)
+
+        # search results are model rows, whatever the model order
+        results = m.fuzzySearch("img")
+        self.assertEqual(
+            [m.RESOURCES.path(row) for row, score in results],
+            [":/b/img.png", ":/a/addImage.svg"],
+        )
+        fm.setRanking([row for row, score in results])
+        self.assertEqual(
+            [fm.index(r, 0).data(Qt.ItemDataRole.UserRole) for r in range(2)],
+            [":/b/img.png", ":/a/addImage.svg"],
+        )
+        self.assertEqual(fm.rowCount(), 2)
+
+        # ranked rows follow removed source rows
+        m.updateResources([":/b/img.png", ":/c/other.svg"])
+        self.assertEqual(fm.ranking(), [m.resourceRow(":/b/img.png")])
+        self.assertEqual(fm.rowCount(), 1)
+
+        fm.setRanking(None)
+        self.assertEqual(fm.rowCount(), 2)
+
+    def test_resource_table_model_sort(self):
+        self.assertEqual(
+            sorted(["a10", "a2", "A1"], key=naturalSortKey), ["A1", "a2", "a10"]
+        )
+
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/b/icon10.svg", ":/a/icon2.svg", ":/a/Icon1.png"])
+        fm = ResourceTableFilterModel()
+        fm.setSourceModel(m)
+        fm.setFileTypeFilters(["svg"])
+
+        def names(model) -> list[str]:
+            return [model.index(r, m.ciIcon).data() for r in range(model.rowCount())]
+
+        # the model sorts its rows, the proxy keeps their order
+        fm.sort(m.ciIcon, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(fm.sortColumn(), -1)
+        self.assertEqual(names(m), ["Icon1.png", "icon2.svg", "icon10.svg"])
+        self.assertEqual(names(fm), ["icon2.svg", "icon10.svg"])
+
+        # search indexes find the reordered rows
+        self.assertEqual(m.candidateRows(["icon10"]), [2])
+        self.assertEqual([row for row, score in m.fuzzySearch("icon2")], [1])
+
+        # masks and persistent indexes follow the reordered rows
+        idx = QPersistentModelIndex(fm.index(0, 0))
+        fm.sort(m.ciUri, Qt.SortOrder.DescendingOrder)
+        self.assertEqual(names(m), ["icon10.svg", "icon2.svg", "Icon1.png"])
+        self.assertEqual(names(fm), ["icon10.svg", "icon2.svg"])
+        self.assertEqual(idx.data(Qt.ItemDataRole.UserRole), ":/a/icon2.svg")
+
+        # appended rows are sorted once updated
+        m.updateResources(
+            [":/b/icon10.svg", ":/a/icon2.svg", ":/a/Icon1.png", ":/a/icon3.svg"]
+        )
+        self.assertEqual(names(fm), ["icon10.svg", "icon3.svg", "icon2.svg"])
+        self.assertEqual(m.candidateRows(["icon3"]), [1])
+
+    def test_resource_table_model_scan_filters(self):
+        all_resources = list(scanResources())
+        prefixes = [":/images/"]
+        suffixes = ["svg"]
+        expected = [
+            r for r in all_resources if r.startswith(":/images/") and r.endswith("svg")
+        ]
+        self.assertEqual(
+            list(scanResources(prefixes=prefixes, suffixes=suffixes)), expected
+        )
+
+        m = ResourceTableModel(load_resources=False)
+        self.assertTrue(m.setResourceFilters(prefixes, suffixes))
+        self.assertFalse(m.setResourceFilters(prefixes, suffixes))
+        m.reloadResources()
+        self.assertEqual(sorted(m.RESOURCES), sorted(expected))
+
+        # unfiltered resources are removed on reload
+        m.setResourceFilters(prefixes, ["png"])
+        m.reloadResources()
+        for uri in m.RESOURCES:
+            self.assertTrue(uri.endswith("png"))
+
+    def test_resource_table_model_trigram_index(self):
+        m = ResourceTableModel(load_resources=False)
+        m.updateResources([":/a/add.svg", ":/b/addImage.png", ":/c/other.svg"])
+        # rows not indexed yet are candidates
+        self.assertEqual(len(m._trigramIndex), 0)
+        self.assertEqual(m.candidateRows(["add"]), [0, 1, 2])
+
+        index = m.trigramIndex()
+        self.assertEqual(len(index), 3)
+        self.assertEqual(m.candidateRows(["add"]), [0, 1])
+
+        # removed rows are not candidates anymore, the index is kept
+        m.updateResources([":/b/addImage.png", ":/c/other.svg", ":/d/add.png"])
+        self.assertIs(m.trigramIndex(), index)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(
+            [m.RESOURCES.path(row) for row in m.candidateRows(["add"])],
+            [":/b/addImage.png", ":/d/add.png"],
+        )
+        self.assertEqual(
+            [m.RESOURCES.path(row) for row, score in m.fuzzySearch("add")],
+            [":/d/add.png", ":/b/addImage.png"],
+        )
+
+        # index rows are numbered again once most rows are removed
+        m.updateResources([":/c/other.svg"])
+        self.assertIsNot(m.trigramIndex(), index)
+        self.assertEqual(len(m.trigramIndex()), 1)
+        self.assertEqual(m.candidateRows(["other"]), [0])
+
+    def test_resource_table_model_update(self):
+        m = ResourceTableModel(load_resources=False)
+        m.appendResources([":/a.svg", ":/b.svg", ":/c.svg", ":/d.svg"])
+
+        inserted = []
+        removed = []
+        resets = []
+        m.rowsInserted.connect(lambda p, first, last: inserted.append((first, last)))
+        m.rowsRemoved.connect(lambda p, first, last: removed.append((first, last)))
+        m.modelReset.connect(lambda: resets.append(True))
+
+        result = m.updateResources([":/a.svg", ":/d.svg", ":/e.svg", ":/f.svg"])
+        self.assertEqual(result, (2, 2))
+        self.assertEqual(
+            list(m.RESOURCES), [":/a.svg", ":/d.svg", ":/e.svg", ":/f.svg"]
+        )
+        self.assertEqual(removed, [(1, 2)])
+        self.assertEqual(inserted, [(2, 3)])
+        self.assertEqual(resets, [])
+
+        # nothing changed, nothing emitted
+        self.assertEqual(m.updateResources(list(m.RESOURCES)), (0, 0))
+        self.assertEqual(len(inserted) + len(removed), 2)
+
+        # scattered rows are removed at once, as a layout change
+        layouts = []
+        m.layoutChanged.connect(lambda: layouts.append(True))
+        kept = QPersistentModelIndex(m.index(2, 0))
+        gone = QPersistentModelIndex(m.index(1, 0))
+        self.assertEqual(m.updateResources([":/a.svg", ":/e.svg"]), (0, 2))
+        self.assertEqual(list(m.RESOURCES), [":/a.svg", ":/e.svg"])
+        self.assertEqual(len(removed), 1)
+        self.assertEqual(layouts, [True])
+        self.assertEqual(kept.row(), 1)
+        self.assertFalse(gone.isValid())
+        self.assertEqual(m.resourceRow(":/e.svg"), 1)
+
+    def test_resource_table_model_streaming_scan(self):
+        m = ResourceTableModel(load_resources=False)
+        m.reloadResources()
+        expected = sorted(m.RESOURCES)
+
+        loop = QEventLoop()
+        results = []
+        m.scanFinished.connect(results.append)
+        m.scanFinished.connect(loop.quit)
+        QTimer.singleShot(60000, loop.quit)
+
+        m.startResourceScan(chunk_size=100)
+        self.assertTrue(m.isScanning())
+        loop.exec()
+
+        self.assertEqual(results, [True])
+        self.assertFalse(m.isScanning())
+        self.assertEqual(sorted(m.RESOURCES), expected)
+
+        # a cancelled scan keeps what was found so far
+        m.startResourceScan(chunk_size=100)
+        m.cancelResourceScan(wait=True)
+        self.assertFalse(m.isScanning())
+        self.assertTrue(len(m) <= len(expected))
+
 
 # ############################################################################
 # ####### Stand-alone run ########
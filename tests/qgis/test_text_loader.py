@@ -0,0 +1,95 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_text_loader
+    # for specific test
+    python -m unittest tests.qgis.test_text_loader.TestTextLoader.test_text_loader
+"""
+
+# standard library
+import codecs
+
+# PyQGIS
+from qgis.PyQt.QtCore import QEventLoop, QFile, QTimer
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.text_loader import (
+    TextLoader,
+    TextReader,
+    createTextDecoder,
+    isTextResource,
+)
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestTextLoader(unittest.TestCase):
+    def load(self, loader: TextLoader) -> str:
+        chunks = []
+        loop = QEventLoop()
+        loader.chunkReady.connect(chunks.append)
+        loader.finished.connect(loop.quit)
+        QTimer.singleShot(10000, loop.quit)
+        loader.start()
+        loop.exec()
+        return "".join(chunks)
+
+    def test_text_decoder(self):
+        text = "é€ text"
+        data = codecs.BOM_UTF8 + text.encode("utf-8")
+        decoder = createTextDecoder(data)
+        # multi-byte characters split between chunks are decoded once complete
+        decoded = "".join(decoder.decode(data[i : i + 1]) for i in range(len(data)))
+        self.assertEqual(decoded + decoder.decode(b"", True), text)
+
+        data = codecs.BOM_UTF16_LE + text.encode("utf-16-le")
+        self.assertEqual(createTextDecoder(data).decode(data, True), text)
+
+    def test_text_loader(self):
+        uri = ":/images/themes/default/mActionAddImage.svg"
+        file = QFile(uri)
+        self.assertTrue(file.open(QFile.OpenModeFlag.ReadOnly))
+        expected = bytes(file.readAll()).decode("utf-8-sig").replace("\r\n", "\n")
+        file.close()
+        self.assertTrue(len(expected) > 100)
+
+        # a capped load, continued where it stopped
+        reader = TextReader(uri)
+        text = self.load(TextLoader(reader=reader, max_bytes=100, chunk_size=16))
+        self.assertFalse(reader.atEnd())
+        self.assertEqual(reader.offset, 100)
+
+        # a copy continues independently
+        copied = reader.copy()
+        self.assertEqual(text + "".join(copied.read(10**9)), expected)
+        self.assertEqual(reader.offset, 100)
+
+        text += self.load(TextLoader(reader=reader, max_bytes=10**9))
+        self.assertTrue(reader.atEnd())
+        self.assertEqual(text, expected)
+
+        missing = TextReader(":/not/a/resource")
+        self.assertEqual(self.load(TextLoader(reader=missing)), "")
+        self.assertTrue(missing.atEnd())
+
+    def test_is_text_resource(self):
+        self.assertTrue(isTextResource(":/images/themes/default/mActionAddImage.svg"))
+        self.assertTrue(isTextResource("/path/to/README.TXT"))
+        self.assertFalse(isTextResource(":/images/themes/default/mIconQgis.png"))
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_thumbnail_cache
+    # for specific test
+    python -m unittest tests.qgis.test_thumbnail_cache.TestThumbnailCache.test_lru_cache
+"""
+
+# PyQGIS
+from qgis.PyQt.QtCore import QEventLoop, QSize, QTimer
+from qgis.PyQt.QtGui import QPixmap
+from qgis.testing import start_app, unittest
+
+# project
+from pyqgis_resource_browser.core.lru_cache import LRUCache
+from pyqgis_resource_browser.core.thumbnail_cache import ThumbnailCache, pixmapCost
+from pyqgis_resource_browser.core.thumbnail_renderer import ThumbnailRenderer
+
+app = start_app()
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestThumbnailCache(unittest.TestCase):
+    def test_lru_cache(self):
+        cache = LRUCache(max_cost=10, cost=len)
+        cache.insert("a", "xxxx")
+        cache.insert("b", "xxxx")
+        self.assertEqual(cache.get("a"), "xxxx")
+        # "b" is the least recently used value
+        cache.insert("c", "xxxx")
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.totalCost, 8)
+
+        # too expensive to be cached
+        cache.insert("d", "x" * 11)
+        self.assertNotIn("d", cache)
+
+        cache.setMaxCost(4)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(
+            cache.stats(),
+            {
+                "entries": 1,
+                "cost": 4,
+                "max_cost": 4,
+                "hits": 1,
+                "misses": 1,
+                "evictions": 2,
+            },
+        )
+
+    def test_thumbnail_cache(self):
+        uri = ":/images/themes/default/mActionAddImage.svg"
+        size = QSize(16, 16)
+        cache = ThumbnailCache(1024**2)
+
+        pixmap = cache.thumbnail(uri, size, 2.0)
+        self.assertIsInstance(pixmap, QPixmap)
+        self.assertFalse(pixmap.isNull())
+        self.assertEqual(pixmap.width(), 32)
+        self.assertEqual(cache.misses, 1)
+
+        self.assertIs(cache.thumbnail(uri, size, 2.0), pixmap)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.totalCost, pixmapCost(pixmap))
+
+        # other size, other thumbnail
+        cache.thumbnail(uri, size, 1.0)
+        self.assertEqual(len(cache), 2)
+
+        self.assertTrue(cache.thumbnail(":/not/an/image", size).isNull())
+
+    def test_thumbnail_renderer(self):
+        uri = ":/images/themes/default/mActionAddImage.svg"
+        size = QSize(16, 16)
+        renderer = ThumbnailRenderer(ThumbnailCache(1024**2))
+
+        loop = QEventLoop()
+        ready = []
+        renderer.thumbnailReady.connect(lambda u, row: ready.append((u, row)))
+        renderer.thumbnailReady.connect(loop.quit)
+        QTimer.singleShot(10000, loop.quit)
+
+        # not rendered yet: a placeholder is shown meanwhile
+        self.assertIsNone(renderer.thumbnail(uri, size, 1.0, 3))
+        self.assertTrue(renderer.isPending(uri))
+        loop.exec()
+
+        self.assertEqual(ready, [(uri, 3)])
+        self.assertFalse(renderer.isPending(uri))
+        pixmap = renderer.thumbnail(uri, size, 1.0, 3)
+        self.assertFalse(pixmap.isNull())
+
+        # waiting requests can be cancelled
+        renderer.pool.setMaxThreadCount(1)
+        for i in range(50):
+            renderer.thumbnail(uri, QSize(i + 20, i + 20), 1.0, i)
+        renderer.cancel()
+        renderer.stop()
+        self.assertEqual(renderer.pool.activeThreadCount(), 0)
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#! python3  # noqa E265
+
+"""
+Usage from the repo root folder:
+
+.. code-block:: bash
+
+    # for whole tests
+    python -m unittest tests.qgis.test_trigram_index
+    # for specific test
+    python -m unittest tests.qgis.test_trigram_index.TestTrigramIndex.test_trigram_index
+"""
+
+# PyQGIS
+from qgis.testing import unittest
+
+# project
+from pyqgis_resource_browser.core.trigram_index import (
+    TrigramIndex,
+    wildcardFragments,
+)
+
+# ############################################################################
+# ########## Classes #############
+# ################################
+
+
+class TestTrigramIndex(unittest.TestCase):
+    def test_wildcard_fragments(self):
+        self.assertEqual(wildcardFragments("mAction*Add?mg"), ["mAction", "Add", "mg"])
+        self.assertEqual(wildcardFragments("icon[0-9].svg"), ["icon", ".svg"])
+        self.assertEqual(wildcardFragments("*"), [])
+
+    def test_trigram_index(self):
+        paths = [":/images/mActionAdd.svg", ":/images/addImage.png", ":/a/b.svg"]
+        idx = TrigramIndex(paths)
+        self.assertEqual(len(idx), 3)
+
+        # fragments shorter than a trigram do not exclude any row
+        self.assertIsNone(idx.candidates(["ad"]))
+        self.assertIsNone(idx.candidates([]))
+
+        self.assertEqual(idx.candidates(["ADD"]), [0, 1])
+        self.assertEqual(idx.candidates(["add", ".svg"]), [0])
+        self.assertEqual(idx.candidates(["missing"]), [])
+
+        # appended paths continue the row numbers
+        idx.extend([":/images/add.svg"])
+        self.assertEqual(len(idx), 4)
+        self.assertEqual(idx.candidates(["add", ".svg"]), [0, 3])
+
+        # candidates are a superset of the matching rows
+        for fragment in ["images/", "svg", "ction"]:
+            expected = [r for r, p in enumerate(paths) if fragment in p.lower()]
+            self.assertTrue(set(expected) <= set(idx.candidates([fragment])))
+
+
+# ############################################################################
+# ####### Stand-alone run ########
+# ################################
+if __name__ == "__main__":
+    unittest.main()